@@ -0,0 +1,165 @@
+import sys
+import time
+import statistics
+import logging
+from crawling.optimized_crawling_job import (
+    setup_optimized_driver,
+    get_product_info_optimized,
+    get_product_info_js,
+    check_element_optimized,
+    extract_review_page,
+    scrape_product_with_driver
+)
+from crawling.driver_pool import PooledDriver
+from crawling.multi_tab import MultiTabCrawler
+from crawling.data_access import insert_product_info_direct
+from crawling.product_writer import ProductWriter, PRODUCT_DB_CONFIG
+import psycopg2
+from psycopg2 import sql
+from selenium.webdriver.common.by import By
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 함수 실행 시간 측정 (초 단위 리스트 반환)
+def measure(func, *args, repeat: int = 5) -> list:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def report(name: str, timings: list) -> None:
+    logger.info(f"{name}: 평균 {statistics.mean(timings)*1000:.1f}ms, "
+                f"중앙값 {statistics.median(timings)*1000:.1f}ms, 반복 {len(timings)}회")
+
+def benchmark_product_info(product_urls: list, repeat: int = 5) -> None:
+    """상품 기본 정보 추출: 요소별 WebDriver 호출 vs 단일 execute_script"""
+    driver = setup_optimized_driver()
+    try:
+        for url in product_urls:
+            driver.get(url)
+
+            # 두 방식의 결과가 같은지 먼저 확인
+            if get_product_info_optimized(driver) != get_product_info_js(driver):
+                logger.warning(f"추출 결과 불일치: {url}")
+
+            logger.info(f"상품 정보 추출 벤치마크 - {url}")
+            report("get_product_info_optimized", measure(get_product_info_optimized, driver, repeat=repeat))
+            report("get_product_info_js", measure(get_product_info_js, driver, repeat=repeat))
+    finally:
+        driver.quit()
+
+# 기존 방식: article마다 find_element 3회 + .text/.get_attribute
+def extract_review_page_per_element(driver, review_id: str, product_code: str) -> list:
+    reviews = []
+    for article in driver.find_elements(By.CSS_SELECTOR, f"#{review_id} article"):
+        reviews.append({
+            'product_code': product_code,
+            'review_rating': article.find_element(By.CSS_SELECTOR, '[data-rating]').get_attribute("data-rating"),
+            'review_date': article.find_element(By.CSS_SELECTOR, 'div.sdp-review__article__list__info__product-info__reg-date').text,
+            'review_content': article.find_element(By.CSS_SELECTOR, 'div.sdp-review__article__list__review__content').text
+        })
+    return reviews
+
+def benchmark_review_page(product_urls: list, repeat: int = 5) -> None:
+    """리뷰 페이지 추출: article별 WebDriver 호출 vs 단일 execute_script"""
+    driver = setup_optimized_driver()
+    try:
+        for url in product_urls:
+            driver.get(url)
+            review_id = "sdpReview" if check_element_optimized("css", "#sdpReview article", driver) else "btfTab"
+
+            logger.info(f"리뷰 페이지 추출 벤치마크 - {url} ({review_id})")
+            report("extract_review_page_per_element", measure(extract_review_page_per_element, driver, review_id, "0", repeat=repeat))
+            report("extract_review_page", measure(extract_review_page, driver, review_id, "0", repeat=repeat))
+    finally:
+        driver.quit()
+
+def benchmark_memory_per_product(product_urls: list, tabs: int = 4) -> None:
+    """
+    동시 상품당 메모리: 브라우저 1개당 상품 1개 vs 브라우저 1개에 탭 N개
+    - 수집만 하고 저장하지 않음 (review_data, 크롤링 인덱스 워터마크, 상품 DB를 건드리지 않음)
+    """
+    job_id = "benchmark"
+
+    # 프로세스당 브라우저 1개 모델: 상품 하나를 로드한 브라우저의 메모리
+    driver = setup_optimized_driver()
+    try:
+        scrape_product_with_driver(driver, product_urls[0])
+        single_mb = PooledDriver(driver).memory_mb()
+    finally:
+        driver.quit()
+
+    # 멀티 탭 모델: 피크 메모리 / 동시 탭 수
+    driver = setup_optimized_driver()
+    try:
+        stats = MultiTabCrawler(driver, tabs, save=False).crawl(product_urls, job_id)
+    finally:
+        driver.quit()
+
+    logger.info(f"동시 상품당 메모리 - 브라우저당 1상품: {single_mb:.1f}MB, "
+                f"탭 {tabs}개: {stats['memory_per_product_mb']}MB")
+
+# 벤치마크 전용 스키마 (실제 product 테이블은 건드리지 않음)
+# - 두 방식 모두 여러 커넥션을 쓰므로 세션 한정인 TEMP 테이블 대신 별도 스키마에 같은 구조의 테이블을 만듦
+BENCHMARK_SCHEMA = "product_benchmark"
+BENCHMARK_TABLE = f"{BENCHMARK_SCHEMA}.product"
+
+def _execute_ddl(*statements) -> None:
+    conn = psycopg2.connect(**PRODUCT_DB_CONFIG)
+    try:
+        with conn.cursor() as cur:
+            for statement in statements:
+                cur.execute(statement)
+        conn.commit()
+    finally:
+        conn.close()
+
+def _reset_benchmark_table() -> None:
+    schema, table = sql.Identifier(BENCHMARK_SCHEMA), sql.Identifier(BENCHMARK_SCHEMA, "product")
+    _execute_ddl(
+        sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(schema),
+        sql.SQL("DROP TABLE IF EXISTS {}").format(table),
+        sql.SQL("CREATE TABLE {} (LIKE public.product INCLUDING ALL)").format(table),
+    )
+
+def _drop_benchmark_schema() -> None:
+    _execute_ddl(sql.SQL("DROP SCHEMA IF EXISTS {} CASCADE").format(sql.Identifier(BENCHMARK_SCHEMA)))
+
+def benchmark_product_insert(count: int = 1000) -> None:
+    """상품 정보 저장 (로컬 Postgres, 벤치마크 전용 테이블): 상품마다 커넥션+INSERT vs 풀 + execute_values 배치"""
+    products = [{"product_code": i, "name": f"benchmark {i}", "star_rating": 4.5,
+                 "review_count": i, "final_price": 10000, "tag": None, "image_url": None}
+                for i in range(count)]
+
+    try:
+        _reset_benchmark_table()
+        start = time.perf_counter()
+        for product in products:
+            insert_product_info_direct(product, table=BENCHMARK_TABLE)
+        direct_sec = time.perf_counter() - start
+
+        _reset_benchmark_table()
+        start = time.perf_counter()
+        writer = ProductWriter(table=BENCHMARK_TABLE)
+        for product in products:
+            writer.add(product)
+        writer.close()
+        batch_sec = time.perf_counter() - start
+    finally:
+        _drop_benchmark_schema()
+
+    logger.info(f"상품 정보 저장 {count}개 - 상품별 INSERT: {count / direct_sec:.0f}행/초, "
+                f"배치 INSERT: {count / batch_sec:.0f}행/초 ({direct_sec / batch_sec:.1f}배)")
+
+if __name__ == "__main__":
+    # 사용 예: python -m crawling.benchmark <상품 URL> [<상품 URL> ...]
+    #         python -m crawling.benchmark db [상품 수]
+    if sys.argv[1:2] == ["db"]:
+        benchmark_product_insert(*map(int, sys.argv[2:3]))
+    else:
+        benchmark_product_info(sys.argv[1:])
+        benchmark_review_page(sys.argv[1:])
+        benchmark_memory_per_product(sys.argv[1:])
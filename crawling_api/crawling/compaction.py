@@ -0,0 +1,135 @@
+import os
+import sys
+import glob
+import json
+import shutil
+import logging
+from datetime import datetime, timedelta
+import pandas as pd
+import pyarrow.parquet as pq
+from crawling.review_schema import normalize_review_frame, to_review_table, PARQUET_WRITE_OPTIONS
+
+logger = logging.getLogger(__name__)
+
+# 컴팩션 기본 설정 (환경 변수로 조정 가능)
+COMPACTED_DIR = os.environ.get("COMPACTED_DIR", "review_data_compacted")
+COMPACT_TARGET_ROWS = int(os.environ.get("COMPACT_TARGET_ROWS", 1000000))
+COMPACT_ROW_GROUP_ROWS = int(os.environ.get("COMPACT_ROW_GROUP_ROWS", 100000))
+
+SORT_COLUMNS = ['product_code', 'review_date']
+MANIFEST_FILE = "_manifest.json"
+
+
+# 시작~종료 날짜(포함)를 "YYYY-MM-DD" 리스트로 변환
+def date_range(start_date: str, end_date: str) -> list:
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    return [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range((end - start).days + 1)]
+
+# 날짜 파티션의 모든 작업 디렉터리 parquet 파일
+def list_partition_files(date: str, base_dir: str = "review_data") -> list:
+    return sorted(glob.glob(os.path.join(base_dir, date, "*", "*.parquet")))
+
+def _column_stats(df: pd.DataFrame) -> dict:
+    # 날짜를 해석하지 못한 리뷰(null)는 min/max 계산에서 제외 (값이 모두 null이면 None)
+    stats = {}
+    for col in SORT_COLUMNS:
+        values = df[col].dropna()
+        stats[col] = {"min": str(values.min()), "max": str(values.max())} if len(values) else None
+    return stats
+
+# 작업 디렉터리를 지워도 되는지 여부
+# - 리뷰 기록기가 종료 시 _manifest.json을 쓰므로, manifest가 없으면 아직 쓰는 중인 작업으로 보고 유지
+def _is_closed_job_dir(job_dir: str) -> bool:
+    return os.path.exists(os.path.join(job_dir, MANIFEST_FILE))
+
+def _remove_closed_job_dirs(date: str, files: list) -> list:
+    # 오늘 파티션은 새 작업이 계속 추가되므로 지우지 않음
+    if date == datetime.now().strftime("%Y-%m-%d"):
+        logger.info(f"{date} 파티션은 오늘 날짜이므로 원본을 유지합니다.")
+        return []
+
+    removed = []
+    for job_dir in sorted({os.path.dirname(f) for f in files}):
+        if not _is_closed_job_dir(job_dir):
+            logger.info(f"{job_dir}: {MANIFEST_FILE}가 없어 원본을 유지합니다.")
+            continue
+        shutil.rmtree(job_dir, ignore_errors=True)
+        removed.append(job_dir)
+    return removed
+
+def compact_partition(date: str, base_dir: str = "review_data", output_dir: str = COMPACTED_DIR,
+                      target_rows: int = COMPACT_TARGET_ROWS, row_group_rows: int = COMPACT_ROW_GROUP_ROWS,
+                      remove_source: bool = False) -> dict:
+    """
+    날짜 파티션 하나를 컴팩션
+    - 작업별 작은 파일들을 합쳐 중복 리뷰 제거 후 product_code, review_date 순으로 정렬
+    - target_rows 크기의 파일로 나눠 {output_dir}/{date}/에 저장하고 파일별 min/max를 담은 manifest 작성
+    - remove_source: 종료된(_manifest.json이 있는) 작업 디렉터리만 삭제, 오늘 파티션은 삭제하지 않음
+    - 반환: manifest (대상 파일이 없으면 None)
+    """
+    files = list_partition_files(date, base_dir)
+    if not files:
+        return None
+
+    df = pd.concat([pd.read_parquet(f) for f in files], ignore_index=True)
+    input_rows = len(df)
+    # 이전 문자열 스키마 파일도 섞여 있으므로 정렬 전에 리뷰 스키마로 통일
+    df = normalize_review_frame(df)
+    df = df.drop_duplicates().sort_values(SORT_COLUMNS, kind='mergesort').reset_index(drop=True)
+
+    # 임시 디렉터리에 쓰고 완료되면 교체 (중간에 실패해도 기존 결과 유지)
+    out_dir = os.path.join(output_dir, date)
+    tmp_dir = out_dir + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    entries = []
+    for i, start in enumerate(range(0, len(df), target_rows)):
+        chunk = df.iloc[start:start + target_rows]
+        file_name = f"part-{i:05d}.parquet"
+        pq.write_table(to_review_table(chunk), os.path.join(tmp_dir, file_name),
+                       row_group_size=row_group_rows, **PARQUET_WRITE_OPTIONS)
+        entries.append({"path": file_name, "rows": len(chunk), "stats": _column_stats(chunk)})
+
+    manifest = {
+        "date": date,
+        "input_files": len(files),
+        "input_rows": input_rows,
+        "output_rows": len(df),
+        "duplicates_removed": input_rows - len(df),
+        "stats": _column_stats(df) if len(df) else None,
+        "files": entries,
+    }
+    with open(os.path.join(tmp_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.replace(tmp_dir, out_dir)
+
+    if remove_source:
+        manifest["removed_job_dirs"] = _remove_closed_job_dirs(date, files)
+
+    logger.info(f"{date} 컴팩션 완료 - 입력 {len(files)}개 파일/{input_rows}행 → "
+                f"출력 {len(entries)}개 파일/{len(df)}행 (중복 {manifest['duplicates_removed']}행 제거)")
+    return manifest
+
+def compact_review_data(start_date: str, end_date: str = None, base_dir: str = "review_data",
+                        output_dir: str = COMPACTED_DIR, target_rows: int = COMPACT_TARGET_ROWS,
+                        remove_source: bool = False) -> list:
+    """날짜 범위의 review_data를 파티션(날짜)별로 컴팩션"""
+    manifests = []
+    for date in date_range(start_date, end_date or start_date):
+        try:
+            manifest = compact_partition(date, base_dir, output_dir, target_rows, remove_source=remove_source)
+            if manifest:
+                manifests.append(manifest)
+        except Exception as e:
+            logger.error(f"{date} 컴팩션 실패: {e}")
+    return manifests
+
+
+if __name__ == "__main__":
+    # 사용 예: python -m crawling.compaction 2025-06-01 [2025-06-19]
+    logging.basicConfig(level=logging.INFO)
+    compact_review_data(*sys.argv[1:3])
@@ -7,9 +7,13 @@ import pandas as pd
 import psycopg2
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from fake_useragent import UserAgent
-from crawling.data_access import insert_product_info_to_db, save_reviews_to_local
+from crawling.data_access import save_reviews_to_local
+from crawling.politeness import get_scheduler
+from crawling.freshness_index import FreshnessIndex
 
 # 크롬 드라이버 셋팅
 def setup_driver() -> uc.Chrome:
@@ -64,6 +68,19 @@ def replace_thumbnail_size(url: str) -> str:
     
     return re.sub(r'/remote/[^/]+/image', '/remote/292x292ex/image', url)
 
+# 스케줄러 슬롯을 받아 페이지 이동 후 핵심 요소가 나타날 때까지 대기 (결과를 스케줄러에 반영)
+def wait_for_page(driver: uc.Chrome, url: str, css: str, timeout: int = 15) -> bool:
+    scheduler = get_scheduler()
+    scheduler.wait()
+    driver.get(url)
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, css)))
+        scheduler.report(True)
+        return True
+    except TimeoutException:
+        scheduler.report(False)
+        return False
+
 # 리뷰 페이지 버튼 동작 컨트롤
 def go_next_page(driver: uc.Chrome , page_num: int, review_id: str) -> bool:
     try:
@@ -72,15 +89,15 @@ def go_next_page(driver: uc.Chrome , page_num: int, review_id: str) -> bool:
         else:
             page_buttons = driver.find_element(By.XPATH, f'//*[@id="btfTab"]/ul[2]/li[2]/div/div[6]/section[4]/div[3]/button[{page_num}]')
         
-        # 처음 페이지 버튼을 누를 시 화면에 노출되야 클릭됨
+        # 처음 페이지 버튼을 누를 시 화면에 노출되야 클릭됨 (즉시 스크롤이므로 대기 불필요)
         if page_num <= 3:
-            driver.execute_script("arguments[0].scrollIntoView(true);", page_buttons)
-            time.sleep(0.5)
-            driver.execute_script("window.scrollBy(0, -150);")  # 살짝 위로 올려줌
-            time.sleep(0.5)
+            driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", page_buttons)
 
-        page_buttons.click()                               
-        time.sleep(random.uniform(0.5,1.5))
+        # 고정 대기 대신 호스트 단위 스케줄러로 요청 간격 조절
+        first_article = driver.find_element(By.CSS_SELECTOR, f"#{review_id} article")
+        get_scheduler().wait()
+        page_buttons.click()
+        WebDriverWait(driver, 5).until(EC.staleness_of(first_article))
         #print(f"[INFO] {product_code} 리뷰 {page_num-1} 페이지 이동")
         return True
     
@@ -232,8 +249,7 @@ def coupang_crawling(args) -> None:
     try:
         product_url, job_id = args
         driver = setup_driver()
-        driver.get(product_url)
-        time.sleep(random.uniform(2, 3))
+        wait_for_page(driver, product_url, 'h1.product-title')
 
         # 상품 기본 정보 추출
         product_dict = get_product_info(driver)
@@ -260,15 +276,15 @@ def coupang_crawling(args) -> None:
         return
 
 # 쿠팡 검색 후 상품 url 추출 
-def get_product_links(keyword: str, max_links: int) -> list:
+def get_product_links(keyword: str, max_links: int, skip_fresh: bool = True) -> list:
 
     driver = setup_driver()
     search_url = f"https://www.coupang.com/np/search?component=&q={keyword}"
-    driver.get(search_url)
-    time.sleep(random.uniform(2, 3))
+    wait_for_page(driver, search_url, '#product-list li')
 
     links = []
     duplicate_chk = set()
+    freshness = FreshnessIndex() if skip_fresh else None
     try:
         items = driver.find_elements(By.CSS_SELECTOR, '#product-list li')
     except NoSuchElementException as e:
@@ -320,6 +336,11 @@ def get_product_links(keyword: str, max_links: int) -> list:
             
             # 특정 개수 이상의 리뷰가 있는 상품만 가져오기
             if review_count >= 200:
+                # 최근에 수집했고 리뷰 수 변화가 적은 상품은 건너뜀
+                if freshness and freshness.is_fresh(product_code, review_count):
+                    continue
+                if freshness:
+                    freshness.mark_seen(product_code, review_count)
                 links.append(href)
             
             if len(links) >= max_links:
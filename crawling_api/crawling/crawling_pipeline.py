@@ -2,6 +2,7 @@ from crawling.crawling_job import coupang_crawling, get_product_links
 from multiprocessing import Pool, cpu_count, freeze_support
 from crawling.data_access import upload_parquet_to_gcs
 from crawling.request_to_transform_api import notify_spark_server
+from crawling.politeness import init_scheduler
 from datetime import datetime, timedelta
 import time
 
@@ -9,26 +10,28 @@ def generate_job_id():
     now = datetime.now()
     return "job_" + now.strftime("%Y%m%d_%H%M%S")
 
-def run_multi_process(url_list: list, job_id: str) -> None:
+def run_multi_process(url_list: list, job_id: str, scheduler=None) -> None:
     # CPU 절반 사용
     #print("[INFO] multi processor 수: ",cpu_count()//2)
 
     job_ids = [job_id for _ in url_list]
     # with Pool(processes=cpu_count()//2) as pool:
-    with Pool(6) as pool:
+    # 모든 워커가 같은 요청 간격 스케줄러를 공유
+    with Pool(6, initializer=init_scheduler, initargs=(scheduler,)) as pool:
         pool.map(coupang_crawling, zip(url_list, job_ids))
 
 # 전체 파이프라인
-def crawling_run(keyword: str, max_link: int, is_crawling_running: bool ) -> None:
+def crawling_run(keyword: str, max_link: int, is_crawling_running: bool, scheduler=None) -> None:
     try:
         freeze_support()
+        init_scheduler(scheduler)
         start = time.time()
         job_id = generate_job_id()
         print(f"[INFO] 생성된 작업 ID: {job_id}")
 
         # 크롤링 멀티프로세싱
         product_link_list = get_product_links(keyword, max_link)
-        run_multi_process(product_link_list, job_id)
+        run_multi_process(product_link_list, job_id, scheduler)
         
         # gcs 파일 저장
         # try:
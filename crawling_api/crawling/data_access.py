@@ -5,21 +5,34 @@ from datetime import datetime
 import pandas as pd
 import os
 import csv
+from crawling.review_watermark import record_collected
+from crawling.review_writer import send_reviews
+from crawling.review_schema import to_review_table, PARQUET_WRITE_OPTIONS
+from crawling.gcs_upload import GCSUploader
+from crawling.product_writer import PRODUCT_DB_CONFIG, get_product_writer, product_insert_sql, product_row
+import pyarrow.parquet as pq
 
 
 # Local에 parquet형식 리뷰 저장 
-def save_reviews_to_local(reviews: list, product_code: str, job_id: str) -> None:
+# - 작업 단위 리뷰 기록기가 실행 중이면 큐로 넘기고 None 반환 (파일/인덱스 기록은 기록기가 담당)
+def save_reviews_to_local(reviews: list, product_code: str, job_id: str) -> str:
+    if send_reviews(product_code, reviews):
+        return None
+    
     today = datetime.today().strftime("%Y-%m-%d")
     dir_name = f'review_data/{today}/{job_id}/'
     
-    if not os.path.exists(dir_name):
-            os.makedirs(dir_name)
+    # 여러 워커가 동시에 저장해도 안전하도록 exist_ok 사용
+    os.makedirs(dir_name, exist_ok=True)
     
-    df = pd.DataFrame(reviews)
+    # 타입이 지정된 스키마로 변환해서 저장 (product_code int64, 평점 int8, 날짜 date32)
     file_path = f"{dir_name}/coupang_review_{product_code}.parquet"
-    df.to_parquet(file_path, engine="pyarrow", index=False)
+    pq.write_table(to_review_table(reviews), file_path, **PARQUET_WRITE_OPTIONS)
     #print(f"[INFO] {product_code} 리뷰가 parquet 파일로 저장되었습니다")
 
+    record_collected({product_code: reviews}, file_path)
+    return file_path
+
 
 os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "crawling_api/key/kosa-semi-e79fa479a065.json"
 
@@ -30,56 +43,39 @@ os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "crawling_api/key/kosa-semi-e79fa
     - source_file_path: 로컬 파일 경로
     - destination_blob_name: GCS 버킷 내 저장 경로
 """
-def upload_parquet_to_gcs(job_id: str): 
+def upload_parquet_to_gcs(job_id: str, uploader: GCSUploader = None): 
     today = datetime.today().strftime("%Y-%m-%d")
     dir = f'review_data/{today}/{job_id}/'
-    bucket_name = 'kosa-semi-datalake'
-    storage_client = storage.Client()
-    bucket = storage_client.bucket(bucket_name)
-    
-
-    # GCS에 업로드
-    for file in os.listdir(dir):
-        if file.endswith(".parquet"):
-            local_file_path = os.path.join(dir, file)
-            gcs_path = f"{dir}{file}"
 
-            blob = bucket.blob(gcs_path)
-            blob.upload_from_filename(local_file_path)
-            print(f"[INFO] GCS 업로드 완료: gs://{bucket_name}/{gcs_path}")
+    # GCS에 병렬 업로드 (이미 같은 내용으로 올라간 파일은 건너뛰므로 실패 시 다시 호출하면 이어서 업로드)
+    uploader = uploader or GCSUploader()
+    stats = uploader.upload_dir(dir)
+    print(f"[INFO] GCS 업로드 결과: {stats}")
+    if stats["failed"]:
+        raise RuntimeError(f"GCS 업로드 실패 파일 {stats['failed']}개 - 다시 실행하면 남은 파일만 업로드합니다.")
     
     return dir
 
 
 # db 저장
+# - 프로세스별 기록기에 모아 두었다가 배치로 INSERT (크기/시간 기준 자동 저장, 작업 끝에 flush_product_writer)
+# - DB에 연결할 수 없어도 크롤링은 계속 진행
 def insert_product_info_to_db(product: dict):
-    
-    conn = psycopg2.connect(
-        host="127.0.0.1",
-        dbname="postgres",
-        user="postgres",
-        password="todn12",
-        port=2345
-    )
+    try:
+        get_product_writer().add(product)
+    except psycopg2.Error as e:
+        print(f"[ERROR] 상품 정보 DB 저장 실패: {product.get('product_code')}, {e}")
+
 
-    with conn.cursor() as cur:
-        cur.execute("""
-            INSERT INTO product 
-                (id, name, rating, review_count, price, tag, image_url)
-            VALUES 
-                (%s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (id) DO NOTHING;
-        """, (
-            product.get("product_code"),
-            product.get("name"),
-            product.get("star_rating"),
-            product.get("review_count"),
-            product.get("final_price"),
-            product.get("tag"),
-            product.get("image_url"),
-        ))
-        conn.commit()
-        print(f"[INFO] 상품 정보 DB 저장 완료: {product.get('product_code')}")
+# 상품 하나마다 커넥션을 열어 바로 INSERT (벤치마크 비교용 기존 방식)
+def insert_product_info_direct(product: dict, table: str = "product"):
+    conn = psycopg2.connect(**PRODUCT_DB_CONFIG)
+    try:
+        with conn.cursor() as cur:
+            cur.execute(product_insert_sql(table, values="(%s, %s, %s, %s, %s, %s, %s)"), product_row(product))
+            conn.commit()
+    finally:
+        conn.close()
 
 
 # 상품 기본 정보 csv 로컬 저장
@@ -0,0 +1,222 @@
+import os
+import time
+import threading
+import logging
+from queue import Queue, Empty
+from contextlib import contextmanager
+import psutil
+import undetected_chromedriver as uc
+from crawling.optimized_crawling_job import setup_optimized_driver
+
+logger = logging.getLogger(__name__)
+
+# 드라이버 풀 기본 설정 (환경 변수로 조정 가능)
+DRIVER_POOL_SIZE = int(os.environ.get("DRIVER_POOL_SIZE", 4))
+DRIVER_MAX_PAGES = int(os.environ.get("DRIVER_MAX_PAGES", 50))
+DRIVER_MAX_MEMORY_MB = int(os.environ.get("DRIVER_MAX_MEMORY_MB", 1024))
+# 브라우저 실행 실패 시 슬롯당 재시도 횟수
+DRIVER_LAUNCH_RETRIES = int(os.environ.get("DRIVER_LAUNCH_RETRIES", 2))
+# 드라이버 임대 대기 시간 (초) - 무한 대기로 작업이 멈추지 않도록 제한
+DRIVER_ACQUIRE_TIMEOUT = float(os.environ.get("DRIVER_ACQUIRE_TIMEOUT", 120))
+
+
+class PooledDriver:
+    """풀에서 관리되는 드라이버와 사용 이력"""
+
+    def __init__(self, driver: uc.Chrome):
+        self.driver = driver
+        self.page_count = 0
+        self.created_at = time.time()
+
+    def memory_mb(self) -> float:
+        """브라우저 프로세스 트리의 RSS 메모리 합계 (MB)"""
+        try:
+            proc = psutil.Process(self.driver.browser_pid)
+            procs = [proc] + proc.children(recursive=True)
+            total = 0
+            for p in procs:
+                try:
+                    total += p.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            return total / (1024 * 1024)
+        except Exception:
+            return 0.0
+
+    def is_healthy(self) -> bool:
+        """chromedriver 세션이 살아있는지 확인"""
+        try:
+            return self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def quit(self) -> None:
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+
+class DriverPool:
+    """미리 실행해 둔 크롬 드라이버를 여러 상품에 재사용하는 풀"""
+
+    def __init__(self, size: int = DRIVER_POOL_SIZE, max_pages: int = DRIVER_MAX_PAGES,
+                 max_memory_mb: int = DRIVER_MAX_MEMORY_MB, driver_factory=setup_optimized_driver,
+                 launch_retries: int = DRIVER_LAUNCH_RETRIES, acquire_timeout: float = DRIVER_ACQUIRE_TIMEOUT):
+        self.size = size
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.driver_factory = driver_factory
+        self.launch_retries = launch_retries
+        self.acquire_timeout = acquire_timeout
+        self._idle = Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        # 실행에 실패해 비어 있는 슬롯 수 (임대 시 다시 채움)
+        self._missing = 0
+        self._started = threading.Event()
+        self.start_error = None
+        self.stats = {"launched": 0, "recycled": 0, "leases": 0}
+
+    def _launch(self) -> PooledDriver:
+        driver = self.driver_factory()
+        driver.set_page_load_timeout(30)
+        driver.implicitly_wait(5)
+        with self._lock:
+            self.stats["launched"] += 1
+        return PooledDriver(driver)
+
+    def _launch_with_retry(self) -> PooledDriver:
+        for attempt in range(self.launch_retries + 1):
+            try:
+                return self._launch()
+            except Exception as e:
+                logger.error(f"드라이버 실행 실패 ({attempt + 1}/{self.launch_retries + 1}): {e}")
+                if attempt == self.launch_retries:
+                    raise
+                time.sleep(1)
+
+    def start(self) -> None:
+        """풀 크기만큼 브라우저를 미리 실행 (하나도 실행되지 않으면 RuntimeError)"""
+        logger.info(f"드라이버 풀 시작 - 크기: {self.size}")
+        try:
+            launched = 0
+            for _ in range(self.size):
+                try:
+                    self._idle.put(self._launch_with_retry())
+                    launched += 1
+                except Exception:
+                    with self._lock:
+                        self._missing += 1
+            if launched == 0:
+                self.start_error = RuntimeError("드라이버를 하나도 실행하지 못했습니다.")
+                raise self.start_error
+            if launched < self.size:
+                logger.warning(f"드라이버 {launched}/{self.size}개만 실행됨 - 빈 슬롯은 임대 시 다시 실행")
+        finally:
+            self._started.set()
+
+    def start_background(self) -> threading.Thread:
+        """앱 시작을 막지 않도록 별도 스레드에서 start 실행 (실패 시 start_error에 기록)"""
+        def run():
+            try:
+                self.start()
+            except Exception as e:
+                self.start_error = e
+        thread = threading.Thread(target=run, name="driver-pool-start", daemon=True)
+        thread.start()
+        return thread
+
+    def ensure_ready(self) -> None:
+        """작업을 받을 수 있는 상태인지 확인 (시작 중/시작 실패/종료 시 RuntimeError)"""
+        if self._closed:
+            raise RuntimeError("드라이버 풀이 이미 종료되었습니다.")
+        if not self._started.is_set():
+            raise RuntimeError("드라이버 풀을 시작하는 중입니다. 잠시 후 다시 요청하세요.")
+        if self.start_error is not None:
+            raise RuntimeError(f"드라이버 풀 시작 실패: {self.start_error}")
+
+    def _refill(self) -> PooledDriver:
+        """비어 있는 슬롯이 있으면 새 브라우저를 실행해 바로 임대 (없으면 None)"""
+        with self._lock:
+            if self._missing == 0:
+                return None
+            self._missing -= 1
+        try:
+            return self._launch()
+        except Exception as e:
+            with self._lock:
+                self._missing += 1
+            logger.error(f"빈 슬롯 드라이버 실행 실패: {e}")
+            return None
+
+    def _needs_recycle(self, pooled: PooledDriver) -> bool:
+        if pooled.page_count >= self.max_pages:
+            return True
+        if pooled.memory_mb() >= self.max_memory_mb:
+            return True
+        return not pooled.is_healthy()
+
+    def _recycle(self, pooled: PooledDriver) -> PooledDriver:
+        pooled.quit()
+        with self._lock:
+            self.stats["recycled"] += 1
+        return self._launch()
+
+    def acquire(self, timeout: float = None) -> PooledDriver:
+        """드라이버 임대 (timeout 기본값은 acquire_timeout, 시간 내 못 받으면 TimeoutError)"""
+        if self._closed:
+            raise RuntimeError("드라이버 풀이 이미 종료되었습니다.")
+        if timeout is None:
+            timeout = self.acquire_timeout
+        try:
+            pooled = self._idle.get_nowait()
+        except Empty:
+            pooled = self._refill()
+        if pooled is None:
+            try:
+                pooled = self._idle.get(timeout=timeout)
+            except Empty:
+                raise TimeoutError(f"{timeout}초 동안 사용 가능한 드라이버가 없습니다.")
+
+        # 임대 전 상태 확인 후 필요 시 교체
+        if self._needs_recycle(pooled):
+            try:
+                pooled = self._recycle(pooled)
+            except Exception:
+                # 교체 실패 시 슬롯을 비워 두고 다음 임대 때 다시 실행
+                with self._lock:
+                    self._missing += 1
+                raise
+        with self._lock:
+            self.stats["leases"] += 1
+        return pooled
+
+    def release(self, pooled: PooledDriver) -> None:
+        if self._closed:
+            pooled.quit()
+            return
+        try:
+            # 다음 상품이 이전 상품의 상태를 물려받지 않도록 정리
+            pooled.driver.delete_all_cookies()
+            pooled.driver.get("about:blank")
+        except Exception:
+            pass
+        self._idle.put(pooled)
+
+    @contextmanager
+    def lease(self, timeout: float = None):
+        pooled = self.acquire(timeout)
+        try:
+            yield pooled
+        finally:
+            self.release(pooled)
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().quit()
+            except Empty:
+                break
+        logger.info(f"드라이버 풀 종료 - {self.stats}")
@@ -0,0 +1,70 @@
+import os
+import time
+import sqlite3
+
+# 크롤링 신선도 인덱스 기본 설정 (환경 변수로 조정 가능)
+CRAWL_INDEX_PATH = os.environ.get("CRAWL_INDEX_PATH", "crawl_index.db")
+FRESHNESS_TTL_HOURS = float(os.environ.get("FRESHNESS_TTL_HOURS", 24))
+FRESHNESS_MIN_REVIEW_DELTA = int(os.environ.get("FRESHNESS_MIN_REVIEW_DELTA", 20))
+
+
+class FreshnessIndex:
+    """
+    product_code별 마지막 크롤링 정보를 저장하는 로컬 SQLite 인덱스
+    - 검색 단계에서 본 리뷰 수를 기록(mark_seen)하고, 저장이 끝나면 크롤링 완료로 확정(record_crawl)
+    - TTL 이내이고 리뷰 수 변화가 기준 미만이면 신선한 상품으로 보고 다시 크롤링하지 않음
+    """
+
+    def __init__(self, path: str = CRAWL_INDEX_PATH, ttl_hours: float = FRESHNESS_TTL_HOURS,
+                 min_review_delta: int = FRESHNESS_MIN_REVIEW_DELTA):
+        self.path = path
+        self.ttl_sec = ttl_hours * 3600
+        self.min_review_delta = min_review_delta
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_index (
+                    product_code TEXT PRIMARY KEY,
+                    crawled_at REAL,
+                    review_count INTEGER,
+                    seen_review_count INTEGER,
+                    output_path TEXT
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        # 여러 워커 프로세스가 동시에 쓰므로 호출마다 연결하고 잠금은 대기
+        return sqlite3.connect(self.path, timeout=30)
+
+    def is_fresh(self, product_code: str, review_count: int) -> bool:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT crawled_at, review_count FROM crawl_index WHERE product_code = ?",
+                (str(product_code),)
+            ).fetchone()
+        if row is None or row[0] is None:
+            return False
+        crawled_at, last_review_count = row
+        if time.time() - crawled_at > self.ttl_sec or last_review_count is None:
+            return False
+        return review_count - (last_review_count or 0) < self.min_review_delta
+
+    def mark_seen(self, product_code: str, review_count: int) -> None:
+        """검색 결과에서 본 리뷰 수 기록"""
+        with self._connect() as conn:
+            conn.execute("""
+                INSERT INTO crawl_index (product_code, seen_review_count) VALUES (?, ?)
+                ON CONFLICT(product_code) DO UPDATE SET seen_review_count = excluded.seen_review_count
+            """, (str(product_code), review_count))
+
+    def record_crawl(self, product_code: str, output_path: str) -> None:
+        """크롤링 결과 저장 완료 기록 (검색 단계 리뷰 수를 기준 값으로 확정)"""
+        with self._connect() as conn:
+            conn.execute("""
+                INSERT INTO crawl_index (product_code, crawled_at, review_count, output_path)
+                VALUES (?, ?, NULL, ?)
+                ON CONFLICT(product_code) DO UPDATE SET
+                    crawled_at = excluded.crawled_at,
+                    review_count = COALESCE(crawl_index.seen_review_count, crawl_index.review_count),
+                    output_path = excluded.output_path
+            """, (str(product_code), time.time(), output_path))
@@ -0,0 +1,167 @@
+import os
+import queue
+import base64
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from google.cloud import storage
+
+# 병렬 청크 업로드는 transfer_manager가 있는 버전에서만 사용
+try:
+    from google.cloud.storage import transfer_manager
+except ImportError:
+    transfer_manager = None
+
+logger = logging.getLogger(__name__)
+
+# GCS 업로드 기본 설정 (환경 변수로 조정 가능)
+# - 로컬 에뮬레이터로 테스트할 때는 STORAGE_EMULATOR_HOST를 지정하면 storage.Client가 에뮬레이터로 연결됨
+GCS_BUCKET = os.environ.get("GCS_BUCKET", "kosa-semi-datalake")
+GCS_UPLOAD_WORKERS = int(os.environ.get("GCS_UPLOAD_WORKERS", 8))
+GCS_CHUNKED_THRESHOLD_MB = int(os.environ.get("GCS_CHUNKED_THRESHOLD_MB", 32))
+GCS_CHUNK_SIZE_MB = int(os.environ.get("GCS_CHUNK_SIZE_MB", 8))
+GCS_MAX_PENDING_UPLOADS = int(os.environ.get("GCS_MAX_PENDING_UPLOADS", 16))
+
+UPLOAD_SUFFIXES = (".parquet", ".json")
+
+
+# GCS 객체의 md5_hash와 같은 형식(base64)의 로컬 파일 MD5
+def local_md5(file_path: str) -> str:
+    md5 = hashlib.md5()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(8 * 1024 * 1024), b''):
+            md5.update(chunk)
+    return base64.b64encode(md5.digest()).decode('ascii')
+
+
+class GCSUploader:
+    """
+    공유 클라이언트와 제한된 스레드 풀로 파일을 GCS에 병렬 업로드
+    - 크기와 MD5가 같은 객체가 이미 있으면 건너뜀 (실패한 작업을 다시 실행하면 남은 파일만 업로드)
+    - 큰 파일은 청크 단위로 업로드 (transfer_manager가 있으면 청크 병렬 업로드)
+    - 청크 병렬 업로드 객체는 md5_hash가 없으므로 메타데이터에 MD5를 기록해 비교
+    """
+
+    def __init__(self, bucket_name: str = GCS_BUCKET, max_workers: int = GCS_UPLOAD_WORKERS,
+                 client: storage.Client = None, chunked_threshold_mb: int = GCS_CHUNKED_THRESHOLD_MB,
+                 chunk_size_mb: int = GCS_CHUNK_SIZE_MB):
+        self.client = client or storage.Client()
+        self.bucket_name = bucket_name
+        self.bucket = self.client.bucket(bucket_name)
+        self.max_workers = max_workers
+        self.chunked_threshold = chunked_threshold_mb * 1024 * 1024
+        # resumable 업로드 청크 크기는 256KB의 배수여야 함
+        self.chunk_size = max(1, chunk_size_mb * 4) * 256 * 1024
+
+    def is_uploaded(self, local_path: str, gcs_path: str, md5: str) -> bool:
+        blob = self.bucket.get_blob(gcs_path)
+        if blob is None or blob.size != os.path.getsize(local_path):
+            return False
+        return (blob.md5_hash or (blob.metadata or {}).get('md5')) == md5
+
+    def upload_file(self, local_path: str, gcs_path: str) -> str:
+        """파일 하나 업로드 - 반환: "uploaded" / "skipped" """
+        md5 = local_md5(local_path)
+        if self.is_uploaded(local_path, gcs_path, md5):
+            return "skipped"
+
+        blob = self.bucket.blob(gcs_path)
+        blob.metadata = {'md5': md5}
+        if os.path.getsize(local_path) < self.chunked_threshold:
+            blob.upload_from_filename(local_path)
+        elif transfer_manager is not None:
+            transfer_manager.upload_chunks_concurrently(local_path, blob, chunk_size=self.chunk_size,
+                                                        max_workers=self.max_workers)
+            blob.metadata = {'md5': md5}
+            blob.patch()
+        else:
+            # chunk_size를 지정하면 resumable 업로드로 전송되어 청크 단위로 재시도됨
+            blob.chunk_size = self.chunk_size
+            blob.upload_from_filename(local_path)
+        return "uploaded"
+
+    def upload_files(self, files: list) -> dict:
+        """(로컬 경로, GCS 경로) 리스트를 병렬 업로드하고 결과별 건수 반환"""
+        stats = {"uploaded": 0, "skipped": 0, "failed": 0}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.upload_file, local_path, gcs_path): gcs_path
+                       for local_path, gcs_path in files}
+            for future in as_completed(futures):
+                gcs_path = futures[future]
+                try:
+                    result = future.result()
+                    stats[result] += 1
+                    if result == "uploaded":
+                        print(f"[INFO] GCS 업로드 완료: gs://{self.bucket_name}/{gcs_path}")
+                except Exception as e:
+                    stats["failed"] += 1
+                    logger.error(f"GCS 업로드 실패: {gcs_path}, {e}")
+        return stats
+
+    def upload_dir(self, local_dir: str, prefix: str = None, suffixes: tuple = UPLOAD_SUFFIXES) -> dict:
+        """디렉터리의 파일을 같은 경로(또는 prefix 아래)로 업로드"""
+        prefix = local_dir if prefix is None else prefix
+        files = [(os.path.join(local_dir, file), f"{prefix.rstrip('/')}/{file}")
+                 for file in sorted(os.listdir(local_dir)) if file.endswith(suffixes)]
+        return self.upload_files(files)
+
+
+class WriteBehindUploader:
+    """
+    작업이 진행되는 동안 완성된 파일을 백그라운드 스레드에서 바로 업로드
+    - submit: 대기 중인 업로드가 max_pending개를 넘으면 자리가 날 때까지 막힘 (백프레셔)
+    - flush: 제출한 파일이 모두 업로드될 때까지 대기 (작업 종료 시 배리어)
+    """
+
+    def __init__(self, uploader: GCSUploader = None, max_pending: int = GCS_MAX_PENDING_UPLOADS,
+                 workers: int = GCS_UPLOAD_WORKERS):
+        self.uploader = uploader or GCSUploader(max_workers=workers)
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.stats = {"uploaded": 0, "skipped": 0, "failed": 0}
+        self._lock = threading.Lock()
+        self._threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(workers)]
+
+    def start(self) -> "WriteBehindUploader":
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    @property
+    def pending(self) -> int:
+        return self.queue.unfinished_tasks
+
+    def submit(self, local_path: str, gcs_path: str = None) -> None:
+        self.queue.put((local_path, gcs_path or local_path.replace(os.sep, '/')))
+
+    def _worker(self) -> None:
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                local_path, gcs_path = item
+                try:
+                    result = self.uploader.upload_file(local_path, gcs_path)
+                    if result == "uploaded":
+                        print(f"[INFO] GCS 업로드 완료: gs://{self.uploader.bucket_name}/{gcs_path}")
+                except Exception as e:
+                    result = "failed"
+                    logger.error(f"GCS 업로드 실패: {gcs_path}, {e}")
+                with self._lock:
+                    self.stats[result] += 1
+            finally:
+                self.queue.task_done()
+
+    def flush(self) -> dict:
+        self.queue.join()
+        with self._lock:
+            return dict(self.stats)
+
+    def close(self) -> dict:
+        stats = self.flush()
+        for _ in self._threads:
+            self.queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        return stats
@@ -0,0 +1,170 @@
+import os
+from urllib.parse import urljoin
+import httpx
+from bs4 import BeautifulSoup
+from fake_useragent import UserAgent
+from crawling.data_access import insert_product_info_to_db, save_reviews_to_local
+from crawling.politeness import get_scheduler
+from crawling.review_network import REVIEW_FRAGMENT_PATH, REVIEW_SORT_BY_DATE
+from crawling.review_watermark import ReviewWatermark
+from crawling.review_requirement import ReviewBudget, ReviewCollector
+from crawling.optimized_crawling_job import (
+    coupang_crawling_pooled,
+    get_product_code,
+    get_star_rating,
+    get_num_in_str,
+    replace_thumbnail_size
+)
+
+# HTTP/2는 h2 패키지가 있을 때만 사용
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# lxml이 있으면 더 빠른 파서 사용
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# 쿠팡 주소 (로컬 fixture 서버로 테스트할 때 환경 변수로 변경)
+COUPANG_BASE_URL = os.environ.get("COUPANG_BASE_URL", "https://www.coupang.com")
+REVIEW_PAGE_SIZE = 5
+
+
+class FastPathMiss(Exception):
+    """HTTP 경로로 처리할 수 없어 브라우저로 넘겨야 하는 경우"""
+
+
+# keep-alive 커넥션 풀을 가진 HTTP 클라이언트 (스레드 간 공유 가능)
+def create_http_client(max_connections: int = 10) -> httpx.Client:
+    headers = {
+        "User-Agent": UserAgent().random,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8",
+    }
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    return httpx.Client(http2=HTTP2_AVAILABLE, headers=headers, limits=limits,
+                        timeout=httpx.Timeout(10.0), follow_redirects=True)
+
+def _text(soup, selector: str):
+    el = soup.select_one(selector)
+    return el.get_text(strip=True) if el else None
+
+# 서버 렌더링 HTML에서 상품 기본 정보 추출 (get_product_info_optimized와 동일한 필드)
+def parse_product_html(html: str, url: str) -> dict:
+    soup = BeautifulSoup(html, HTML_PARSER)
+    product_dict = {}
+
+    title = _text(soup, 'h1.product-title')
+    if title is None:
+        raise FastPathMiss("상품 제목 없음 (차단 또는 클라이언트 렌더링)")
+    product_dict['title'] = title
+
+    img = soup.select_one('div.product-image img')
+    if img and img.get('src'):
+        src = img['src']
+        product_dict['image_url'] = replace_thumbnail_size('https:' + src if src.startswith('//') else src)
+
+    categorys = soup.select('ul.breadcrumb li')
+    if categorys:
+        product_dict['tag'] = ','.join(cat.get_text(strip=True) for cat in categorys[1:])
+
+    name = _text(soup, '#itemBrief > table > tbody > tr:nth-child(1) > td:nth-child(2)')
+    if name is not None:
+        product_dict['name'] = title if name.startswith("상품") else name
+    else:
+        product_dict['name'] = title
+
+    product_dict['product_code'] = int(get_product_code(url))
+
+    star = soup.select_one('span.rating-star-num')
+    product_dict['star_rating'] = get_star_rating(star.get('style', '')) if star else 0.0
+
+    review_count = _text(soup, 'span.rating-count-txt')
+    product_dict['review_count'] = get_num_in_str(review_count) if review_count else 0
+
+    sales_price = _text(soup, 'div.price-amount.sales-price-amount')
+    final_price = _text(soup, 'div.price-amount.final-price-amount')
+    product_dict['sales_price'] = get_num_in_str(sales_price) if sales_price else 0
+    product_dict['final_price'] = get_num_in_str(final_price) if final_price else 0
+
+    return product_dict
+
+# 리뷰 목록 HTML 조각에서 리뷰 추출 (없는 항목은 None)
+def parse_review_html(html: str, product_code: str) -> list:
+    soup = BeautifulSoup(html, HTML_PARSER)
+    reviews = []
+    for article in soup.select('article'):
+        rating = article.select_one('[data-rating]')
+        reviews.append({
+            'product_code': product_code,
+            'review_rating': rating.get('data-rating') if rating else None,
+            'review_date': _text(article, 'div.sdp-review__article__list__info__product-info__reg-date'),
+            'review_content': _text(article, 'div.sdp-review__article__list__review__content')
+        })
+    return reviews
+
+def _get(client: httpx.Client, url: str, **kwargs) -> str:
+    scheduler = get_scheduler()
+    scheduler.wait()
+    response = client.get(url, **kwargs)
+    # 차단/과부하 응답이면 요청 간격을 늘림
+    scheduler.report(response.status_code not in (403, 429, 503))
+    if response.status_code != 200:
+        raise FastPathMiss(f"HTTP {response.status_code}")
+    return response.text
+
+# HTTP 경로로 상품 정보와 리뷰 수집 (실패 시 FastPathMiss)
+# - 상품 주소가 경로(/vp/products/...)로 주어지면 base_url 기준으로 요청
+def fetch_product_fast(client: httpx.Client, product_url: str, max_pages: int = 10, requirement: dict = None,
+                       base_url: str = COUPANG_BASE_URL):
+    product_url = urljoin(base_url, product_url)
+    product_dict = parse_product_html(_get(client, product_url), product_url)
+    product_code = str(product_dict['product_code'])
+
+    # 워터마크나 최신 N개 조건이 있으면 최신순으로 보면서 조건을 충족하면 중단
+    collector = ReviewCollector(ReviewWatermark().get(product_code), ReviewBudget.from_dict(requirement))
+    sort_by = REVIEW_SORT_BY_DATE if collector.needs_newest_first else "ORDER_SCORE_ASC"
+
+    for page in range(1, max_pages + 1):
+        params = {"productId": product_code, "page": page, "size": REVIEW_PAGE_SIZE,
+                  "sortBy": sort_by, "ratings": "", "q": "", "viRoleCode": 3}
+        html = _get(client, urljoin(base_url, REVIEW_FRAGMENT_PATH), params=params, headers={"Referer": product_url})
+        reviews = parse_review_html(html, product_code)
+        if not reviews:
+            # 리뷰가 있어야 하는 상품인데 첫 페이지가 비면 불완전한 응답으로 판단
+            if page == 1 and product_dict['review_count'] > 0:
+                raise FastPathMiss("리뷰 목록 비어 있음")
+            break
+        if collector.add_page(reviews):
+            break
+
+    return product_dict, collector.reviews
+
+# HTTP 우선 크롤링, 차단/불완전 시 드라이버 풀 브라우저로 전환
+# - 반환: "http" / "browser" (처리 경로), "failed" (수집은 했지만 저장 실패)
+def coupang_crawling_fast(args, client: httpx.Client, pool, review_mode: str = "dom",
+                          requirement: dict = None, base_url: str = COUPANG_BASE_URL) -> str:
+    product_url, job_id = args
+    try:
+        product_dict, product_list = fetch_product_fast(client, product_url, requirement=requirement,
+                                                        base_url=base_url)
+    except Exception as e:
+        print(f"[INFO] HTTP 경로 실패, 브라우저로 전환: {product_url}, {e}")
+        coupang_crawling_pooled(args, pool, review_mode, requirement)
+        return "browser"
+
+    # 저장 실패는 HTTP 경로 실패가 아니므로 브라우저로 다시 수집하지 않음
+    product_code = str(product_dict['product_code'])
+    try:
+        insert_product_info_to_db(product_dict)
+        save_reviews_to_local(product_list, product_code, job_id)
+    except Exception as e:
+        print(f"[ERROR] {product_code} 리뷰 저장 실패: {e}")
+        return "failed"
+    print(f'[INFO] {product_code} 크롤링 완료 (HTTP) - 리뷰 {len(product_list)}개')
+    return "http"
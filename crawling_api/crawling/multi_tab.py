@@ -0,0 +1,220 @@
+import time
+import logging
+import undetected_chromedriver as uc
+from crawling.data_access import insert_product_info_to_db, save_reviews_to_local
+from crawling.driver_pool import PooledDriver
+from crawling.politeness import get_scheduler
+from crawling.optimized_crawling_job import (
+    get_product_code,
+    get_product_info_js,
+    get_product_review_optimized,
+    parse_review_bodies,
+    SCROLL_TO_REVIEW_SCRIPT,
+    FIND_REVIEW_URL_SCRIPT,
+    REVIEW_FETCH_CONCURRENCY
+)
+from crawling.review_network import REVIEW_API_PATTERN, REVIEW_SORT_BY_DATE, with_page_param, with_query_params
+from crawling.review_watermark import ReviewWatermark
+from crawling.review_requirement import ReviewBudget, ReviewCollector
+
+logger = logging.getLogger(__name__)
+
+# 탭 상태
+IDLE, LOADING, REVIEWS, FETCHING = "idle", "loading", "reviews", "fetching"
+
+# 현재 탭이 대상 상품 페이지를 DOM까지 로드했는지 확인
+PAGE_READY_SCRIPT = """
+return window.location.href.indexOf(arguments[0]) !== -1
+    && document.readyState !== 'loading'
+    && !!document.querySelector('h1.product-title');
+"""
+
+# 리뷰 페이지 fetch를 시작만 하고 바로 반환 (결과는 window.__tabReviewFetch에 모음, 동시 요청 수 제한)
+START_REVIEW_FETCH_SCRIPT = """
+const urls = arguments[0], limit = arguments[1];
+const state = window.__tabReviewFetch = {done: false, results: new Array(urls.length).fill(null)};
+let next = 0;
+async function worker() {
+    while (next < urls.length) {
+        const i = next++;
+        try {
+            const res = await fetch(urls[i], {credentials: 'include', headers: {'Accept': 'application/json'}});
+            state.results[i] = res.ok ? await res.text() : null;
+        } catch (e) {
+            state.results[i] = null;
+        }
+    }
+}
+Promise.all(Array.from({length: Math.min(limit, urls.length)}, worker)).then(() => { state.done = true; });
+"""
+
+# 시작한 리뷰 fetch가 끝났으면 응답 본문 목록, 아직이면 null
+POLL_REVIEW_FETCH_SCRIPT = """
+const state = window.__tabReviewFetch;
+return state && state.done ? state.results : null;
+"""
+
+
+class Tab:
+    def __init__(self, handle: str):
+        self.handle = handle
+        self.state = IDLE
+        self.url = None
+        self.product_dict = None
+        self.product_code = None
+        self.collector = None
+        self.review_url = None
+        self.pages = []
+        self.deadline = 0.0
+
+
+class MultiTabCrawler:
+    """
+    크롬 하나에서 여러 탭으로 상품을 동시에 크롤링
+    - 탭마다 로드/리뷰 대기 상태를 두고 라운드 로빈으로 확인하여 대기 시간을 겹치게 함
+    - 리뷰 페이지도 탭 안에서 fetch를 시작만 해 두고 다음 차례에 결과를 확인 (한 상품의 리뷰 수집이 다른 탭을 막지 않음)
+    - save=False: 수집만 하고 상품 DB/리뷰 파일/크롤링 인덱스에 기록하지 않음 (벤치마크용)
+    """
+
+    def __init__(self, driver: uc.Chrome, tabs: int = 4, load_timeout: float = 20, review_timeout: float = 10,
+                 requirement: dict = None, max_review_pages: int = 10, fetch_timeout: float = 30,
+                 save: bool = True):
+        self.driver = driver
+        self.requirement = requirement
+        self.save = save
+        self.load_timeout = load_timeout
+        self.review_timeout = review_timeout
+        self.max_review_pages = max_review_pages
+        self.fetch_timeout = fetch_timeout
+        self.tabs = [Tab(driver.current_window_handle)]
+        for _ in range(tabs - 1):
+            driver.switch_to.new_window('tab')
+            self.tabs.append(Tab(driver.current_window_handle))
+        self.peak_memory_mb = 0.0
+        self.stats = {"completed": 0, "failed": 0}
+
+    def _sample_memory(self) -> None:
+        self.peak_memory_mb = max(self.peak_memory_mb, PooledDriver(self.driver).memory_mb())
+
+    def _start(self, tab: Tab, url: str) -> None:
+        get_scheduler().wait()
+        self.driver.switch_to.window(tab.handle)
+        # driver.get은 로드 완료까지 막히므로 스크립트로 이동만 지시
+        self.driver.execute_script("window.location.href = arguments[0];", url)
+        tab.url = url
+        tab.state = LOADING
+        tab.deadline = time.time() + self.load_timeout
+
+    def _finish(self, tab: Tab, job_id: str) -> None:
+        product_list = tab.collector.reviews
+        if self.save:
+            insert_product_info_to_db(tab.product_dict)
+            save_reviews_to_local(product_list, tab.product_code, job_id)
+        print(f'[INFO] {tab.product_code} 크롤링 완료 (탭) - 리뷰 {len(product_list)}개')
+        self.stats["completed"] += 1
+        tab.state = IDLE
+
+    def _finish_with_dom(self, tab: Tab, job_id: str) -> None:
+        # 리뷰 엔드포인트를 모르면 버튼 클릭 방식 (탭 포커스가 필요해 이 탭에서 끝까지 처리)
+        get_product_review_optimized(self.driver, tab.product_code, tab.collector)
+        self._finish(tab, job_id)
+
+    def _fetch(self, tab: Tab, pages: list) -> None:
+        get_scheduler().wait()
+        urls = [with_page_param(tab.review_url, page) for page in pages]
+        self.driver.execute_script(START_REVIEW_FETCH_SCRIPT, urls, REVIEW_FETCH_CONCURRENCY)
+        tab.pages = pages
+        tab.state = FETCHING
+        tab.deadline = time.time() + self.fetch_timeout
+
+    def _start_reviews(self, tab: Tab, review_url: str) -> None:
+        if tab.collector.needs_newest_first:
+            # 증분/최신 N개 수집: 최신순 첫 페이지로 조건이 충족되지 않을 때만 나머지를 요청
+            tab.review_url = with_query_params(review_url, sortBy=REVIEW_SORT_BY_DATE)
+            self._fetch(tab, [1])
+        else:
+            tab.review_url = review_url
+            self._fetch(tab, list(range(1, self.max_review_pages + 1)))
+
+    def _collect(self, tab: Tab, job_id: str) -> None:
+        bodies = self.driver.execute_script(POLL_REVIEW_FETCH_SCRIPT)
+        if bodies is None:
+            if time.time() > tab.deadline:
+                print(f"[ERROR] {tab.product_code} 리뷰 요청 시간 초과 - 수집한 리뷰만 저장")
+                self._finish(tab, job_id)
+            return
+
+        results = parse_review_bodies(bodies, tab.product_code)
+        if tab.pages[0] == 1 and results[0] is None:
+            print(f"[INFO] {tab.product_code} 리뷰 응답 형태 미확인 - 버튼 클릭 방식으로 전환")
+            self._finish_with_dom(tab, job_id)
+            return
+
+        done = False
+        for reviews in results:
+            if not reviews or tab.collector.add_page(reviews):
+                done = True
+                break
+        if not done and tab.pages == [1] and self.max_review_pages > 1:
+            self._fetch(tab, list(range(2, self.max_review_pages + 1)))
+            return
+        self._finish(tab, job_id)
+
+    def _step(self, tab: Tab, job_id: str) -> None:
+        self.driver.switch_to.window(tab.handle)
+
+        if tab.state == LOADING:
+            if self.driver.execute_script(PAGE_READY_SCRIPT, get_product_code(tab.url)):
+                tab.product_dict = get_product_info_js(self.driver)
+                tab.product_code = str(tab.product_dict['product_code'])
+                tab.collector = ReviewCollector(ReviewWatermark().get(tab.product_code),
+                                                ReviewBudget.from_dict(self.requirement))
+                # 리뷰 XHR이 호출되도록 스크롤만 하고 다른 탭으로 넘어감
+                self.driver.execute_script(SCROLL_TO_REVIEW_SCRIPT)
+                tab.state = REVIEWS
+                tab.deadline = time.time() + self.review_timeout
+            elif time.time() > tab.deadline:
+                print(f"[ERROR] 페이지 로드 시간 초과: {tab.url}")
+                self.stats["failed"] += 1
+                tab.state = IDLE
+
+        elif tab.state == REVIEWS:
+            # 리뷰 엔드포인트가 보이면 페이지 fetch 시작, 시간이 지나도 안 보이면 버튼 방식으로 전환
+            review_url = self.driver.execute_script(FIND_REVIEW_URL_SCRIPT, REVIEW_API_PATTERN.pattern)
+            if review_url:
+                self._start_reviews(tab, review_url)
+            elif time.time() > tab.deadline:
+                print(f"[INFO] {tab.product_code} 리뷰 엔드포인트 미확인 - 버튼 클릭 방식으로 전환")
+                self._finish_with_dom(tab, job_id)
+
+        elif tab.state == FETCHING:
+            # fetch가 끝난 탭만 결과를 처리하고, 진행 중이면 바로 다음 탭으로 넘어감
+            self._collect(tab, job_id)
+
+    def crawl(self, url_list: list, job_id: str, poll_interval: float = 0.1) -> dict:
+        pending = list(url_list)
+        last_sample = 0.0
+
+        while pending or any(tab.state != IDLE for tab in self.tabs):
+            for tab in self.tabs:
+                try:
+                    if tab.state == IDLE:
+                        if pending:
+                            self._start(tab, pending.pop(0))
+                    else:
+                        self._step(tab, job_id)
+                except Exception as e:
+                    print(f"[ERROR] 탭 크롤링 에러: {tab.url}, {e}")
+                    self.stats["failed"] += 1
+                    tab.state = IDLE
+
+            if time.time() - last_sample > 1:
+                self._sample_memory()
+                last_sample = time.time()
+            time.sleep(poll_interval)
+
+        concurrent = min(len(self.tabs), len(url_list)) or 1
+        self.stats["peak_memory_mb"] = round(self.peak_memory_mb, 1)
+        self.stats["memory_per_product_mb"] = round(self.peak_memory_mb / concurrent, 1)
+        logger.info(f"멀티 탭 크롤링 완료 - 탭 {len(self.tabs)}개, {self.stats}")
+        return self.stats
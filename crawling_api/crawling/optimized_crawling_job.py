@@ -12,6 +12,16 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from fake_useragent import UserAgent
 from crawling.data_access import insert_product_info_to_db, save_reviews_to_local
+from crawling.product_writer import flush_product_writer
+from crawling.politeness import get_scheduler
+from crawling.freshness_index import FreshnessIndex
+from crawling.review_network import (
+    ReviewNetworkCapture, REVIEW_API_PATTERN, REVIEW_SORT_BY_DATE,
+    parse_review_payload, with_page_param, with_query_params
+)
+from crawling.review_watermark import ReviewWatermark
+from crawling.review_requirement import ReviewBudget, ReviewCollector
+import json
 import threading
 from queue import Queue
 
@@ -131,7 +141,8 @@ def go_next_page_optimized(driver: uc.Chrome, page_num: int, review_id: str) ->
         driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", page_button)
         time.sleep(0.2)  # 최소 대기
         
-        # 클릭
+        # 호스트 단위 요청 간격 확보 후 클릭
+        get_scheduler().wait()
         driver.execute_script("arguments[0].click();", page_button)  # JavaScript 클릭으로 더 빠름
         
         # 페이지 로드 확인 (더 효율적)
@@ -221,39 +232,133 @@ def get_product_info_optimized(driver: uc.Chrome) -> dict:
         print(f"[ERROR] 상품 기본 정보 추출 실패: {e}")
         return product_dict
 
+# 상품 기본 정보를 한 번의 execute_script로 수집하는 스크립트
+PRODUCT_INFO_SCRIPT = """
+const text = (sel) => { const el = document.querySelector(sel); return el ? el.innerText.trim() : null; };
+const img = document.querySelector('div.product-image img');
+const star = document.querySelector('span.rating-star-num');
+return {
+    title: text('h1.product-title'),
+    image_url: img ? img.src : null,
+    categories: Array.from(document.querySelectorAll('ul.breadcrumb li')).map(li => li.innerText.trim()),
+    name: text('#itemBrief > table > tbody > tr:nth-child(1) > td:nth-child(2)'),
+    star_style: star ? star.getAttribute('style') : null,
+    review_count: text('span.rating-count-txt'),
+    sales_price: text('div.price-amount.sales-price-amount'),
+    final_price: text('div.price-amount.final-price-amount'),
+    current_url: window.location.href
+};
+"""
+
+# 단일 왕복 JavaScript 상품 기본 정보 추출 (get_product_info_optimized와 동일한 결과)
+def get_product_info_js(driver: uc.Chrome) -> dict:
+    product_dict = {}
+    
+    try:
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, 'h1.product-title'))
+        )
+        
+        raw = driver.execute_script(PRODUCT_INFO_SCRIPT)
+        
+        if raw['title'] is not None:
+            product_dict['title'] = raw['title']
+        
+        if raw['image_url'] is not None:
+            product_dict['image_url'] = replace_thumbnail_size(raw['image_url'])
+        
+        if raw['categories']:
+            product_dict['tag'] = ','.join(raw['categories'][1:])
+        
+        name = raw['name']
+        if name is not None:
+            product_dict['name'] = product_dict['title'] if name.startswith("상품") else name
+        else:
+            product_dict['name'] = product_dict.get('title', '')
+        
+        product_dict['product_code'] = int(get_product_code(raw['current_url']))
+        product_dict['star_rating'] = get_star_rating(raw['star_style']) if raw['star_style'] is not None else 0.0
+        product_dict['review_count'] = get_num_in_str(raw['review_count']) if raw['review_count'] is not None else 0
+        product_dict['sales_price'] = get_num_in_str(raw['sales_price']) if raw['sales_price'] is not None else 0
+        product_dict['final_price'] = get_num_in_str(raw['final_price']) if raw['final_price'] is not None else 0
+        
+        return product_dict
+        
+    except Exception as e:
+        print(f"[ERROR] 상품 기본 정보 추출 실패: {e}")
+        return product_dict
+
+# 현재 리뷰 페이지의 모든 article을 한 번의 호출로 추출하는 스크립트 (없는 항목은 null)
+REVIEW_PAGE_SCRIPT = """
+const reviewId = arguments[0];
+return Array.from(document.querySelectorAll('#' + reviewId + ' article')).map(article => {
+    const rating = article.querySelector('[data-rating]');
+    const date = article.querySelector('div.sdp-review__article__list__info__product-info__reg-date');
+    const content = article.querySelector('div.sdp-review__article__list__review__content');
+    return {
+        review_rating: rating ? rating.getAttribute('data-rating') : null,
+        review_date: date ? date.innerText.trim() : null,
+        review_content: content ? content.innerText.trim() : null
+    };
+});
+"""
+
+# 현재 페이지 리뷰 일괄 추출 (sdpReview / btfTab 공통)
+def extract_review_page(driver: uc.Chrome, review_id: str, product_code: str) -> list:
+    reviews = driver.execute_script(REVIEW_PAGE_SCRIPT, review_id) or []
+    return [{'product_code': product_code, **review} for review in reviews]
+
+# 리뷰 정렬을 최신순으로 변경하는 스크립트 (버튼이 없으면 false)
+SORT_BY_DATE_SCRIPT = """
+const section = document.querySelector('#' + arguments[0]);
+const button = section && Array.from(section.querySelectorAll('button, a, li'))
+    .find(el => el.innerText && el.innerText.trim() === '최신순');
+if (button) { button.click(); return true; }
+return false;
+"""
+
+# DOM 리뷰 목록을 최신순으로 정렬 (성공 여부 반환)
+def sort_reviews_by_date(driver: uc.Chrome, review_id: str) -> bool:
+    try:
+        first_article = driver.find_element(By.CSS_SELECTOR, f"#{review_id} article")
+        get_scheduler().wait()
+        if not driver.execute_script(SORT_BY_DATE_SCRIPT, review_id):
+            return False
+        WebDriverWait(driver, 5).until(EC.staleness_of(first_article))
+        return True
+    except Exception:
+        return False
+
 # 최적화된 상품 리뷰 추출
-def get_product_review_optimized(driver: uc.Chrome, product_code: str):
+# - collector: 워터마크(이미 수집한 리뷰)와 리뷰 조건(최신 N개 등)을 적용해 조기 중단
+def get_product_review_optimized(driver: uc.Chrome, product_code: str, collector: ReviewCollector = None):
+    collector = collector or ReviewCollector()
     try:
         print(f"[INFO] {product_code} 리뷰 크롤링 시작")
-        
+
         # 리뷰 영역 확인
         review_id = "sdpReview" if check_element_optimized("css", "#sdpReview article", driver) else "btfTab"
-        
-        product_list = []
+
+        # 최신순 정렬이 안 되면 순서 기반 조기 중단 없이 수집
+        if collector.needs_newest_first and not sort_reviews_by_date(driver, review_id):
+            print(f"[INFO] {product_code} 최신순 정렬 실패 - 전체 리뷰 수집")
+            collector.disable_ordering()
+
         max_pages = 10  # 최대 페이지 제한
-        
+
         for page in range(1, max_pages + 1):
             try:
-                # 현재 페이지 리뷰 추출
-                articles = driver.find_elements(By.CSS_SELECTOR, f"#{review_id} article")
+                # 현재 페이지 리뷰를 한 번의 스크립트 호출로 추출
+                page_reviews = extract_review_page(driver, review_id, product_code)
                 
-                if not articles:
+                if not page_reviews:
                     print(f"[INFO] {product_code} 페이지 {page}: 리뷰 없음")
                     break
                 
-                # 배치로 리뷰 데이터 추출
-                for article in articles:
-                    try:
-                        review_data = {
-                            'product_code': product_code,
-                            'review_rating': article.find_element(By.CSS_SELECTOR, '[data-rating]').get_attribute("data-rating"),
-                            'review_date': article.find_element(By.CSS_SELECTOR, 'div.sdp-review__article__list__info__product-info__reg-date').text,
-                            'review_content': article.find_element(By.CSS_SELECTOR, 'div.sdp-review__article__list__review__content').text
-                        }
-                        product_list.append(review_data)
-                    except NoSuchElementException:
-                        continue
-                
+                if collector.add_page(page_reviews):
+                    print(f"[INFO] {product_code} 페이지 {page}: 수집 조건 충족")
+                    break
+
                 # 다음 페이지로 이동
                 if page < max_pages:
                     if not go_next_page_optimized(driver, page + 1, review_id):
@@ -262,102 +367,332 @@ def get_product_review_optimized(driver: uc.Chrome, product_code: str):
             except Exception as e:
                 print(f"[INFO] {product_code} 페이지 {page} 처리 중 오류: {e}")
                 break
+
+        print(f"[INFO] {product_code} 리뷰 {len(collector.reviews)}개 추출 완료")
+        return collector.reviews
+
+    except Exception as e:
+        print(f"[ERROR] {product_code} 리뷰 추출 실패: {e}")
+        return collector.reviews
+
+# 리뷰 영역이 화면에 들어와야 리뷰 목록 XHR이 호출됨
+SCROLL_TO_REVIEW_SCRIPT = """
+const section = document.querySelector('#sdpReview') || document.querySelector('#btfTab');
+if (section) { section.scrollIntoView({behavior: 'instant', block: 'start'}); }
+"""
+
+# CDP 네트워크 캡처 기반 리뷰 추출 (페이지 버튼 클릭 없이 XHR 응답 JSON을 직접 파싱)
+def get_product_review_cdp(driver: uc.Chrome, product_code: str, capture: ReviewNetworkCapture,
+                           max_pages: int = 10, timeout: float = 10, collector: ReviewCollector = None):
+    collector = collector or ReviewCollector()
+    try:
+        print(f"[INFO] {product_code} 리뷰 크롤링 시작 (CDP)")
+        driver.execute_script(SCROLL_TO_REVIEW_SCRIPT)
+        
+        payload = capture.next_payload(timeout)
+        reviews, total_page = parse_review_payload(payload, product_code) if payload else (None, None)
+        
+        # 리뷰 응답을 잡지 못했거나 형태를 모르면 기존 DOM 방식으로 처리
+        if reviews is None:
+            print(f"[INFO] {product_code} 리뷰 XHR 미확인 - DOM 방식으로 전환")
+            return get_product_review_optimized(driver, product_code, collector)
+        
+        base_url = capture.last_url
+        
+        # 페이지 내 fetch로 요청 → 응답은 CDP로 수집
+        def request_page(page: int):
+            get_scheduler().wait()
+            driver.execute_script("fetch(arguments[0], {credentials: 'include'});", with_page_param(base_url, page))
+            page_payload = capture.next_payload(timeout)
+            return parse_review_payload(page_payload, product_code) if page_payload else (None, None)
+        
+        # 증분/최신 N개 수집은 최신순으로 첫 페이지부터 다시 요청
+        if collector.needs_newest_first:
+            base_url = with_query_params(base_url, sortBy=REVIEW_SORT_BY_DATE)
+            reviews, total_page = request_page(1)
+            # 최신순 재요청 응답을 받지 못하면 빈 결과로 끝내지 않고 DOM 방식으로 처리
+            if reviews is None:
+                print(f"[INFO] {product_code} 최신순 리뷰 XHR 미확인 - DOM 방식으로 전환")
+                return get_product_review_optimized(driver, product_code, collector)
+
+        last_page = min(max_pages, total_page or max_pages)
+        page = 1
+        while reviews:
+            if collector.add_page(reviews) or page >= last_page:
+                break
+            page += 1
+            reviews, _ = request_page(page)
+
+        print(f"[INFO] {product_code} 리뷰 {len(collector.reviews)}개 추출 완료")
+        return collector.reviews
+
+    except Exception as e:
+        print(f"[ERROR] {product_code} 리뷰 추출 실패: {e}")
+        return collector.reviews
+
+# 페이지가 이미 호출한 리뷰 목록 XHR 주소 찾기 (Resource Timing 이용)
+FIND_REVIEW_URL_SCRIPT = """
+const pattern = new RegExp(arguments[0]);
+const entry = performance.getEntriesByType('resource').find(e => pattern.test(e.name));
+return entry ? entry.name : null;
+"""
+
+# 페이지 세션(쿠키)을 그대로 사용해 여러 리뷰 페이지를 동시에 fetch (동시 요청 수 제한)
+PARALLEL_FETCH_SCRIPT = """
+const urls = arguments[0], limit = arguments[1], done = arguments[arguments.length - 1];
+const results = new Array(urls.length).fill(null);
+let next = 0;
+async function worker() {
+    while (next < urls.length) {
+        const i = next++;
+        try {
+            const res = await fetch(urls[i], {credentials: 'include', headers: {'Accept': 'application/json'}});
+            results[i] = res.ok ? await res.text() : null;
+        } catch (e) {
+            results[i] = null;
+        }
+    }
+}
+Promise.all(Array.from({length: Math.min(limit, urls.length)}, worker)).then(() => done(results));
+"""
+
+REVIEW_FETCH_CONCURRENCY = 4
+
+# 여러 리뷰 페이지를 한 번의 스크립트 호출로 가져와 파싱 (형태를 모르는 응답은 None)
+def fetch_review_pages(driver: uc.Chrome, review_url: str, pages: list, product_code: str, concurrency: int) -> list:
+    get_scheduler().wait()
+    driver.set_script_timeout(30)
+    urls = [with_page_param(review_url, page) for page in pages]
+    bodies = driver.execute_async_script(PARALLEL_FETCH_SCRIPT, urls, concurrency)
+    return parse_review_bodies(bodies, product_code)
+
+# fetch로 받은 리뷰 응답 본문들을 파싱 (형태를 모르는 응답은 None)
+def parse_review_bodies(bodies: list, product_code: str) -> list:
+    results = []
+    for body in bodies:
+        try:
+            reviews, _ = parse_review_payload(json.loads(body), product_code) if body else (None, None)
+        except ValueError:
+            reviews = None
+        results.append(reviews)
+    return results
+
+# 페이지 내 병렬 fetch 기반 리뷰 추출 (엔드포인트 형태를 모르면 버튼 클릭 방식으로 전환)
+def get_product_review_parallel(driver: uc.Chrome, product_code: str, max_pages: int = 10,
+                                concurrency: int = REVIEW_FETCH_CONCURRENCY, collector: ReviewCollector = None):
+    collector = collector or ReviewCollector()
+    try:
+        print(f"[INFO] {product_code} 리뷰 크롤링 시작 (병렬 fetch)")
+        driver.execute_script(SCROLL_TO_REVIEW_SCRIPT)
         
-        print(f"[INFO] {product_code} 리뷰 {len(product_list)}개 추출 완료")
-        return product_list
-        
+        try:
+            review_url = WebDriverWait(driver, 10).until(
+                lambda d: d.execute_script(FIND_REVIEW_URL_SCRIPT, REVIEW_API_PATTERN.pattern)
+            )
+        except TimeoutException:
+            review_url = None
+        
+        if not review_url:
+            print(f"[INFO] {product_code} 리뷰 엔드포인트 미확인 - 버튼 클릭 방식으로 전환")
+            return get_product_review_optimized(driver, product_code, collector)
+        
+        if collector.needs_newest_first:
+            # 증분/최신 N개 수집: 최신순 첫 페이지로 조건이 충족되지 않을 때만 나머지를 한 번에 요청
+            review_url = with_query_params(review_url, sortBy=REVIEW_SORT_BY_DATE)
+            first = fetch_review_pages(driver, review_url, [1], product_code, concurrency)[0]
+            if first is None:
+                print(f"[INFO] {product_code} 리뷰 응답 형태 미확인 - 버튼 클릭 방식으로 전환")
+                return get_product_review_optimized(driver, product_code, collector)
+            if first and not collector.add_page(first):
+                for reviews in fetch_review_pages(driver, review_url, list(range(2, max_pages + 1)),
+                                                  product_code, concurrency):
+                    if not reviews or collector.add_page(reviews):
+                        break
+        else:
+            # 1..max_pages를 한 번에 요청 (왕복 1회, 동시 요청 수는 concurrency로 제한)
+            page_results = fetch_review_pages(driver, review_url, list(range(1, max_pages + 1)),
+                                              product_code, concurrency)
+            if page_results[0] is None:
+                print(f"[INFO] {product_code} 리뷰 응답 형태 미확인 - 버튼 클릭 방식으로 전환")
+                return get_product_review_optimized(driver, product_code, collector)
+            for reviews in page_results:
+                if not reviews or collector.add_page(reviews):
+                    break
+
+        print(f"[INFO] {product_code} 리뷰 {len(collector.reviews)}개 추출 완료")
+        return collector.reviews
+
     except Exception as e:
         print(f"[ERROR] {product_code} 리뷰 추출 실패: {e}")
-        return []
+        return collector.reviews
+
+# 이미 실행된 드라이버로 상품 정보와 리뷰 수집 (저장은 하지 않음)
+def scrape_product_with_driver(driver: uc.Chrome, product_url: str, use_js_extractor: bool = True,
+                               review_mode: str = "dom", requirement: dict = None):
+    # CDP 모드는 페이지 로드 전에 네트워크 캡처를 시작해야 함
+    capture = None
+    if review_mode == "cdp":
+        capture = ReviewNetworkCapture(driver)
+        capture.start()
+    
+    try:
+        scheduler = get_scheduler()
+        scheduler.wait()
+        driver.get(product_url)
+        
+        # 페이지 로드 확인 (결과를 스케줄러 지연 조정에 반영)
+        try:
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'h1.product-title'))
+            )
+            scheduler.report(True)
+        except TimeoutException:
+            scheduler.report(False)
+            raise
+        
+        # 상품 기본 정보 추출 (기본은 단일 왕복 JS 추출)
+        if use_js_extractor:
+            product_dict = get_product_info_js(driver)
+        else:
+            product_dict = get_product_info_optimized(driver)
+        product_code = str(product_dict['product_code'])
+        
+        # 이전에 수집한 최신 리뷰까지만, 다운스트림 조건을 충족할 만큼만 수집
+        collector = ReviewCollector(ReviewWatermark().get(product_code), ReviewBudget.from_dict(requirement))
+
+        # 상품 리뷰 추출
+        if capture:
+            product_list = get_product_review_cdp(driver, product_code, capture, collector=collector)
+        elif review_mode == "fetch":
+            product_list = get_product_review_parallel(driver, product_code, collector=collector)
+        else:
+            product_list = get_product_review_optimized(driver, product_code, collector)
+    finally:
+        if capture:
+            capture.stop()
+    
+    return product_dict, product_list
+
+# 이미 실행된 드라이버로 상품 하나를 크롤링
+def crawl_product_with_driver(driver: uc.Chrome, product_url: str, job_id: str, use_js_extractor: bool = True,
+                              review_mode: str = "dom", requirement: dict = None) -> None:
+    product_dict, product_list = scrape_product_with_driver(driver, product_url, use_js_extractor, review_mode,
+                                                            requirement)
+    product_code = str(product_dict['product_code'])
+    
+    # 상품 정보 / 리뷰 저장
+    insert_product_info_to_db(product_dict)
+    save_reviews_to_local(product_list, product_code, job_id)
+    
+    print(f'[INFO] {product_code} 크롤링 완료 - 리뷰 {len(product_list)}개')
 
 # 최적화된 크롤링 파이프라인
 def coupang_crawling_optimized(args) -> None:
     driver = None
     try:
-        product_url, job_id = args
+        product_url, job_id = args[:2]
+        review_mode = args[2] if len(args) > 2 else "dom"
+        requirement = args[3] if len(args) > 3 else None
         driver = setup_optimized_driver()
         
         # 페이지 로드 타임아웃 설정
         driver.set_page_load_timeout(30)
         driver.implicitly_wait(5)
         
-        driver.get(product_url)
-        
-        # 페이지 로드 확인
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'h1.product-title'))
-        )
-        
-        # 상품 기본 정보 추출
-        product_dict = get_product_info_optimized(driver)
-        product_code = str(product_dict['product_code'])
-        
-        # 상품 리뷰 추출
-        product_list = get_product_review_optimized(driver, product_code)
-        
-        # 리뷰 저장
-        save_reviews_to_local(product_list, product_code, job_id)
-        
-        print(f'[INFO] {product_code} 크롤링 완료 - 리뷰 {len(product_list)}개')
-        
+        crawl_product_with_driver(driver, product_url, job_id, review_mode=review_mode, requirement=requirement)
+
     except Exception as e:
         print(f"[ERROR] 크롤링 에러: {e}")
     finally:
         if driver:
             driver.quit()
+        # Pool 종료 시 워커가 바로 종료되므로 작업마다 남은 상품 행을 저장
+        flush_product_writer()
 
-# 최적화된 상품 링크 추출
-def get_product_links_optimized(keyword: str, max_links: int) -> list:
-    driver = None
+# 드라이버 풀에서 임대한 브라우저로 크롤링 (브라우저 실행 비용 없음)
+def coupang_crawling_pooled(args, pool, review_mode: str = "dom", requirement: dict = None) -> None:
+    product_url, job_id = args
     try:
-        driver = setup_optimized_driver()
-        search_url = f"https://www.coupang.com/np/search?component=&q={keyword}"
-        
-        driver.get(search_url)
-        
-        # 검색 결과 로드 대기
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, '#product-list li'))
-        )
-        
-        items = driver.find_elements(By.CSS_SELECTOR, '#product-list li')
-        
-        links = []
-        duplicate_chk = set()
+        with pool.lease() as pooled:
+            pooled.page_count += 1
+            crawl_product_with_driver(pooled.driver, product_url, job_id, review_mode=review_mode,
+                                      requirement=requirement)
+    except Exception as e:
+        print(f"[ERROR] 크롤링 에러: {e}")
+
+# 검색 결과 페이지의 상품 링크와 리뷰 수 텍스트를 한 번에 수집하는 스크립트
+SEARCH_ITEMS_SCRIPT = """
+return Array.from(document.querySelectorAll('#product-list li')).map(li => {
+    const a = li.querySelector('a');
+    const count = li.querySelector('span[class*="ProductRating_ratingCount"]');
+    return {href: a ? a.href : null, review_count: count ? count.innerText : null};
+});
+"""
+
+# 검색 결과를 여러 페이지 순회하며 조건에 맞는 상품 URL을 찾는 즉시 반환 (제너레이터)
+def iter_product_links_optimized(keyword: str, max_links: int, driver: uc.Chrome = None,
+                                 max_pages: int = 5, min_review_count: int = 200, skip_fresh: bool = True):
+    # 외부(드라이버 풀)에서 받은 드라이버는 종료하지 않음
+    owns_driver = driver is None
+    found = skipped = 0
+    duplicate_chk = set()
+    freshness = FreshnessIndex() if skip_fresh else None
+    try:
+        if owns_driver:
+            driver = setup_optimized_driver()
         
-        for item in items:
+        for page in range(1, max_pages + 1):
+            search_url = f"https://www.coupang.com/np/search?component=&q={keyword}&page={page}"
+            
+            get_scheduler().wait()
+            driver.get(search_url)
+            
+            # 검색 결과 로드 대기
             try:
-                href = item.find_element(By.TAG_NAME, 'a').get_attribute('href')
-                product_code = get_product_code(href)
+                WebDriverWait(driver, 15).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, '#product-list li'))
+                )
+            except TimeoutException:
+                print(f"[INFO] 검색 결과 {page} 페이지 없음")
+                break
+            
+            for item in driver.execute_script(SEARCH_ITEMS_SCRIPT):
+                href = item['href']
+                # 리뷰 수가 없는 상품은 스킵
+                if not href or not item['review_count']:
+                    continue
                 
+                product_code = get_product_code(href)
                 if product_code in duplicate_chk:
                     continue
                 duplicate_chk.add(product_code)
                 
-                # 리뷰 수 확인 (병렬 처리를 위해 간소화)
                 try:
-                    review_element = item.find_element(By.XPATH, './/span[contains(@class, "ProductRating_ratingCount")]')
-                    review_count = get_num_in_str(review_element.text)
-                    
-                    if review_count >= 200:
-                        links.append(href)
-                        
-                    if len(links) >= max_links:
-                        break
-                        
-                except NoSuchElementException:
-                    # 리뷰 수가 없는 상품은 스킵
+                    review_count = get_num_in_str(item['review_count'])
+                except ValueError:
                     continue
+                
+                if review_count >= min_review_count:
+                    # 최근에 수집했고 리뷰 수 변화가 적은 상품은 건너뜀
+                    if freshness:
+                        if freshness.is_fresh(product_code, review_count):
+                            skipped += 1
+                            continue
+                        freshness.mark_seen(product_code, review_count)
                     
-            except Exception as e:
-                continue
-        
-        print(f"[INFO] {len(links)}개 상품 URL 추출 완료")
-        return links
+                    found += 1
+                    yield href
+                    
+                    if found >= max_links:
+                        return
         
     except Exception as e:
         print(f"[ERROR] 상품 링크 추출 실패: {e}")
-        return []
     finally:
-        if driver:
-            driver.quit()
\ No newline at end of file
+        print(f"[INFO] {found}개 상품 URL 추출 완료 (신선도 기준 {skipped}개 건너뜀)")
+        if driver and owns_driver:
+            driver.quit()
+
+# 최적화된 상품 링크 추출
+def get_product_links_optimized(keyword: str, max_links: int, driver: uc.Chrome = None, skip_fresh: bool = True) -> list:
+    return list(iter_product_links_optimized(keyword, max_links, driver, skip_fresh=skip_fresh))
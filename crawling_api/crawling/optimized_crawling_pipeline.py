@@ -1,15 +1,26 @@
 from crawling.optimized_crawling_job import (
     coupang_crawling_optimized, 
-    get_product_links_optimized
+    coupang_crawling_pooled,
+    get_product_links_optimized,
+    iter_product_links_optimized,
+    scrape_product_with_driver,
+    setup_optimized_driver
 )
+from crawling.multi_tab import MultiTabCrawler
+from crawling.politeness import init_scheduler
+from crawling.review_writer import job_review_writer, init_review_sink
+from crawling.driver_pool import DriverPool
 from multiprocessing import Pool, cpu_count, freeze_support
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from crawling.data_access import upload_parquet_to_gcs
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from crawling.data_access import upload_parquet_to_gcs, save_reviews_to_local, insert_product_info_to_db
+from crawling.product_writer import flush_product_writer
+from crawling.http_fast_path import create_http_client, coupang_crawling_fast, fetch_product_fast
 from crawling.request_to_transform_api import notify_spark_server
 from datetime import datetime, timedelta
 import time
 import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -19,7 +30,13 @@ def generate_job_id():
     now = datetime.now()
     return "job_" + now.strftime("%Y%m%d_%H%M%S")
 
-def run_optimized_multi_process(url_list: list, job_id: str) -> None:
+def init_crawl_worker(scheduler=None, review_queue=None) -> None:
+    """워커 프로세스 초기화: 요청 간격 스케줄러와 작업 리뷰 기록기 큐 연결"""
+    init_scheduler(scheduler)
+    init_review_sink(review_queue)
+
+def run_optimized_multi_process(url_list: list, job_id: str, review_mode: str = "dom", scheduler=None,
+                                requirement: dict = None, review_queue=None) -> None:
     """최적화된 멀티프로세싱 실행"""
     if not url_list:
         logger.warning("처리할 URL이 없습니다.")
@@ -37,10 +54,12 @@ def run_optimized_multi_process(url_list: list, job_id: str) -> None:
     failed_count = 0
     
     try:
-        with ProcessPoolExecutor(max_workers=optimal_processes) as executor:
+        # 모든 워커가 같은 요청 간격 스케줄러와 리뷰 기록기를 공유
+        with ProcessPoolExecutor(max_workers=optimal_processes, initializer=init_crawl_worker,
+                                 initargs=(scheduler, review_queue)) as executor:
             # 모든 작업 제출
             future_to_url = {
-                executor.submit(coupang_crawling_optimized, (url, job_id)): url 
+                executor.submit(coupang_crawling_optimized, (url, job_id, review_mode, requirement)): url 
                 for url, job_id in zip(url_list, job_ids)
             }
             
@@ -70,7 +89,49 @@ def run_optimized_multi_process(url_list: list, job_id: str) -> None:
         logger.info(f"처리 완료 - 성공: {completed_count}, 실패: {failed_count}, "
                    f"총 소요시간: {total_time:.1f}초")
 
-def run_batch_processing(url_list: list, job_id: str, batch_size: int = 10) -> None:
+def run_streaming_multi_process(link_iter, job_id: str, max_workers: int, review_mode: str = "dom",
+                                scheduler=None, max_in_flight: int = None, requirement: dict = None,
+                                review_queue=None) -> int:
+    """
+    링크 제너레이터에서 URL이 나오는 즉시 워커에 제출 (검색 페이지 순회와 상품 크롤링을 겹쳐 실행)
+    - max_in_flight: 동시에 대기시킬 최대 작업 수 (배치 처리 시 메모리 제한용)
+    - requirement: 다운스트림 리뷰 조건 (최신 N개, 제외 접두어, 최소 길이)
+    - 반환: 제출된 상품 수
+    """
+    start_time = time.time()
+    submitted = completed_count = failed_count = 0
+    pending = set()
+    
+    def collect(done) -> None:
+        nonlocal completed_count, failed_count
+        for future in done:
+            try:
+                future.result()
+                completed_count += 1
+            except Exception as e:
+                failed_count += 1
+                logger.error(f"크롤링 실패 - 에러: {str(e)}")
+    
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_crawl_worker,
+                             initargs=(scheduler, review_queue)) as executor:
+        for url in link_iter:
+            # 대기 작업이 너무 많으면 하나가 끝날 때까지 대기 (백프레셔)
+            if max_in_flight and len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            
+            pending.add(executor.submit(coupang_crawling_optimized, (url, job_id, review_mode, requirement)))
+            submitted += 1
+            logger.info(f"상품 제출: {submitted}번째 (검색 경과 {time.time() - start_time:.1f}초)")
+        
+        collect(as_completed(pending))
+    
+    logger.info(f"처리 완료 - 성공: {completed_count}, 실패: {failed_count}, "
+               f"총 소요시간: {time.time() - start_time:.1f}초")
+    return submitted
+
+def run_batch_processing(url_list: list, job_id: str, batch_size: int = 10, review_mode: str = "dom",
+                         scheduler=None, requirement: dict = None, review_queue=None) -> None:
     """배치 단위로 처리하여 메모리 사용량 최적화"""
     total_batches = (len(url_list) + batch_size - 1) // batch_size
     logger.info(f"배치 처리 시작 - 총 {total_batches}개 배치, 배치 크기: {batch_size}")
@@ -82,71 +143,341 @@ def run_batch_processing(url_list: list, job_id: str, batch_size: int = 10) -> N
         logger.info(f"배치 {batch_num}/{total_batches} 처리 중... ({len(batch_urls)}개 상품)")
         
         try:
-            run_optimized_multi_process(batch_urls, job_id)
-            
-            # 배치 간 쿨다운 (서버 부하 방지)
-            if batch_num < total_batches:
-                time.sleep(2)
+            # 서버 부하는 공유 스케줄러가 요청 단위로 관리하므로 배치 간 고정 쿨다운 없음
+            run_optimized_multi_process(batch_urls, job_id, review_mode, scheduler, requirement, review_queue)
                 
         except Exception as e:
             logger.error(f"배치 {batch_num} 처리 중 오류: {e}")
             continue
 
-async def async_crawling_run(keyword: str, max_link: int, is_crawling_running) -> None:
-    """비동기 크롤링 실행 (향후 확장용)"""
-    # 현재는 동기 함수들을 래핑만 함
-    # 향후 비동기 selenium 라이브러리 사용 시 확장 가능
-    loop = asyncio.get_event_loop()
+def run_pooled_crawling(url_list: list, job_id: str, pool, review_mode: str = "dom",
+                        requirement: dict = None) -> None:
+    """드라이버 풀의 브라우저를 재사용하여 크롤링 (풀 크기만큼 동시 실행)"""
+    if not url_list:
+        logger.warning("처리할 URL이 없습니다.")
+        return
+    
+    logger.info(f"드라이버 풀 크기: {pool.size}, 처리 대상: {len(url_list)}개 상품")
+    start_time = time.time()
     
-    # 링크 추출을 별도 스레드에서 실행
-    product_links = await loop.run_in_executor(
-        None, get_product_links_optimized, keyword, max_link
-    )
+    # 브라우저 조작은 I/O 대기 위주이므로 스레드로 충분
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        futures = [executor.submit(coupang_crawling_pooled, (url, job_id), pool, review_mode, requirement)
+                   for url in url_list]
+        for completed_count, _ in enumerate(as_completed(futures), start=1):
+            if completed_count % 5 == 0 or completed_count == len(url_list):
+                elapsed = time.time() - start_time
+                logger.info(f"진행률: {completed_count}/{len(url_list)} - 소요시간: {elapsed:.1f}초")
     
-    return product_links
+    logger.info(f"처리 완료 - 총 소요시간: {time.time() - start_time:.1f}초, 풀 통계: {pool.stats}")
 
-def crawling_run_optimized(keyword: str, max_link: int, is_crawling_running, 
-                          use_batch_processing: bool = True, batch_size: int = 15) -> None:
-    """최적화된 전체 크롤링 파이프라인"""
+def crawling_run_pooled(keyword: str, max_link: int, is_crawling_running, pool, review_mode: str = "dom",
+                        requirement: dict = None) -> None:
+    """드라이버 풀을 사용하는 전체 크롤링 파이프라인"""
     try:
-        freeze_support()
         start_time = time.time()
         job_id = generate_job_id()
+        logger.info(f"풀 크롤링 작업 시작 - Job ID: {job_id}, 키워드: '{keyword}'")
         
-        logger.info(f"크롤링 작업 시작 - Job ID: {job_id}")
-        logger.info(f"검색 키워드: '{keyword}', 최대 링크 수: {max_link}")
+        # 링크 추출도 풀의 브라우저를 사용
+        with pool.lease() as pooled:
+            pooled.page_count += 1
+            product_link_list = get_product_links_optimized(keyword, max_link, driver=pooled.driver)
+        
+        if not product_link_list:
+            logger.warning("추출된 상품 링크가 없습니다. 크롤링을 중단합니다.")
+            return
+        
+        # 워커 스레드의 리뷰를 작업 단위 파일로 모아서 저장
+        with job_review_writer(job_id, use_process=False):
+            run_pooled_crawling(product_link_list, job_id, pool, review_mode, requirement)
+        
+        total_time = time.time() - start_time
+        logger.info(f"풀 크롤링 작업 완료 - Job ID: {job_id}, 총 소요시간: {timedelta(seconds=total_time)}")
+    except Exception as e:
+        logger.error(f'풀 크롤링 작업 중 오류 발생: {e}')
+    finally:
+        # 이 프로세스의 상품 기록기에 남은 행 저장
+        flush_product_writer()
+        if is_crawling_running:
+            is_crawling_running.value = False
+
+def run_fast_path_crawling(url_list: list, job_id: str, pool, review_mode: str = "dom",
+                           requirement: dict = None) -> dict:
+    """HTTP 우선 크롤링 실행 후 경로별 처리 건수(적중률) 반환"""
+    stats = {"http": 0, "browser": 0, "failed": 0}
+    if not url_list:
+        logger.warning("처리할 URL이 없습니다.")
+        return stats
+    
+    start_time = time.time()
+    client = create_http_client(max_connections=pool.size * 2)
+    try:
+        # HTTP 요청은 브라우저보다 가벼우므로 풀 크기의 2배까지 동시 실행
+        with ThreadPoolExecutor(max_workers=pool.size * 2) as executor:
+            futures = [executor.submit(coupang_crawling_fast, (url, job_id), client, pool, review_mode, requirement)
+                       for url in url_list]
+            for future in as_completed(futures):
+                stats[future.result()] += 1
+    finally:
+        client.close()
+    
+    hit_rate = stats["http"] / len(url_list) * 100
+    logger.info(f"HTTP 경로 적중률: {hit_rate:.1f}% (HTTP {stats['http']}개, 브라우저 {stats['browser']}개, "
+               f"저장 실패 {stats['failed']}개), "
+               f"총 소요시간: {time.time() - start_time:.1f}초")
+    return stats
+
+def crawling_run_fast(keyword: str, max_link: int, is_crawling_running, pool, review_mode: str = "dom",
+                      requirement: dict = None) -> None:
+    """HTTP 우선, 브라우저 대체 방식의 전체 크롤링 파이프라인"""
+    try:
+        start_time = time.time()
+        job_id = generate_job_id()
+        logger.info(f"HTTP 우선 크롤링 작업 시작 - Job ID: {job_id}, 키워드: '{keyword}'")
+        
+        with pool.lease() as pooled:
+            pooled.page_count += 1
+            product_link_list = get_product_links_optimized(keyword, max_link, driver=pooled.driver)
+        
+        if not product_link_list:
+            logger.warning("추출된 상품 링크가 없습니다. 크롤링을 중단합니다.")
+            return
+        
+        with job_review_writer(job_id, use_process=False):
+            stats = run_fast_path_crawling(product_link_list, job_id, pool, review_mode, requirement)
+        
+        total_time = time.time() - start_time
+        logger.info(f"HTTP 우선 크롤링 작업 완료 - Job ID: {job_id}, 경로별 처리: {stats}, "
+                   f"총 소요시간: {timedelta(seconds=total_time)}")
+    except Exception as e:
+        logger.error(f'HTTP 우선 크롤링 작업 중 오류 발생: {e}')
+    finally:
+        # 이 프로세스의 상품 기록기에 남은 행 저장
+        flush_product_writer()
+        if is_crawling_running:
+            is_crawling_running.value = False
+
+class AsyncCrawlEngine:
+    """
+    asyncio 기반 크롤링 엔진
+    - 링크 탐색, 상품 크롤링(HTTP/브라우저), 리뷰 저장을 동시 태스크로 실행
+    - 브라우저 / 네트워크 / 디스크 동시 실행 수를 세마포어로 각각 제한
+    """
+
+    def __init__(self, pool, max_network: int = 8, max_disk: int = 2, review_mode: str = "dom",
+                 requirement: dict = None):
+        self.pool = pool
+        self.review_mode = review_mode
+        self.requirement = requirement
+        self.browser_sem = asyncio.Semaphore(pool.size)
+        self.network_sem = asyncio.Semaphore(max_network)
+        self.disk_sem = asyncio.Semaphore(max_disk)
+        # 블로킹 작업(selenium, httpx, parquet 저장)은 전용 스레드 풀에서 실행
+        self.executor = ThreadPoolExecutor(max_workers=pool.size + max_network + max_disk)
+        self.stats = {"http": 0, "browser": 0, "failed": 0}
+
+    async def _run_blocking(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    def _lease_and_scrape(self, product_url: str):
+        with self.pool.lease() as pooled:
+            pooled.page_count += 1
+            return scrape_product_with_driver(pooled.driver, product_url, True, self.review_mode,
+                                              self.requirement)
+
+    def _lease_and_find_links(self, keyword: str, max_link: int, loop, url_queue: asyncio.Queue) -> None:
+        with self.pool.lease() as pooled:
+            pooled.page_count += 1
+            # 찾는 즉시 이벤트 루프의 큐로 전달
+            for link in iter_product_links_optimized(keyword, max_link, driver=pooled.driver):
+                loop.call_soon_threadsafe(url_queue.put_nowait, link)
+
+    async def discover_links(self, keyword: str, max_link: int, url_queue: asyncio.Queue) -> None:
+        """링크를 찾는 대로 큐에 넣고, 끝나면(실패 포함) 종료 신호 None을 넣음"""
+        loop = asyncio.get_running_loop()
+        try:
+            async with self.browser_sem:
+                await self._run_blocking(self._lease_and_find_links, keyword, max_link, loop, url_queue)
+        finally:
+            # 스레드에서 넣은 링크(call_soon_threadsafe)가 모두 처리된 뒤에 실행되므로 종료 신호가 항상 마지막
+            url_queue.put_nowait(None)
+
+    async def crawl_product(self, product_url: str, client, job_id: str) -> None:
+        result = None
         
-        # 1단계: 상품 링크 추출
-        logger.info("1단계: 상품 링크 추출 중...")
-        link_start_time = time.time()
+        # HTTP 경로 우선 (네트워크 세마포어)
+        if client is not None:
+            async with self.network_sem:
+                try:
+                    result = await self._run_blocking(fetch_product_fast, client, product_url, 10, self.requirement)
+                    self.stats["http"] += 1
+                except Exception:
+                    result = None
+        
+        # 실패 시 브라우저 (브라우저 세마포어)
+        if result is None:
+            async with self.browser_sem:
+                try:
+                    result = await self._run_blocking(self._lease_and_scrape, product_url)
+                    self.stats["browser"] += 1
+                except Exception as e:
+                    self.stats["failed"] += 1
+                    logger.error(f"크롤링 실패 - URL: {product_url}, 에러: {e}")
+                    return
+        
+        product_dict, product_list = result
+        product_code = str(product_dict['product_code'])
+        
+        # 상품 정보 / 리뷰 저장 (디스크 세마포어)
+        async with self.disk_sem:
+            await self._run_blocking(insert_product_info_to_db, product_dict)
+            await self._run_blocking(save_reviews_to_local, product_list, product_code, job_id)
+        logger.info(f"{product_code} 크롤링 완료 - 리뷰 {len(product_list)}개")
+
+    async def run(self, keyword: str, max_link: int, job_id: str, use_http_fast_path: bool = True) -> dict:
+        url_queue = asyncio.Queue()
+        client = create_http_client() if use_http_fast_path else None
+        tasks = []
+        try:
+            producer = asyncio.create_task(self.discover_links(keyword, max_link, url_queue))
+            tasks.append(producer)
+            
+            # 링크가 들어오는 즉시 상품 크롤링 태스크 생성 (종료 신호 None까지)
+            while True:
+                url = await url_queue.get()
+                if url is None:
+                    break
+                tasks.append(asyncio.create_task(self.crawl_product(url, client, job_id)))
+            
+            await asyncio.gather(*tasks)
+        finally:
+            # 오류/취소 시 남은 태스크를 취소하고 끝날 때까지 대기
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # 실행 중인 블로킹 작업이 끝난 뒤에 반환 (이후 리뷰 기록기 종료 전에 저장이 모두 끝나도록)
+            await asyncio.to_thread(self.executor.shutdown, wait=True, cancel_futures=True)
+            if client is not None:
+                client.close()
+        return self.stats
+
+@asynccontextmanager
+async def run_in_thread(context_manager):
+    """동기 컨텍스트 매니저의 진입/종료(블로킹 join 등)를 스레드에서 실행해 이벤트 루프를 막지 않음"""
+    value = await asyncio.to_thread(context_manager.__enter__)
+    try:
+        yield value
+    except BaseException as e:
+        if not await asyncio.to_thread(context_manager.__exit__, type(e), e, e.__traceback__):
+            raise
+    else:
+        await asyncio.to_thread(context_manager.__exit__, None, None, None)
+
+async def async_crawling_run(keyword: str, max_link: int, is_crawling_running, pool=None,
+                             max_network: int = 8, max_disk: int = 2, review_mode: str = "dom",
+                             use_http_fast_path: bool = True, requirement: dict = None) -> dict:
+    """비동기 크롤링 실행 (드라이버 풀이 없으면 작업 동안만 생성)"""
+    owns_pool = pool is None
+    stats = {}
+    try:
+        start_time = time.time()
+        job_id = generate_job_id()
+        logger.info(f"비동기 크롤링 작업 시작 - Job ID: {job_id}, 키워드: '{keyword}'")
+        
+        if owns_pool:
+            pool = DriverPool()
+            await asyncio.get_running_loop().run_in_executor(None, pool.start)
+        
+        engine = AsyncCrawlEngine(pool, max_network, max_disk, review_mode, requirement)
+        async with run_in_thread(job_review_writer(job_id, use_process=False)):
+            stats = await engine.run(keyword, max_link, job_id, use_http_fast_path)
+        
+        total_time = time.time() - start_time
+        logger.info(f"비동기 크롤링 작업 완료 - Job ID: {job_id}, 경로별 처리: {stats}, "
+                   f"총 소요시간: {timedelta(seconds=total_time)}")
+        return stats
+    except Exception as e:
+        logger.error(f'비동기 크롤링 작업 중 오류 발생: {e}')
+        return stats
+    finally:
+        await asyncio.to_thread(flush_product_writer)
+        if owns_pool and pool is not None:
+            pool.close()
+        if is_crawling_running:
+            is_crawling_running.value = False
+
+def crawling_run_multi_tab(keyword: str, max_link: int, is_crawling_running, tabs: int = 4,
+                           scheduler=None, requirement: dict = None) -> None:
+    """크롬 하나에서 여러 탭으로 크롤링하는 전체 파이프라인"""
+    driver = None
+    try:
+        freeze_support()
+        init_scheduler(scheduler)
+        start_time = time.time()
+        job_id = generate_job_id()
+        logger.info(f"멀티 탭 크롤링 작업 시작 - Job ID: {job_id}, 키워드: '{keyword}', 탭 수: {tabs}")
         
-        product_link_list = get_product_links_optimized(keyword, max_link)
+        driver = setup_optimized_driver()
+        driver.set_page_load_timeout(30)
+        product_link_list = get_product_links_optimized(keyword, max_link, driver=driver)
         
         if not product_link_list:
             logger.warning("추출된 상품 링크가 없습니다. 크롤링을 중단합니다.")
             return
         
-        link_extraction_time = time.time() - link_start_time
-        logger.info(f"링크 추출 완료 - {len(product_link_list)}개 상품, "
-                   f"소요시간: {link_extraction_time:.1f}초")
+        with job_review_writer(job_id, use_process=False):
+            stats = MultiTabCrawler(driver, tabs, requirement=requirement).crawl(product_link_list, job_id)
         
-        # 2단계: 크롤링 실행
-        logger.info("2단계: 상품 정보 및 리뷰 크롤링 시작...")
+        total_time = time.time() - start_time
+        logger.info(f"멀티 탭 크롤링 작업 완료 - Job ID: {job_id}, 상품당 메모리: {stats['memory_per_product_mb']}MB, "
+                   f"총 소요시간: {timedelta(seconds=total_time)}")
+    except Exception as e:
+        logger.error(f'멀티 탭 크롤링 작업 중 오류 발생: {e}')
+    finally:
+        flush_product_writer()
+        if driver:
+            driver.quit()
+        if is_crawling_running:
+            is_crawling_running.value = False
+
+def crawling_run_optimized(keyword: str, max_link: int, is_crawling_running, 
+                          use_batch_processing: bool = True, batch_size: int = 15,
+                          review_mode: str = "dom", scheduler=None, requirement: dict = None,
+                          upload: bool = False) -> None:
+    """
+    최적화된 전체 크롤링 파이프라인
+    - upload: 리뷰 파일이 닫힐 때마다 크롤링과 동시에 GCS 업로드 (작업 종료 시 마지막 파일까지 업로드 완료)
+    """
+    try:
+        freeze_support()
+        init_scheduler(scheduler)
+        start_time = time.time()
+        job_id = generate_job_id()
         
-        if use_batch_processing and len(product_link_list) > batch_size:
-            # 대량 데이터의 경우 배치 처리
-            run_batch_processing(product_link_list, job_id, batch_size)
-        else:
-            # 소량 데이터의 경우 일반 멀티프로세싱
-            run_optimized_multi_process(product_link_list, job_id)
+        logger.info(f"크롤링 작업 시작 - Job ID: {job_id}")
+        logger.info(f"검색 키워드: '{keyword}', 최대 링크 수: {max_link}")
+        
+        # 1-2단계: 검색 페이지를 순회하며 찾은 상품을 바로 크롤링 워커에 전달
+        logger.info("상품 링크 추출 및 크롤링 동시 진행...")
+        optimal_processes = max(1, min(max_link, int(cpu_count() * 0.8)))
+        link_iter = iter_product_links_optimized(keyword, max_link)
+        max_in_flight = batch_size if use_batch_processing else None
+        
+        # 모든 워커 프로세스의 리뷰를 기록기 프로세스 하나가 작업 단위 파일로 저장
+        with job_review_writer(job_id, upload=upload) as review_queue:
+            product_count = run_streaming_multi_process(link_iter, job_id, optimal_processes, review_mode,
+                                                        scheduler, max_in_flight, requirement, review_queue)
+        
+        if not product_count:
+            logger.warning("추출된 상품 링크가 없습니다. 크롤링을 중단합니다.")
+            return
         
-        # 3단계: 후처리 (GCS 업로드, 알림 등)
-        # try:
-        #     logger.info("3단계: 데이터 업로드 중...")
-        #     storage_dir = upload_parquet_to_gcs(job_id)
-        #     notify_spark_server(storage_dir)
-        # except Exception as e:
-        #     logger.error(f'데이터 업로드 실패: {e}')
+        # 3단계: 후처리 (알림 등)
+        # - GCS 업로드는 upload=True일 때 기록기가 크롤링 중에 진행하고 위 with 블록 종료 시 완료됨
+        # if upload:
+        #     notify_spark_server(f'review_data/{datetime.today().strftime("%Y-%m-%d")}/{job_id}/')
         
         # 완료 처리
         total_time = time.time() - start_time
@@ -155,9 +486,9 @@ def crawling_run_optimized(keyword: str, max_link: int, is_crawling_running,
         logger.info("="*50)
         logger.info("크롤링 작업 완료!")
         logger.info(f"- Job ID: {job_id}")
-        logger.info(f"- 처리된 상품 수: {len(product_link_list)}개")
+        logger.info(f"- 처리된 상품 수: {product_count}개")
         logger.info(f"- 총 소요시간: {completion_time}")
-        logger.info(f"- 평균 처리시간: {total_time/len(product_link_list):.2f}초/상품")
+        logger.info(f"- 평균 처리시간: {total_time/product_count:.2f}초/상품")
         logger.info("="*50)
         
     except Exception as e:
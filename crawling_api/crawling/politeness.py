@@ -0,0 +1,75 @@
+import time
+import threading
+
+
+class _LocalValue:
+    """Manager.Value와 같은 인터페이스의 프로세스 내부용 값"""
+
+    def __init__(self, value):
+        self.value = value
+
+
+class PolitenessScheduler:
+    """
+    호스트(coupang.com) 단위 요청 간격 스케줄러
+    - 토큰 버킷(GCRA): 전체 워커 합산 요청 속도를 1/delay 로 제한, burst 만큼 몰아서 허용
+    - 적응형 지연: 정상 응답이면 delay를 줄이고, 차단/실패면 늘림
+    - Manager로 생성하면 프로세스 간 공유 가능 (프록시는 pickle 가능)
+    """
+
+    def __init__(self, lock, next_slot, delay, min_delay: float = 0.3, max_delay: float = 10.0,
+                 burst: int = 2, decrease: float = 0.9, increase: float = 2.0):
+        self.lock = lock
+        self.next_slot = next_slot
+        self.delay = delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.burst = burst
+        self.decrease = decrease
+        self.increase = increase
+
+    @classmethod
+    def create(cls, manager=None, initial_delay: float = 1.0, **kwargs):
+        """manager가 있으면 프로세스 간 공유, 없으면 스레드 간 공유 스케줄러 생성"""
+        if manager is not None:
+            return cls(manager.Lock(), manager.Value('d', 0.0), manager.Value('d', initial_delay), **kwargs)
+        return cls(threading.Lock(), _LocalValue(0.0), _LocalValue(initial_delay), **kwargs)
+
+    def wait(self) -> float:
+        """다음 요청 슬롯까지 대기 후 실제 대기한 시간(초) 반환"""
+        with self.lock:
+            now = time.time()
+            delay = self.delay.value
+            # burst 만큼은 과거 슬롯을 당겨 쓸 수 있음
+            slot = max(self.next_slot.value, now - (self.burst - 1) * delay)
+            self.next_slot.value = slot + delay
+        wait_sec = slot - now
+        if wait_sec > 0:
+            time.sleep(wait_sec)
+            return wait_sec
+        return 0.0
+
+    def report(self, healthy: bool) -> None:
+        """응답 상태를 반영하여 요청 간격 조정"""
+        with self.lock:
+            if healthy:
+                self.delay.value = max(self.min_delay, self.delay.value * self.decrease)
+            else:
+                self.delay.value = min(self.max_delay, self.delay.value * self.increase)
+
+
+# 워커 프로세스에서 사용할 스케줄러 (Pool initializer로 주입)
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+def init_scheduler(scheduler: PolitenessScheduler) -> None:
+    global _scheduler
+    _scheduler = scheduler
+
+def get_scheduler() -> PolitenessScheduler:
+    """주입된 공유 스케줄러, 없으면 프로세스 로컬 스케줄러"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = PolitenessScheduler.create()
+    return _scheduler
@@ -0,0 +1,138 @@
+import os
+import time
+import logging
+import threading
+import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+
+logger = logging.getLogger(__name__)
+
+# 상품 DB 접속 정보 및 배치 설정 (환경 변수로 조정 가능)
+PRODUCT_DB_CONFIG = {
+    "host": os.environ.get("PRODUCT_DB_HOST", "127.0.0.1"),
+    "dbname": os.environ.get("PRODUCT_DB_NAME", "postgres"),
+    "user": os.environ.get("PRODUCT_DB_USER", "postgres"),
+    "password": os.environ.get("PRODUCT_DB_PASSWORD", "todn12"),
+    "port": int(os.environ.get("PRODUCT_DB_PORT", 2345)),
+}
+PRODUCT_BATCH_SIZE = int(os.environ.get("PRODUCT_BATCH_SIZE", 200))
+PRODUCT_FLUSH_INTERVAL = float(os.environ.get("PRODUCT_FLUSH_INTERVAL", 2))
+PRODUCT_POOL_SIZE = int(os.environ.get("PRODUCT_POOL_SIZE", 2))
+
+INSERT_PRODUCTS_SQL = """
+    INSERT INTO {table}
+        (id, name, rating, review_count, price, tag, image_url)
+    VALUES %s
+    ON CONFLICT (id) DO NOTHING;
+"""
+
+
+def product_insert_sql(table: str = "product", values: str = "%s") -> sql.Composed:
+    """대상 테이블("스키마.테이블" 가능)을 식별자로 넣은 INSERT 문"""
+    template = INSERT_PRODUCTS_SQL.replace("VALUES %s", f"VALUES {values}")
+    return sql.SQL(template).format(table=sql.Identifier(*table.split(".")))
+
+
+def product_row(product: dict) -> tuple:
+    return (
+        product.get("product_code"),
+        product.get("name"),
+        product.get("star_rating"),
+        product.get("review_count"),
+        product.get("final_price"),
+        product.get("tag"),
+        product.get("image_url"),
+    )
+
+
+class ProductWriter:
+    """
+    프로세스당 하나씩 두는 상품 정보 DB 기록기
+    - 상품 행을 모아 두었다가 batch_size개가 되거나 flush_interval이 지나면 execute_values로 한 번에 INSERT
+    - 커넥션은 풀에서 빌려 쓰고 반납 (상품마다 새 커넥션을 열지 않음)
+    - table: 저장할 테이블 (벤치마크는 별도 스키마의 테이블을 지정)
+    """
+
+    def __init__(self, batch_size: int = PRODUCT_BATCH_SIZE, flush_interval: float = PRODUCT_FLUSH_INTERVAL,
+                 db_config: dict = None, pool_size: int = PRODUCT_POOL_SIZE, table: str = "product"):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.insert_sql = product_insert_sql(table)
+        self.pool = ThreadedConnectionPool(1, pool_size, **(db_config or PRODUCT_DB_CONFIG))
+        self.buffer = []
+        self.stats = {"rows": 0, "batches": 0, "failed": 0}
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._timer = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._timer.start()
+
+    def add(self, product: dict) -> None:
+        with self._lock:
+            self.buffer.append(product_row(product))
+            full = len(self.buffer) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """모아 둔 행을 한 트랜잭션으로 저장하고 저장한 행 수 반환"""
+        with self._lock:
+            rows, self.buffer = self.buffer, []
+        if not rows:
+            return 0
+
+        conn = self.pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                execute_values(cur, self.insert_sql, rows, page_size=len(rows))
+            conn.commit()
+            self.stats["rows"] += len(rows)
+            self.stats["batches"] += 1
+            print(f"[INFO] 상품 정보 DB 저장 완료: {len(rows)}개")
+            return len(rows)
+        except psycopg2.Error as e:
+            conn.rollback()
+            self.stats["failed"] += len(rows)
+            print(f"[ERROR] 상품 정보 DB 저장 실패 ({len(rows)}개): {e}")
+            return 0
+        finally:
+            self.pool.putconn(conn)
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"상품 정보 주기 저장 실패: {e}")
+
+    def close(self) -> dict:
+        if not self._closed.is_set():
+            self._closed.set()
+            self._timer.join()
+            self.flush()
+            self.pool.closeall()
+        return self.stats
+
+
+_writer = None
+_writer_pid = None
+_writer_lock = threading.Lock()
+
+def get_product_writer() -> ProductWriter:
+    """
+    현재 프로세스의 상품 기록기 (fork된 워커는 부모의 기록기를 쓰지 않고 새로 생성)
+    - Pool 종료(terminate) 시 워커의 종료 훅은 실행되지 않으므로 작업이 끝날 때 flush_product_writer를 호출해야 함
+    """
+    global _writer, _writer_pid
+    with _writer_lock:
+        if _writer is None or _writer_pid != os.getpid():
+            _writer = ProductWriter()
+            _writer_pid = os.getpid()
+        return _writer
+
+def flush_product_writer() -> int:
+    """현재 프로세스 기록기의 남은 행 저장 (기록기가 없으면 아무것도 하지 않음)"""
+    with _writer_lock:
+        writer = _writer if _writer_pid == os.getpid() else None
+    return writer.flush() if writer is not None else 0
@@ -0,0 +1,129 @@
+import re
+import json
+import base64
+import logging
+from queue import Queue, Empty
+from datetime import datetime, timezone, timedelta
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+import undetected_chromedriver as uc
+
+logger = logging.getLogger(__name__)
+
+# 리뷰 목록 XHR 주소 패턴 (JSON 응답만)
+# - /vp/product/reviews는 HTML 조각을 돌려주므로 제외 (http_fast_path.parse_review_html로 처리)
+REVIEW_API_PATTERN = re.compile(r"/next-api/review\b")
+# 서버 렌더링 리뷰 목록 조각(HTML) 경로
+REVIEW_FRAGMENT_PATH = "/vp/product/reviews"
+
+KST = timezone(timedelta(hours=9))
+
+# 최신순 정렬 값 (증분 수집 시 사용)
+REVIEW_SORT_BY_DATE = "DATE_DESC"
+
+# URL의 쿼리 파라미터 교체
+def with_query_params(url: str, **params) -> str:
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query, keep_blank_values=True)
+    for key, value in params.items():
+        query[key] = [str(value)]
+    return urlunparse(parsed._replace(query=urlencode(query, doseq=True)))
+
+# URL의 page 파라미터 교체
+def with_page_param(url: str, page: int) -> str:
+    return with_query_params(url, page=page)
+
+# 리뷰 등록 시각을 DOM과 같은 "YYYY.MM.DD" 형식으로 변환
+def format_review_date(value) -> str:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1000, tz=KST).strftime("%Y.%m.%d")
+    return str(value)[:10].replace('-', '.')
+
+def _find_review_container(payload: dict) -> dict:
+    """응답 JSON에서 리뷰 목록(contents)을 가진 객체를 찾음"""
+    if not isinstance(payload, dict):
+        return None
+    for key in ('rData', 'data'):
+        if isinstance(payload.get(key), dict):
+            found = _find_review_container(payload[key])
+            if found is not None:
+                return found
+    if isinstance(payload.get('paging'), dict):
+        return payload['paging']
+    if isinstance(payload.get('contents'), list):
+        return payload
+    return None
+
+def parse_review_payload(payload: dict, product_code: str):
+    """
+    리뷰 목록 JSON을 DOM 추출과 같은 형태의 리뷰 리스트로 변환
+    - 반환: (리뷰 리스트, 전체 페이지 수) / 알 수 없는 형태면 (None, None)
+    """
+    container = _find_review_container(payload)
+    if container is None:
+        return None, None
+
+    reviews = []
+    for item in container.get('contents') or []:
+        rating = item.get('rating')
+        reviews.append({
+            'product_code': product_code,
+            'review_rating': str(rating) if rating is not None else None,
+            'review_date': format_review_date(item.get('reviewAt', item.get('createdAt'))),
+            'review_content': item.get('content')
+        })
+    return reviews, container.get('totalPage')
+
+
+class ReviewNetworkCapture:
+    """CDP Network 이벤트로 리뷰 목록 XHR 응답 본문을 수집"""
+
+    def __init__(self, driver: uc.Chrome, url_pattern=REVIEW_API_PATTERN):
+        self.driver = driver
+        self.url_pattern = url_pattern
+        self._pending = {}
+        self._ready = Queue()
+        self.last_url = None
+
+    def _on_response(self, message: dict) -> None:
+        params = message.get('params', {})
+        url = params.get('response', {}).get('url', '')
+        if self.url_pattern.search(url):
+            self._pending[params.get('requestId')] = url
+
+    def _on_loading_finished(self, message: dict) -> None:
+        request_id = message.get('params', {}).get('requestId')
+        url = self._pending.pop(request_id, None)
+        if url is not None:
+            self._ready.put((request_id, url))
+
+    def start(self) -> None:
+        # 상품 페이지 로드 전에 호출해야 첫 페이지 응답도 수집됨
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.add_cdp_listener("Network.responseReceived", self._on_response)
+        self.driver.add_cdp_listener("Network.loadingFinished", self._on_loading_finished)
+
+    def stop(self) -> None:
+        try:
+            self.driver.clear_cdp_listeners()
+            self.driver.execute_cdp_cmd("Network.disable", {})
+        except Exception:
+            pass
+
+    def next_payload(self, timeout: float = 10):
+        """다음 리뷰 응답 JSON을 반환 (시간 초과 시 None)"""
+        try:
+            request_id, url = self._ready.get(timeout=timeout)
+        except Empty:
+            return None
+        try:
+            body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            text = body['body']
+            if body.get('base64Encoded'):
+                text = base64.b64decode(text).decode('utf-8')
+            self.last_url = url
+            return json.loads(text)
+        except Exception as e:
+            logger.warning(f"리뷰 응답 본문 읽기 실패: {url}, {e}")
+            return None
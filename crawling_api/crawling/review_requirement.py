@@ -0,0 +1,61 @@
+from crawling.review_watermark import filter_new_reviews
+
+
+class ReviewBudget:
+    """
+    다운스트림(transform)이 실제로 사용하는 리뷰 조건
+    - newest_n: 상품별로 필요한 최신 리뷰 수 (None이면 제한 없음)
+    - exclude_prefixes: 이 문자열로 시작하는 리뷰는 제외 (예: "쿠팡체험단")
+    - min_length: 리뷰 내용 최소 길이
+    """
+
+    def __init__(self, newest_n: int = None, exclude_prefixes=(), min_length: int = 0):
+        self.newest_n = newest_n
+        self.exclude_prefixes = tuple(exclude_prefixes or ())
+        self.min_length = min_length or 0
+
+    @classmethod
+    def from_dict(cls, requirement: dict):
+        if not requirement:
+            return None
+        return cls(requirement.get('newest_n'), requirement.get('exclude_prefixes'), requirement.get('min_length'))
+
+    def accepts(self, review: dict) -> bool:
+        content = review.get('review_content') or ''
+        if self.exclude_prefixes and content.startswith(self.exclude_prefixes):
+            return False
+        return len(content) >= self.min_length
+
+
+class ReviewCollector:
+    """
+    페이지 단위로 리뷰를 모으면서 워터마크/리뷰 조건에 따라 수집 중단 여부를 판단
+    - 워터마크나 최신 N개 조건은 최신순 정렬을 전제로 함
+    """
+
+    def __init__(self, watermark=None, budget: ReviewBudget = None):
+        self.watermark = watermark
+        self.budget = budget
+        self.reviews = []
+
+    @property
+    def needs_newest_first(self) -> bool:
+        return self.watermark is not None or bool(self.budget and self.budget.newest_n)
+
+    def disable_ordering(self) -> None:
+        """최신순 정렬을 못 하는 경우: 순서에 의존하는 조기 중단을 끔 (필터 조건은 유지)"""
+        self.watermark = None
+        if self.budget:
+            self.budget = ReviewBudget(None, self.budget.exclude_prefixes, self.budget.min_length)
+
+    def add_page(self, page_reviews: list) -> bool:
+        """한 페이지 리뷰를 추가하고, 더 이상 페이지를 볼 필요가 없으면 True 반환"""
+        new_reviews, reached = filter_new_reviews(page_reviews, self.watermark)
+        if self.budget:
+            new_reviews = [r for r in new_reviews if self.budget.accepts(r)]
+            if self.budget.newest_n:
+                remaining = self.budget.newest_n - len(self.reviews)
+                self.reviews.extend(new_reviews[:remaining])
+                return reached or len(self.reviews) >= self.budget.newest_n
+        self.reviews.extend(new_reviews)
+        return reached
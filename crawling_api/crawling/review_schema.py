@@ -0,0 +1,44 @@
+import pandas as pd
+import pyarrow as pa
+
+# 크롤링 리뷰 parquet 스키마 (저장 시 항상 이 스키마로 변환)
+REVIEW_SCHEMA = pa.schema([
+    ('product_code', pa.int64()),
+    ('review_rating', pa.int8()),
+    ('review_date', pa.date32()),
+    ('review_content', pa.string()),
+])
+
+REVIEW_COLUMNS = REVIEW_SCHEMA.names
+
+# 값 종류가 적은 컬럼은 dictionary 인코딩, 용량 대부분인 리뷰 본문은 zstd 압축
+PARQUET_WRITE_OPTIONS = {
+    "use_dictionary": ['product_code', 'review_rating', 'review_date'],
+    "compression": {
+        'product_code': 'snappy',
+        'review_rating': 'snappy',
+        'review_date': 'snappy',
+        'review_content': 'zstd',
+    },
+}
+
+
+def normalize_review_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    크롤링한 리뷰(문자열 값)를 스키마 타입에 맞게 변환
+    - review_date: "YYYY.MM.DD" / "YYYY-MM-DD" 문자열 또는 날짜 → date (해석 불가 시 null)
+    - 이미 변환된 값(이전에 저장한 typed parquet)은 그대로 유지
+    """
+    df = df.reindex(columns=REVIEW_COLUMNS)
+    df['product_code'] = pd.to_numeric(df['product_code'], errors='coerce').astype('Int64')
+    df['review_rating'] = pd.to_numeric(df['review_rating'], errors='coerce').round().astype('Int8')
+    dates = pd.to_datetime(df['review_date'].astype('string').str.replace('.', '-', regex=False).str[:10],
+                           format="%Y-%m-%d", errors='coerce')
+    df['review_date'] = dates.dt.date.where(dates.notna(), None)
+    df['review_content'] = df['review_content'].astype('string')
+    return df
+
+def to_review_table(reviews) -> pa.Table:
+    """리뷰 리스트(dict) 또는 DataFrame을 REVIEW_SCHEMA 테이블로 변환"""
+    df = reviews if isinstance(reviews, pd.DataFrame) else pd.DataFrame(list(reviews), columns=REVIEW_COLUMNS)
+    return pa.Table.from_pandas(normalize_review_frame(df), schema=REVIEW_SCHEMA, preserve_index=False)
@@ -0,0 +1,84 @@
+import hashlib
+import sqlite3
+from crawling.freshness_index import CRAWL_INDEX_PATH, FreshnessIndex
+
+
+# 리뷰 내용 해시 (같은 날짜의 리뷰를 구분하기 위함)
+def review_hash(review: dict) -> str:
+    content = review.get('review_content') or ''
+    return hashlib.md5(content.encode('utf-8')).hexdigest()
+
+def filter_new_reviews(reviews: list, watermark):
+    """
+    최신순으로 정렬된 리뷰에서 워터마크 이전(새) 리뷰만 반환
+    - 반환: (새 리뷰 리스트, 워터마크 도달 여부)
+    """
+    if watermark is None:
+        return reviews, False
+    wm_date, wm_hash = watermark
+    new_reviews = []
+    for review in reviews:
+        date = review.get('review_date')
+        # "YYYY.MM.DD" 형식이라 문자열 비교로 날짜 비교 가능
+        if date is not None and (date < wm_date or (date == wm_date and review_hash(review) == wm_hash)):
+            return new_reviews, True
+        new_reviews.append(review)
+    return new_reviews, False
+
+
+class ReviewWatermark:
+    """상품별로 마지막 수집한 가장 최신 리뷰(날짜 + 내용 해시)를 저장 (신선도 인덱스와 같은 DB 사용)"""
+
+    def __init__(self, path: str = CRAWL_INDEX_PATH):
+        self.path = path
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS review_watermark (
+                    product_code TEXT PRIMARY KEY,
+                    review_date TEXT,
+                    content_hash TEXT
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, product_code: str):
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT review_date, content_hash FROM review_watermark WHERE product_code = ?",
+                (str(product_code),)
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def update(self, product_code: str, reviews: list) -> None:
+        """새로 수집한 리뷰 중 가장 최신 리뷰로 워터마크 갱신 (새 리뷰가 없으면 유지)"""
+        dated = [r for r in reviews if r.get('review_date')]
+        if not dated:
+            return
+        newest_date = max(r['review_date'] for r in dated)
+        # 같은 날짜면 목록에서 먼저 나온(더 최신) 리뷰 기준
+        newest = next(r for r in dated if r['review_date'] == newest_date)
+        with self._connect() as conn:
+            conn.execute("""
+                INSERT INTO review_watermark (product_code, review_date, content_hash) VALUES (?, ?, ?)
+                ON CONFLICT(product_code) DO UPDATE SET
+                    review_date = excluded.review_date,
+                    content_hash = excluded.content_hash
+                WHERE excluded.review_date >= review_watermark.review_date
+            """, (str(product_code), newest_date, review_hash(newest)))
+
+
+def record_collected(products: dict, output_path: str) -> list:
+    """
+    저장이 끝난 상품을 신선도 인덱스와 워터마크에 기록 (다음 작업에서 최근에 수집한 상품/리뷰를 건너뛸 수 있도록)
+    - products: {product_code: 리뷰 리스트}
+    - 반환: 기록한 product_code 리스트
+    """
+    if not products:
+        return []
+    freshness, watermark = FreshnessIndex(), ReviewWatermark()
+    for product_code, reviews in products.items():
+        freshness.record_crawl(product_code, output_path)
+        watermark.update(product_code, reviews)
+    return list(products)
@@ -0,0 +1,255 @@
+import os
+import time
+import json
+import zlib
+import queue
+import logging
+import threading
+import multiprocessing
+from contextlib import contextmanager
+from datetime import datetime
+import pyarrow.parquet as pq
+from crawling.review_watermark import record_collected
+from crawling.review_schema import REVIEW_SCHEMA, PARQUET_WRITE_OPTIONS, to_review_table
+from crawling.gcs_upload import WriteBehindUploader
+
+logger = logging.getLogger(__name__)
+
+# 작업 단위 리뷰 저장 기본 설정 (환경 변수로 조정 가능)
+REVIEW_HASH_BUCKETS = int(os.environ.get("REVIEW_HASH_BUCKETS", 1))
+REVIEW_ROW_GROUP_ROWS = int(os.environ.get("REVIEW_ROW_GROUP_ROWS", 5000))
+REVIEW_FILE_MAX_ROWS = int(os.environ.get("REVIEW_FILE_MAX_ROWS", 500000))
+REVIEW_FLUSH_INTERVAL = float(os.environ.get("REVIEW_FLUSH_INTERVAL", 5))
+REVIEW_FILE_MAX_SECONDS = float(os.environ.get("REVIEW_FILE_MAX_SECONDS", 60))
+REVIEW_QUEUE_SIZE = int(os.environ.get("REVIEW_QUEUE_SIZE", 256))
+# 큐가 가득 찬 채로 이 시간이 지나면 기록기가 멈춘 것으로 보고 오류 (생산자가 무한 대기하지 않도록)
+REVIEW_PUT_TIMEOUT = float(os.environ.get("REVIEW_PUT_TIMEOUT", 60))
+
+MANIFEST_FILE = "_manifest.json"
+
+# 작업 종료 신호
+STOP = None
+
+# 워커 프로세스/스레드가 리뷰를 보낼 큐 (없으면 상품별 파일로 저장)
+_review_sink = None
+
+def init_review_sink(review_queue) -> None:
+    global _review_sink
+    _review_sink = review_queue
+
+def get_review_sink():
+    return _review_sink
+
+
+class ReviewWriterError(RuntimeError):
+    """리뷰 기록기가 실패했거나 큐를 비우지 않는 경우"""
+
+
+def send_reviews(product_code: str, reviews: list) -> bool:
+    """리뷰 기록기가 실행 중이면 큐로 넘기고 True 반환 (기록기가 멈춰 있으면 ReviewWriterError)"""
+    sink = get_review_sink()
+    if sink is None:
+        return False
+    try:
+        sink.put((str(product_code), reviews), timeout=REVIEW_PUT_TIMEOUT)
+    except queue.Full:
+        raise ReviewWriterError(f"리뷰 기록기가 {REVIEW_PUT_TIMEOUT}초 동안 큐를 비우지 않았습니다. (기록기 종료 여부 확인)")
+    return True
+
+
+class JobReviewWriter:
+    """
+    작업 하나의 리뷰를 큐로 받아 소수의 큰 parquet 파일에 row group 단위로 이어 씀
+    - 파일 위치: review_data/{날짜}/{job_id}/part-b{버킷}-{순번}.parquet (버킷은 product_code 해시)
+    - 파일이 닫힌 뒤에 신선도 인덱스/워터마크를 기록 (쓰다 만 파일 기준으로 기록하지 않음)
+    - 종료 시 파일별 행 수를 담은 _manifest.json 작성
+    - upload=True면 닫힌 파일을 크롤링 중에 바로 GCS로 업로드하고, 종료 시 마지막 파일까지 업로드를 기다림
+    """
+
+    def __init__(self, job_id: str, review_queue, hash_buckets: int = REVIEW_HASH_BUCKETS,
+                 row_group_rows: int = REVIEW_ROW_GROUP_ROWS, max_file_rows: int = REVIEW_FILE_MAX_ROWS,
+                 flush_interval: float = REVIEW_FLUSH_INTERVAL, max_file_seconds: float = REVIEW_FILE_MAX_SECONDS,
+                 base_dir: str = "review_data", upload: bool = False):
+        self.job_id = job_id
+        self.queue = review_queue
+        self.hash_buckets = max(1, hash_buckets)
+        self.row_group_rows = row_group_rows
+        self.max_file_rows = max_file_rows
+        self.flush_interval = flush_interval
+        self.max_file_seconds = max_file_seconds
+        self.upload = upload
+        self.uploader = None
+        self.date = datetime.today().strftime("%Y-%m-%d")
+        self.dir_name = f'{base_dir}/{self.date}/{job_id}/'
+        os.makedirs(self.dir_name, exist_ok=True)
+
+        self.buffers = {b: [] for b in range(self.hash_buckets)}
+        # 버킷별로 현재 열린 파일에 들어간 상품 (파일을 닫을 때 기록)
+        self.pending = {b: {} for b in range(self.hash_buckets)}
+        self.open_files = {}
+        self.opened_at = {}
+        self.files = []
+
+    def bucket_of(self, product_code: str) -> int:
+        return zlib.crc32(str(product_code).encode('utf-8')) % self.hash_buckets
+
+    def add(self, product_code: str, reviews: list) -> None:
+        bucket = self.bucket_of(product_code)
+        self.buffers[bucket].extend(dict(review, product_code=str(product_code)) for review in reviews)
+        self.pending[bucket][str(product_code)] = reviews
+        if len(self.buffers[bucket]) >= self.row_group_rows:
+            self.flush(bucket)
+
+    def _open(self, bucket: int):
+        if bucket not in self.open_files:
+            seq = sum(1 for entry in self.files if entry['bucket'] == bucket)
+            file_name = f"part-b{bucket:02d}-{seq:04d}.parquet"
+            entry = {"path": file_name, "bucket": bucket, "rows": 0, "row_groups": 0, "products": []}
+            writer = pq.ParquetWriter(os.path.join(self.dir_name, file_name), REVIEW_SCHEMA,
+                                      **PARQUET_WRITE_OPTIONS)
+            self.open_files[bucket] = (writer, entry)
+            self.opened_at[bucket] = time.time()
+            self.files.append(entry)
+        return self.open_files[bucket]
+
+    def flush(self, bucket: int) -> None:
+        """버퍼를 row group 하나로 기록 (파일 최대 행 수를 넘으면 파일을 닫고 다음 파일로)"""
+        rows = self.buffers[bucket]
+        if rows:
+            writer, entry = self._open(bucket)
+            writer.write_table(to_review_table(rows), row_group_size=len(rows))
+            entry['rows'] += len(rows)
+            entry['row_groups'] += 1
+            self.buffers[bucket] = []
+        elif bucket not in self.open_files:
+            # 리뷰가 없는 상품만 남은 경우 기록할 파일이 없으므로 바로 확정
+            self._commit(bucket, self.dir_name)
+            return
+
+        # 파일이 크거나 오래 열려 있으면 닫아서 업로드할 수 있게 함 (새 행이 없는 주기에도 확인)
+        _, entry = self.open_files[bucket]
+        if entry['rows'] >= self.max_file_rows or time.time() - self.opened_at[bucket] >= self.max_file_seconds:
+            self.close_file(bucket)
+
+    def flush_all(self) -> None:
+        for bucket in range(self.hash_buckets):
+            self.flush(bucket)
+
+    def close_file(self, bucket: int) -> None:
+        if bucket not in self.open_files:
+            return
+        writer, entry = self.open_files.pop(bucket)
+        writer.close()
+        file_path = os.path.join(self.dir_name, entry['path'])
+        self._commit(bucket, file_path, entry)
+        if self.uploader is not None:
+            self.uploader.submit(file_path)
+
+    def _commit(self, bucket: int, output_path: str, entry: dict = None) -> None:
+        # 확정할 상품이 없으면 인덱스 DB를 열지 않음
+        if not self.pending[bucket]:
+            return
+        products = record_collected(self.pending[bucket], output_path)
+        if entry is not None:
+            entry['products'].extend(products)
+        self.pending[bucket] = {}
+
+    def close(self) -> dict:
+        self.flush_all()
+        for bucket in list(self.open_files):
+            self.close_file(bucket)
+
+        manifest = {
+            "job_id": self.job_id,
+            "date": self.date,
+            "hash_buckets": self.hash_buckets,
+            "total_rows": sum(entry['rows'] for entry in self.files),
+            "product_count": sum(len(entry['products']) for entry in self.files),
+            "files": self.files,
+        }
+        manifest_path = os.path.join(self.dir_name, MANIFEST_FILE)
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+        # 업로드 배리어: 마지막 파일과 manifest까지 업로드되면 종료
+        if self.uploader is not None:
+            self.uploader.submit(manifest_path)
+            logger.info(f"GCS 업로드 결과 - Job ID: {self.job_id}, {self.uploader.close()}")
+        return manifest
+
+    def run(self) -> dict:
+        """STOP을 받을 때까지 큐를 비우며 기록 (flush_interval마다 버퍼를 row group으로 기록)"""
+        if self.upload:
+            self.uploader = WriteBehindUploader().start()
+
+        last_flush = time.time()
+        while True:
+            if time.time() - last_flush >= self.flush_interval:
+                self.flush_all()
+                last_flush = time.time()
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                # 들어온 리뷰가 없어도 오래 열린 파일은 닫음 (버퍼가 비어 있으면 파일 닫기만 확인)
+                self.flush_all()
+                last_flush = time.time()
+                continue
+            if item is STOP:
+                break
+            product_code, reviews = item
+            try:
+                self.add(product_code, reviews)
+            except Exception as e:
+                logger.error(f"{product_code} 리뷰 기록 실패: {e}")
+
+        manifest = self.close()
+        logger.info(f"리뷰 저장 완료 - Job ID: {self.job_id}, 파일 {len(manifest['files'])}개, "
+                    f"리뷰 {manifest['total_rows']}개, 상품 {manifest['product_count']}개")
+        return manifest
+
+
+def run_review_writer(job_id: str, review_queue, failed=None, **options) -> dict:
+    try:
+        return JobReviewWriter(job_id, review_queue, **options).run()
+    except Exception:
+        logger.exception(f"리뷰 기록기 실패 - Job ID: {job_id}")
+        # 생산자/작업 쪽에서 실패를 알 수 있도록 표시
+        if failed is not None:
+            failed.set()
+        raise
+
+@contextmanager
+def job_review_writer(job_id: str, use_process: bool = True, **options):
+    """
+    작업 동안 리뷰 기록기를 실행하고 현재 프로세스의 리뷰 저장을 큐로 연결
+    - use_process: 워커가 프로세스면 True (multiprocessing 큐 + 기록 프로세스), 스레드면 False
+    - 반환되는 큐는 워커 프로세스 initializer에서 init_review_sink로 연결해야 함
+    - 기록기가 실패하면 작업 종료 시 ReviewWriterError
+    """
+    if use_process:
+        review_queue = multiprocessing.Queue(maxsize=REVIEW_QUEUE_SIZE)
+        failed = multiprocessing.Event()
+        worker = multiprocessing.Process(target=run_review_writer, args=(job_id, review_queue, failed),
+                                         kwargs=options)
+    else:
+        review_queue = queue.Queue(maxsize=REVIEW_QUEUE_SIZE)
+        failed = threading.Event()
+        worker = threading.Thread(target=run_review_writer, args=(job_id, review_queue, failed), kwargs=options,
+                                  daemon=True)
+    worker.start()
+    init_review_sink(review_queue)
+    try:
+        yield review_queue
+    finally:
+        init_review_sink(None)
+        stopped = False
+        if worker.is_alive():
+            try:
+                review_queue.put(STOP, timeout=REVIEW_PUT_TIMEOUT)
+                stopped = True
+            except queue.Full:
+                logger.error(f"리뷰 기록기에 종료 신호를 보내지 못했습니다. - Job ID: {job_id}")
+        # 종료 신호를 못 보냈으면 무한 대기하지 않음
+        worker.join(None if stopped else REVIEW_PUT_TIMEOUT)
+        if failed.is_set() or worker.is_alive():
+            raise ReviewWriterError(f"리뷰 기록기가 정상 종료되지 않았습니다. - Job ID: {job_id}")
@@ -1,9 +1,17 @@
 from contextlib import asynccontextmanager
 from crawling.crawling_pipeline import crawling_run
-from crawling.optimized_crawling_pipeline import crawling_run_optimized, quick_test_crawling
+from crawling.optimized_crawling_pipeline import (
+    crawling_run_optimized, crawling_run_pooled, crawling_run_fast, async_crawling_run,
+    crawling_run_multi_tab, quick_test_crawling
+)
+from crawling.driver_pool import DriverPool
+from crawling.compaction import compact_review_data
+from crawling.politeness import PolitenessScheduler, init_scheduler
 from model.crawling_model import CrawlRequest,crawlResponse
 from fastapi import FastAPI, HTTPException, Query
 from multiprocessing import Process, Manager, freeze_support
+import threading
+import asyncio
 import uvicorn
 import time
 
@@ -21,13 +29,32 @@ async def lifespan(app:FastAPI):
     # manager와 status를 app.state에 저장하여 전역적으로 접근 가능
     app.state.manager = Manager()
     app.state.is_crawling_running = app.state.manager.Value('b', False)
+
+    # coupang.com 요청 간격을 모든 작업/워커가 공유 (Manager 프록시로 프로세스 간 공유)
+    app.state.scheduler = PolitenessScheduler.create(app.state.manager)
+    init_scheduler(app.state.scheduler)
+
+    # 브라우저 실행 비용을 없애기 위해 드라이버 풀을 미리 실행 (앱 시작을 막지 않도록 백그라운드에서)
+    app.state.driver_pool = DriverPool()
+    app.state.driver_pool.start_background()
     
     yield # yield 이전 코드는 fastapi시작할 때 실행됨 / 이후 코드는 종료될 때 실행
     
-    print("애플리케이션 종료: Manager 종료")
+    print("애플리케이션 종료: 드라이버 풀 및 Manager 종료")
+    if hasattr(app.state, 'driver_pool'):
+        app.state.driver_pool.close()
     if hasattr(app.state, 'manager'):
         app.state.manager.shutdown()
 
+# 드라이버 풀이 준비되지 않았으면 작업을 시작하지 않고 503 반환
+def require_driver_pool() -> DriverPool:
+    pool = app.state.driver_pool
+    try:
+        pool.ensure_ready()
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return pool
+
 # app 실행
 app = FastAPI(lifespan=lifespan)
 
@@ -47,7 +74,7 @@ def start_crawling(req: CrawlRequest):
         
         is_crawling_running.value = True
         print(f"[INFO] {keyword} 크롤링 작업을 실행합니다.")
-        p = Process(target=crawling_run, args=(keyword, max_links, is_crawling_running))
+        p = Process(target=crawling_run, args=(keyword, max_links, is_crawling_running, app.state.scheduler))
         p.start()
 
         return {"status": "started", "message": f"'{keyword}'에 대한 크롤링 작업을 시작했습니다."}
@@ -57,11 +84,14 @@ def start_crawling(req: CrawlRequest):
 @app.post("/crawl/optimized")
 def start_optimized_crawling(req: CrawlRequest, 
                            use_batch_processing: bool = Query(True, description="배치 처리 사용 여부"),
-                           batch_size: int = Query(15, description="배치 크기")):
+                           batch_size: int = Query(15, description="배치 크기"),
+                           review_mode: str = Query("dom", description="리뷰 수집 방식 (dom: 버튼 클릭, cdp: 네트워크 캡처, fetch: 페이지 내 병렬 요청)"),
+                           upload: bool = Query(False, description="크롤링 중 리뷰 파일 GCS 업로드 여부")):
     """최적화된 크롤링 API"""
     try:
         keyword = req.keyword
         max_links = req.max_links
+        requirement = req.requirement.dict() if req.requirement else None
         is_crawling_running = app.state.is_crawling_running
         print(f"[INFO] 최적화된 크롤링 - {keyword}가 검색되었습니다.")
 
@@ -75,7 +105,8 @@ def start_optimized_crawling(req: CrawlRequest,
         
         # 최적화된 크롤링 실행
         p = Process(target=crawling_run_optimized, 
-                   args=(keyword, max_links, is_crawling_running, use_batch_processing, batch_size))
+                   args=(keyword, max_links, is_crawling_running, use_batch_processing, batch_size, review_mode,
+                         app.state.scheduler, requirement, upload))
         p.start()
 
         return {
@@ -86,13 +117,144 @@ def start_optimized_crawling(req: CrawlRequest,
                 "resource_blocking": True,
                 "smart_waiting": True,
                 "batch_processing": use_batch_processing,
-                "batch_size": batch_size if use_batch_processing else None
+                "batch_size": batch_size if use_batch_processing else None,
+                "review_mode": review_mode
             }
         }
     except Exception as e:
         is_crawling_running.value = False
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/crawl/pooled")
+def start_pooled_crawling(req: CrawlRequest,
+                          review_mode: str = Query("dom", description="리뷰 수집 방식 (dom: 버튼 클릭, cdp: 네트워크 캡처, fetch: 페이지 내 병렬 요청)")):
+    """드라이버 풀 기반 크롤링 API"""
+    require_driver_pool()
+    try:
+        keyword = req.keyword
+        max_links = req.max_links
+        requirement = req.requirement.dict() if req.requirement else None
+        is_crawling_running = app.state.is_crawling_running
+        pool = app.state.driver_pool
+        print(f"[INFO] 풀 크롤링 - {keyword}가 검색되었습니다.")
+
+        if is_crawling_running.value == True:
+            print("[INFO] 작업이 이미 실행중이라 요청을 반려합니다.")
+            return {"status": "processing", "message": "작업이 이미 실행 중입니다."}
+        
+        is_crawling_running.value = True
+        
+        # 드라이버 풀은 이 프로세스에 있으므로 스레드로 실행
+        t = threading.Thread(target=crawling_run_pooled, 
+                             args=(keyword, max_links, is_crawling_running, pool, review_mode, requirement),
+                             daemon=True)
+        t.start()
+
+        return {
+            "status": "started",
+            "message": f"'{keyword}'에 대한 풀 크롤링 작업을 시작했습니다.",
+            "driver_pool": {
+                "size": pool.size,
+                "max_pages": pool.max_pages,
+                "max_memory_mb": pool.max_memory_mb,
+                "stats": pool.stats
+            }
+        }
+    except Exception as e:
+        app.state.is_crawling_running.value = False
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/crawl/fast")
+def start_fast_crawling(req: CrawlRequest,
+                        review_mode: str = Query("dom", description="브라우저 전환 시 리뷰 수집 방식")):
+    """HTTP 우선 크롤링 API (차단/불완전 페이지만 브라우저 사용)"""
+    require_driver_pool()
+    try:
+        keyword = req.keyword
+        max_links = req.max_links
+        requirement = req.requirement.dict() if req.requirement else None
+        is_crawling_running = app.state.is_crawling_running
+        print(f"[INFO] HTTP 우선 크롤링 - {keyword}가 검색되었습니다.")
+
+        if is_crawling_running.value == True:
+            print("[INFO] 작업이 이미 실행중이라 요청을 반려합니다.")
+            return {"status": "processing", "message": "작업이 이미 실행 중입니다."}
+        
+        is_crawling_running.value = True
+        t = threading.Thread(target=crawling_run_fast, 
+                             args=(keyword, max_links, is_crawling_running, app.state.driver_pool, review_mode,
+                                   requirement),
+                             daemon=True)
+        t.start()
+
+        return {"status": "started", "message": f"'{keyword}'에 대한 HTTP 우선 크롤링 작업을 시작했습니다."}
+    except Exception as e:
+        app.state.is_crawling_running.value = False
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/crawl/async")
+async def start_async_crawling(req: CrawlRequest,
+                               max_network: int = Query(8, description="동시 HTTP 요청 수"),
+                               max_disk: int = Query(2, description="동시 저장 작업 수"),
+                               review_mode: str = Query("dom", description="브라우저 사용 시 리뷰 수집 방식")):
+    """asyncio 엔진 기반 크롤링 API (브라우저 동시 실행 수 = 드라이버 풀 크기)"""
+    require_driver_pool()
+    try:
+        keyword = req.keyword
+        max_links = req.max_links
+        requirement = req.requirement.dict() if req.requirement else None
+        is_crawling_running = app.state.is_crawling_running
+        print(f"[INFO] 비동기 크롤링 - {keyword}가 검색되었습니다.")
+
+        if is_crawling_running.value == True:
+            print("[INFO] 작업이 이미 실행중이라 요청을 반려합니다.")
+            return {"status": "processing", "message": "작업이 이미 실행 중입니다."}
+        
+        is_crawling_running.value = True
+        # 태스크 참조를 유지해야 GC로 취소되지 않음
+        app.state.crawl_task = asyncio.create_task(
+            async_crawling_run(keyword, max_links, is_crawling_running, app.state.driver_pool,
+                               max_network, max_disk, review_mode, requirement=requirement)
+        )
+
+        return {
+            "status": "started",
+            "message": f"'{keyword}'에 대한 비동기 크롤링 작업을 시작했습니다.",
+            "concurrency": {
+                "browser": app.state.driver_pool.size,
+                "network": max_network,
+                "disk": max_disk
+            }
+        }
+    except Exception as e:
+        app.state.is_crawling_running.value = False
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/crawl/multi-tab")
+def start_multi_tab_crawling(req: CrawlRequest,
+                             tabs: int = Query(4, description="브라우저 하나에서 동시에 사용할 탭 수")):
+    """멀티 탭 크롤링 API (크롬 하나로 여러 상품 동시 처리)"""
+    try:
+        keyword = req.keyword
+        max_links = req.max_links
+        requirement = req.requirement.dict() if req.requirement else None
+        is_crawling_running = app.state.is_crawling_running
+        print(f"[INFO] 멀티 탭 크롤링 - {keyword}가 검색되었습니다.")
+
+        if is_crawling_running.value == True:
+            print("[INFO] 작업이 이미 실행중이라 요청을 반려합니다.")
+            return {"status": "processing", "message": "작업이 이미 실행 중입니다."}
+        
+        is_crawling_running.value = True
+        p = Process(target=crawling_run_multi_tab,
+                    args=(keyword, max_links, is_crawling_running, tabs, app.state.scheduler, requirement))
+        p.start()
+
+        return {"status": "started", "message": f"'{keyword}'에 대한 멀티 탭 크롤링 작업을 시작했습니다. (탭 {tabs}개)"}
+    except Exception as e:
+        app.state.is_crawling_running.value = False
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/crawl/test")
 def test_crawling(keyword: str = Query(..., description="테스트할 키워드"),
                  max_links: int = Query(3, description="테스트할 링크 수")):
@@ -117,6 +279,26 @@ def test_crawling(keyword: str = Query(..., description="테스트할 키워드"
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/compact")
+def start_compaction(start_date: str = Query(..., description="컴팩션 시작 날짜 (YYYY-MM-DD)"),
+                     end_date: str = Query(None, description="컴팩션 종료 날짜 (기본: 시작 날짜)"),
+                     remove_source: bool = Query(False, description="컴팩션 후 원본 작업 디렉터리 삭제 여부")):
+    """review_data 날짜 파티션 컴팩션 API"""
+    try:
+        print(f"[INFO] 리뷰 데이터 컴팩션 시작 - {start_date} ~ {end_date or start_date}")
+        
+        # 파일 I/O가 많으므로 별도 프로세스에서 실행
+        p = Process(target=compact_review_data, args=(start_date, end_date),
+                    kwargs={"remove_source": remove_source})
+        p.start()
+        
+        return {
+            "status": "started",
+            "message": f"{start_date} ~ {end_date or start_date} 리뷰 데이터 컴팩션을 시작했습니다."
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/crawl/status")
 def get_crawling_status():
     """크롤링 상태 확인 API"""
@@ -171,7 +353,12 @@ def root():
         "endpoints": {
             "POST /crawl": "기존 크롤링 (호환성 유지)",
             "POST /crawl/optimized": "최적화된 크롤링",
+            "POST /crawl/pooled": "드라이버 풀 기반 크롤링",
+            "POST /crawl/fast": "HTTP 우선 크롤링 (브라우저 대체)",
+            "POST /crawl/async": "asyncio 엔진 기반 크롤링",
+            "POST /crawl/multi-tab": "브라우저 하나에서 멀티 탭 크롤링",
             "POST /crawl/test": "빠른 테스트 크롤링",
+            "POST /compact": "리뷰 데이터 날짜 파티션 컴팩션",
             "GET /crawl/status": "크롤링 상태 확인",
             "GET /crawl/performance-guide": "성능 최적화 가이드"
         }
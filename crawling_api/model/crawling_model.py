@@ -1,9 +1,17 @@
+from typing import List, Optional
 from pydantic import BaseModel
 
+class ReviewRequirement(BaseModel):
+    # 다운스트림에서 실제로 사용하는 리뷰 조건 (충족되면 리뷰 수집 중단)
+    newest_n: Optional[int] = None
+    exclude_prefixes: List[str] = []
+    min_length: int = 0
+
 class CrawlRequest(BaseModel):
     keyword: str
     max_links: int
+    requirement: Optional[ReviewRequirement] = None
 
 class crawlResponse(BaseModel):
     message: str
-    status: str
\ No newline at end of file
+    status: str
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# crawling 패키지(from crawling...)를 import 할 수 있도록 crawling_api 경로 추가
+CRAWLING_API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if CRAWLING_API_DIR not in sys.path:
+    sys.path.insert(0, CRAWLING_API_DIR)
@@ -0,0 +1,111 @@
+import asyncio
+import glob
+import threading
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("pyarrow")
+pipeline = pytest.importorskip("crawling.optimized_crawling_pipeline")
+
+from crawling.data_access import save_reviews_to_local
+from crawling.http_fast_path import FastPathMiss
+
+
+URLS = [f"https://fixture.local/vp/products/{code}" for code in ("1", "2", "3", "4")]
+
+
+class FakePool:
+    size = 2
+
+    @contextmanager
+    def lease(self):
+        yield SimpleNamespace(driver=object(), page_count=0)
+
+
+class FakeClient:
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def product_code(url: str) -> str:
+    return url.rsplit("/", 1)[-1]
+
+def scraped(url: str):
+    code = product_code(url)
+    return {"product_code": int(code)}, [{"product_code": code, "review_rating": "5",
+                                          "review_date": "2025.06.19", "review_content": f"리뷰 {code}"}]
+
+
+@pytest.fixture
+def engine(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    client = FakeClient()
+    calls = {"inserted": [], "saved": [], "browser": []}
+
+    def fake_fetch(client, url, max_pages, requirement):
+        # 짝수 상품은 HTTP 경로 실패 → 브라우저로 수집
+        if int(product_code(url)) % 2 == 0:
+            raise FastPathMiss("blocked")
+        return scraped(url)
+
+    def fake_scrape(driver, url, use_js_extractor, review_mode, requirement):
+        calls["browser"].append(url)
+        return scraped(url)
+
+    monkeypatch.setattr(pipeline, "iter_product_links_optimized", lambda keyword, max_link, driver: iter(URLS))
+    monkeypatch.setattr(pipeline, "create_http_client", lambda: client)
+    monkeypatch.setattr(pipeline, "fetch_product_fast", fake_fetch)
+    monkeypatch.setattr(pipeline, "scrape_product_with_driver", fake_scrape)
+    monkeypatch.setattr(pipeline, "insert_product_info_to_db", calls["inserted"].append)
+    monkeypatch.setattr(pipeline, "save_reviews_to_local",
+                        lambda reviews, code, job_id: calls["saved"].append(code))
+    return SimpleNamespace(client=client, calls=calls, monkeypatch=monkeypatch)
+
+
+def test_engine_crawls_every_discovered_link(engine):
+    crawler = pipeline.AsyncCrawlEngine(FakePool(), max_network=2, max_disk=1)
+
+    stats = asyncio.run(crawler.run("키워드", len(URLS), "job"))
+
+    assert stats == {"http": 2, "browser": 2, "failed": 0}
+    assert sorted(engine.calls["saved"]) == ["1", "2", "3", "4"]
+    assert sorted(p["product_code"] for p in engine.calls["inserted"]) == [1, 2, 3, 4]
+    assert sorted(engine.calls["browser"]) == [URLS[1], URLS[3]]
+    assert engine.client.closed
+
+def test_engine_error_cancels_pending_tasks_and_waits_for_threads(engine):
+    slow_done = threading.Event()
+
+    def save(reviews, code, job_id):
+        if code == "1":
+            raise OSError("disk full")
+        # 다른 상품의 저장은 오류가 난 뒤에도 스레드에서 계속 실행 중
+        time.sleep(0.2)
+        slow_done.set()
+
+    engine.monkeypatch.setattr(pipeline, "save_reviews_to_local", save)
+    crawler = pipeline.AsyncCrawlEngine(FakePool(), max_network=4, max_disk=4)
+
+    async def run():
+        with pytest.raises(OSError):
+            await crawler.run("키워드", len(URLS), "job")
+        return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    assert asyncio.run(run()) == []
+    # executor.shutdown(wait=True)로 실행 중이던 저장이 끝난 뒤에 반환
+    assert slow_done.is_set()
+    assert engine.client.closed
+
+def test_async_crawling_run_writes_reviews_through_job_writer(engine, tmp_path):
+    # 실제 리뷰 저장 경로 사용 (작업 리뷰 기록기 스레드로 전달)
+    engine.monkeypatch.setattr(pipeline, "save_reviews_to_local", save_reviews_to_local)
+
+    stats = asyncio.run(pipeline.async_crawling_run("키워드", len(URLS), None, pool=FakePool(), max_network=2))
+
+    assert stats == {"http": 2, "browser": 2, "failed": 0}
+    assert glob.glob(str(tmp_path / "review_data" / "*" / "job_*" / "_manifest.json"))
@@ -0,0 +1,80 @@
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pq = pytest.importorskip("pyarrow.parquet")
+pa = pytest.importorskip("pyarrow")
+
+from crawling import compaction
+from crawling.review_schema import to_review_table
+
+
+DATE = "2025-06-19"
+
+
+def write_old_schema(path, rows):
+    # 스키마 도입 이전처럼 모든 값이 문자열인 파일
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pq.write_table(pa.Table.from_pandas(pd.DataFrame(rows), preserve_index=False), path)
+
+def write_new_schema(path, rows):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pq.write_table(to_review_table(pd.DataFrame(rows)), path)
+
+def close_job(job_dir):
+    with open(os.path.join(job_dir, compaction.MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump({"files": []}, f)
+
+
+def test_compaction_with_null_dates_and_mixed_schemas(tmp_path):
+    base_dir, output_dir = tmp_path / "review_data", tmp_path / "compacted"
+    write_old_schema(str(base_dir / DATE / "job_old" / "1.parquet"), [
+        {"product_code": "1", "review_rating": "5", "review_date": "2025.06.10", "review_content": "좋아요"},
+        {"product_code": "1", "review_rating": "4", "review_date": "날짜 없음", "review_content": "괜찮아요"},
+    ])
+    write_new_schema(str(base_dir / DATE / "job_new" / "bucket-00.parquet"), [
+        {"product_code": 2, "review_rating": 3, "review_date": None, "review_content": "보통"},
+        {"product_code": 1, "review_rating": 5, "review_date": "2025-06-10", "review_content": "좋아요"},
+    ])
+
+    manifest = compaction.compact_partition(DATE, str(base_dir), str(output_dir))
+
+    assert manifest["input_rows"] == 4
+    assert manifest["output_rows"] == 3
+    assert manifest["stats"]["review_date"] == {"min": "2025-06-10", "max": "2025-06-10"}
+    assert manifest["stats"]["product_code"] == {"min": "1", "max": "2"}
+    compacted = pd.read_parquet(output_dir / DATE / "part-00000.parquet")
+    assert compacted["review_date"].isna().sum() == 2
+
+def test_column_stats_all_null_dates():
+    df = pd.DataFrame({"product_code": [1], "review_date": [None]})
+    assert compaction._column_stats(df)["review_date"] is None
+
+
+def test_remove_source_only_removes_closed_job_dirs(tmp_path):
+    base_dir = tmp_path / "review_data"
+    rows = [{"product_code": 1, "review_rating": 5, "review_date": "2025-06-10", "review_content": "좋아요"}]
+    write_new_schema(str(base_dir / DATE / "job_closed" / "bucket-00.parquet"), rows)
+    write_new_schema(str(base_dir / DATE / "job_running" / "bucket-00.parquet"), rows)
+    close_job(str(base_dir / DATE / "job_closed"))
+
+    manifest = compaction.compact_partition(DATE, str(base_dir), str(tmp_path / "compacted"), remove_source=True)
+
+    assert manifest["removed_job_dirs"] == [str(base_dir / DATE / "job_closed")]
+    assert not (base_dir / DATE / "job_closed").exists()
+    assert (base_dir / DATE / "job_running" / "bucket-00.parquet").exists()
+
+def test_remove_source_keeps_todays_partition(tmp_path):
+    base_dir = tmp_path / "review_data"
+    today = datetime.now().strftime("%Y-%m-%d")
+    rows = [{"product_code": 1, "review_rating": 5, "review_date": today, "review_content": "좋아요"}]
+    write_new_schema(str(base_dir / today / "job_closed" / "bucket-00.parquet"), rows)
+    close_job(str(base_dir / today / "job_closed"))
+
+    manifest = compaction.compact_partition(today, str(base_dir), str(tmp_path / "compacted"), remove_source=True)
+
+    assert manifest["removed_job_dirs"] == []
+    assert (base_dir / today / "job_closed" / "bucket-00.parquet").exists()
@@ -0,0 +1,73 @@
+import pytest
+
+pytest.importorskip("psutil")
+pytest.importorskip("undetected_chromedriver")
+
+from crawling.driver_pool import DriverPool
+
+
+class FakeDriver:
+    browser_pid = -1
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def execute_script(self, script):
+        return 1
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        pass
+
+
+def flaky_factory(failures: int):
+    """처음 failures번은 실행 실패, 이후 FakeDriver 반환"""
+    state = {"calls": 0}
+
+    def factory():
+        state["calls"] += 1
+        if state["calls"] <= failures:
+            raise RuntimeError("chrome launch failed")
+        return FakeDriver()
+    return factory
+
+
+def test_start_fails_when_no_driver_launches():
+    pool = DriverPool(size=2, launch_retries=1, driver_factory=flaky_factory(100))
+    with pytest.raises(RuntimeError):
+        pool.start()
+    with pytest.raises(RuntimeError):
+        pool.ensure_ready()
+
+
+def test_start_retries_failed_launch():
+    pool = DriverPool(size=2, launch_retries=1, driver_factory=flaky_factory(1))
+    pool.start()
+    pool.ensure_ready()
+    assert pool.stats["launched"] == 2
+
+
+def test_acquire_refills_missing_slot():
+    # 첫 슬롯은 재시도까지 실패, 두 번째 슬롯과 이후 실행은 성공
+    pool = DriverPool(size=2, launch_retries=0, driver_factory=flaky_factory(1))
+    pool.start()
+    first = pool.acquire(timeout=0.1)
+    second = pool.acquire(timeout=0.1)
+    assert first is not second
+    assert pool.stats["launched"] == 2
+
+
+def test_acquire_times_out_instead_of_blocking():
+    pool = DriverPool(size=1, driver_factory=flaky_factory(0), acquire_timeout=0.1)
+    pool.start()
+    pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire()
@@ -0,0 +1,77 @@
+import pytest
+
+from crawling import freshness_index
+from crawling.freshness_index import FreshnessIndex
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_750_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(freshness_index, "time", clock)
+    return clock
+
+@pytest.fixture
+def index(tmp_path, clock):
+    return FreshnessIndex(str(tmp_path / "crawl_index.db"), ttl_hours=24, min_review_delta=20)
+
+def crawled(index: FreshnessIndex, product_code: str, review_count: int) -> None:
+    index.mark_seen(product_code, review_count)
+    index.record_crawl(product_code, "review_data/2025-06-19/job_1/part-b0-00000.parquet")
+
+
+def test_missing_row_is_not_fresh(index):
+    assert not index.is_fresh("1", 100)
+
+def test_seen_but_not_crawled_is_not_fresh(index):
+    # 검색 단계에서 리뷰 수만 기록되고 저장이 끝나지 않은 상품
+    index.mark_seen("1", 100)
+    assert not index.is_fresh("1", 100)
+
+def test_fresh_within_ttl_and_small_review_delta(index, clock):
+    crawled(index, "1", 100)
+    clock.now += 23 * 3600
+
+    assert index.is_fresh("1", 100)
+    assert index.is_fresh("1", 119)
+
+def test_ttl_expiry(index, clock):
+    crawled(index, "1", 100)
+    clock.now += 24 * 3600 + 1
+
+    assert not index.is_fresh("1", 100)
+
+def test_review_count_delta_at_threshold_is_stale(index):
+    crawled(index, "1", 100)
+
+    assert not index.is_fresh("1", 120)
+    assert not index.is_fresh("1", 500)
+
+def test_falling_review_count_stays_fresh(index):
+    # 리뷰가 삭제되어 수가 줄어도 새 리뷰가 늘어난 것이 아니므로 다시 크롤링하지 않음
+    crawled(index, "1", 100)
+
+    assert index.is_fresh("1", 90)
+    assert index.is_fresh("1", 0)
+
+def test_record_crawl_uses_count_seen_in_this_job(index, clock):
+    crawled(index, "1", 100)
+    clock.now += 3600
+    # 다음 작업에서 150개로 보고 다시 수집 → 기준 값이 150으로 갱신
+    crawled(index, "1", 150)
+
+    assert index.is_fresh("1", 160)
+    assert not index.is_fresh("1", 170)
+
+def test_record_crawl_without_seen_count_is_not_fresh(index):
+    # 검색 단계를 거치지 않은(리뷰 수를 모르는) 상품은 신선도 판단 불가
+    index.record_crawl("1", "review_data/2025-06-19/job_1/part-b0-00000.parquet")
+
+    assert not index.is_fresh("1", 0)
@@ -0,0 +1,145 @@
+import base64
+import hashlib
+import threading
+
+import pytest
+
+gcs_upload = pytest.importorskip("crawling.gcs_upload")
+
+from crawling.gcs_upload import GCSUploader, WriteBehindUploader, local_md5
+
+
+class FakeBlob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+        self.metadata = None
+        self.chunk_size = None
+
+    def upload_from_filename(self, local_path):
+        self.bucket.before_upload(self.name)
+        with open(local_path, 'rb') as f:
+            data = f.read()
+        self.bucket.objects[self.name] = {
+            "size": len(data),
+            "md5_hash": base64.b64encode(hashlib.md5(data).digest()).decode('ascii'),
+            "metadata": self.metadata,
+        }
+        self.bucket.uploads.append(self.name)
+
+
+class StoredBlob:
+    def __init__(self, stored):
+        self.size = stored["size"]
+        self.md5_hash = stored["md5_hash"]
+        self.metadata = stored["metadata"]
+
+
+class FakeBucket:
+    """메모리에 객체를 보관하는 GCS 버킷 (fail_on에 있는 객체는 업로드 실패)"""
+
+    def __init__(self):
+        self.objects = {}
+        self.uploads = []
+        self.fail_on = set()
+        self.gate = None
+
+    def before_upload(self, name):
+        if self.gate is not None:
+            self.gate.wait(5)
+        if name in self.fail_on:
+            raise ConnectionError(f"upload failed: {name}")
+
+    def blob(self, name):
+        return FakeBlob(self, name)
+
+    def get_blob(self, name):
+        stored = self.objects.get(name)
+        return StoredBlob(stored) if stored else None
+
+
+class FakeClient:
+    def __init__(self):
+        self.fake_bucket = FakeBucket()
+
+    def bucket(self, name):
+        return self.fake_bucket
+
+
+@pytest.fixture
+def uploader():
+    return GCSUploader("test-bucket", max_workers=2, client=FakeClient())
+
+@pytest.fixture
+def job_dir(tmp_path):
+    job_dir = tmp_path / "review_data" / "2025-06-19" / "job_1"
+    job_dir.mkdir(parents=True)
+    for i in range(3):
+        (job_dir / f"part-b{i}-00000.parquet").write_bytes(f"parquet {i}".encode())
+    (job_dir / "_manifest.json").write_text('{"files": []}')
+    (job_dir / "ignored.tmp").write_text("not uploaded")
+    return job_dir
+
+
+def test_unchanged_files_are_skipped_by_md5(uploader, job_dir):
+    assert uploader.upload_dir(str(job_dir), "job_1") == {"uploaded": 4, "skipped": 0, "failed": 0}
+    bucket = uploader.bucket
+    assert sorted(bucket.objects) == ["job_1/_manifest.json", "job_1/part-b0-00000.parquet",
+                                      "job_1/part-b1-00000.parquet", "job_1/part-b2-00000.parquet"]
+
+    # 내용이 바뀐 파일만 다시 업로드 (같은 크기라도 MD5가 다르면 업로드)
+    (job_dir / "part-b1-00000.parquet").write_bytes(b"parquet X")
+    bucket.uploads.clear()
+    assert uploader.upload_dir(str(job_dir), "job_1") == {"uploaded": 1, "skipped": 3, "failed": 0}
+    assert bucket.uploads == ["job_1/part-b1-00000.parquet"]
+
+def test_md5_from_metadata_is_used_when_object_has_no_md5_hash(uploader, tmp_path):
+    # 청크 병렬 업로드 객체는 md5_hash가 없고 메타데이터에만 MD5가 있음
+    path = tmp_path / "big.parquet"
+    path.write_bytes(b"chunked")
+    uploader.bucket.objects["big.parquet"] = {"size": 7, "md5_hash": None, "metadata": {"md5": local_md5(str(path))}}
+
+    assert uploader.upload_file(str(path), "big.parquet") == "skipped"
+
+def test_rerun_after_partial_failure_uploads_only_remaining_files(uploader, job_dir):
+    bucket = uploader.bucket
+    bucket.fail_on = {"job_1/part-b1-00000.parquet", "job_1/_manifest.json"}
+    assert uploader.upload_dir(str(job_dir), "job_1") == {"uploaded": 2, "skipped": 0, "failed": 2}
+
+    bucket.fail_on = set()
+    bucket.uploads.clear()
+    assert uploader.upload_dir(str(job_dir), "job_1") == {"uploaded": 2, "skipped": 2, "failed": 0}
+    assert sorted(bucket.uploads) == ["job_1/_manifest.json", "job_1/part-b1-00000.parquet"]
+
+
+def test_write_behind_flush_waits_for_submitted_uploads(uploader, job_dir):
+    bucket = uploader.bucket
+    bucket.gate = threading.Event()
+    writer = WriteBehindUploader(uploader, max_pending=8, workers=2).start()
+    files = sorted(job_dir.glob("*.parquet"))
+    for path in files:
+        writer.submit(str(path), f"job_1/{path.name}")
+    assert writer.pending == 3
+
+    # 업로드가 막혀 있는 동안 flush는 반환하지 않음
+    flushed = []
+    flusher = threading.Thread(target=lambda: flushed.append(writer.flush()))
+    flusher.start()
+    flusher.join(0.2)
+    assert flusher.is_alive() and bucket.uploads == []
+
+    bucket.gate.set()
+    flusher.join(5)
+    assert flushed == [{"uploaded": 3, "skipped": 0, "failed": 0}]
+    assert writer.pending == 0
+    writer.close()
+
+def test_write_behind_close_counts_failures_and_stops_workers(uploader, job_dir):
+    uploader.bucket.fail_on = {"job_1/_manifest.json"}
+    writer = WriteBehindUploader(uploader, max_pending=2, workers=2).start()
+    for path in sorted(job_dir.iterdir()):
+        if path.suffix in (".parquet", ".json"):
+            writer.submit(str(path), f"job_1/{path.name}")
+
+    assert writer.close() == {"uploaded": 3, "skipped": 0, "failed": 1}
+    assert not any(thread.is_alive() for thread in writer._threads)
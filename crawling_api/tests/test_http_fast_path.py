@@ -0,0 +1,118 @@
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("bs4")
+http_fast_path = pytest.importorskip("crawling.http_fast_path")
+
+from crawling.review_watermark import ReviewWatermark
+
+BASE_URL = "http://fixture.local"
+PRODUCT_PATH = "/vp/products/12345"
+
+PRODUCT_HTML = """
+<html><body>
+  <ul class="breadcrumb"><li>쿠팡 홈</li><li>가전</li><li>청소기</li></ul>
+  <h1 class="product-title">무선 청소기 X1</h1>
+  <div class="product-image"><img src="//thumbnail.test/remote/492x492ex/image/x1.jpg"></div>
+  <span class="rating-star-num" style="width: 90%;"></span>
+  <span class="rating-count-txt">1,234개 상품평</span>
+  <div class="price-amount sales-price-amount">129,000원</div>
+  <div class="price-amount final-price-amount">99,000원</div>
+</body></html>
+"""
+
+def review_html(*contents):
+    articles = "".join(f"""
+    <article>
+      <div data-rating="5"></div>
+      <div class="sdp-review__article__list__info__product-info__reg-date">2025.06.1{i}</div>
+      <div class="sdp-review__article__list__review__content">{content}</div>
+    </article>""" for i, content in enumerate(contents))
+    return f"<div>{articles}</div>"
+
+
+class NoWaitScheduler:
+    def wait(self):
+        return 0.0
+
+    def report(self, ok):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def inserted(monkeypatch, tmp_path):
+    products = []
+    monkeypatch.setattr(http_fast_path, "get_scheduler", lambda: NoWaitScheduler())
+    monkeypatch.setattr(http_fast_path, "ReviewWatermark", lambda: ReviewWatermark(str(tmp_path / "index.db")))
+    monkeypatch.setattr(http_fast_path, "insert_product_info_to_db", products.append)
+    return products
+
+def fixture_client(review_pages: dict, product_status: int = 200) -> httpx.Client:
+    """상품 페이지와 리뷰 조각(page 번호별 HTML)을 돌려주는 로컬 fixture 서버"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.host == "fixture.local"
+        if request.url.path == PRODUCT_PATH:
+            return httpx.Response(product_status, text=PRODUCT_HTML)
+        if request.url.path == http_fast_path.REVIEW_FRAGMENT_PATH:
+            return httpx.Response(200, text=review_pages.get(int(request.url.params["page"]), ""))
+        return httpx.Response(404)
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_parse_product_html():
+    product = http_fast_path.parse_product_html(PRODUCT_HTML, BASE_URL + PRODUCT_PATH)
+    assert product["name"] == "무선 청소기 X1"
+    assert product["product_code"] == 12345
+    assert product["tag"] == "가전,청소기"
+    assert product["image_url"] == "https://thumbnail.test/remote/292x292ex/image/x1.jpg"
+    assert product["star_rating"] == 4.5
+    assert product["review_count"] == 1234
+    assert (product["sales_price"], product["final_price"]) == (129000, 99000)
+
+def test_parse_product_html_without_title_is_a_miss():
+    with pytest.raises(http_fast_path.FastPathMiss):
+        http_fast_path.parse_product_html("<html><body>차단</body></html>", BASE_URL + PRODUCT_PATH)
+
+def test_fetch_product_fast_reads_review_pages_until_empty():
+    client = fixture_client({1: review_html("좋아요", "만족"), 2: review_html("배송 빨라요")})
+    product, reviews = http_fast_path.fetch_product_fast(client, PRODUCT_PATH, base_url=BASE_URL)
+
+    assert product["product_code"] == 12345
+    assert [r["review_content"] for r in reviews] == ["좋아요", "만족", "배송 빨라요"]
+    assert reviews[0] == {"product_code": "12345", "review_rating": "5",
+                          "review_date": "2025.06.10", "review_content": "좋아요"}
+
+def test_fetch_product_fast_empty_first_review_page_is_a_miss():
+    with pytest.raises(http_fast_path.FastPathMiss):
+        http_fast_path.fetch_product_fast(fixture_client({}), PRODUCT_PATH, base_url=BASE_URL)
+
+
+def test_blocked_response_falls_back_to_browser(monkeypatch):
+    browser_calls = []
+    monkeypatch.setattr(http_fast_path, "coupang_crawling_pooled", lambda *args: browser_calls.append(args))
+    monkeypatch.setattr(http_fast_path, "save_reviews_to_local", lambda *args: pytest.fail("저장하면 안 됨"))
+
+    path = http_fast_path.coupang_crawling_fast((PRODUCT_PATH, "job"), fixture_client({}, product_status=403),
+                                                pool=None, base_url=BASE_URL)
+    assert path == "browser"
+    assert len(browser_calls) == 1
+
+def test_save_failure_does_not_trigger_browser_recrawl(monkeypatch):
+    def failing_save(*args):
+        raise OSError("disk full")
+    monkeypatch.setattr(http_fast_path, "coupang_crawling_pooled", lambda *args: pytest.fail("브라우저로 다시 수집함"))
+    monkeypatch.setattr(http_fast_path, "save_reviews_to_local", failing_save)
+
+    path = http_fast_path.coupang_crawling_fast((PRODUCT_PATH, "job"), fixture_client({1: review_html("좋아요")}),
+                                                pool=None, base_url=BASE_URL)
+    assert path == "failed"
+
+def test_fast_path_inserts_product_info(monkeypatch, inserted):
+    saves = []
+    monkeypatch.setattr(http_fast_path, "save_reviews_to_local", lambda *args: saves.append(args))
+
+    path = http_fast_path.coupang_crawling_fast((PRODUCT_PATH, "job"), fixture_client({1: review_html("좋아요")}),
+                                                pool=None, base_url=BASE_URL)
+    assert path == "http"
+    assert [product["product_code"] for product in inserted] == [12345]
+    assert len(saves) == 1
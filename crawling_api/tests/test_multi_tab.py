@@ -0,0 +1,103 @@
+import json
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+multi_tab = pytest.importorskip("crawling.multi_tab")
+
+from crawling.review_watermark import ReviewWatermark
+
+
+class NoWaitScheduler:
+    def wait(self):
+        return 0.0
+
+    def report(self, ok):
+        pass
+
+
+class FakeTabDriver:
+    """탭별 주소와 진행 중인 리뷰 fetch만 흉내 내는 드라이버 (fetch는 상품별로 정해진 횟수만큼 확인해야 끝남)"""
+
+    browser_pid = -1
+
+    def __init__(self, fetch_polls: dict):
+        self.fetch_polls = fetch_polls
+        self.handles = ["tab-0"]
+        self.current_window_handle = "tab-0"
+        self.urls = {}
+        self.fetches = {}
+        self.switch_to = self
+
+    # switch_to
+    def window(self, handle):
+        self.current_window_handle = handle
+
+    def new_window(self, kind):
+        handle = f"tab-{len(self.handles)}"
+        self.handles.append(handle)
+        self.current_window_handle = handle
+
+    def product_code(self):
+        return self.urls[self.current_window_handle].split("products/")[-1]
+
+    def execute_script(self, script, *args):
+        tab = self.current_window_handle
+        if script.startswith("window.location.href"):
+            self.urls[tab] = args[0]
+        elif script == multi_tab.PAGE_READY_SCRIPT:
+            return True
+        elif script == multi_tab.FIND_REVIEW_URL_SCRIPT:
+            return f"https://fixture.local/review?productId={self.product_code()}"
+        elif script == multi_tab.START_REVIEW_FETCH_SCRIPT:
+            self.fetches[tab] = {"urls": args[0], "polls": self.fetch_polls[self.product_code()]}
+        elif script == multi_tab.POLL_REVIEW_FETCH_SCRIPT:
+            fetch = self.fetches[tab]
+            fetch["polls"] -= 1
+            if fetch["polls"] > 0:
+                return None
+            return [self.review_body(url) for url in fetch["urls"]]
+        return None
+
+    @staticmethod
+    def review_body(url):
+        page = int(parse_qs(urlparse(url).query)["page"][0])
+        contents = [{"rating": 5, "reviewAt": "2025-06-19", "content": "좋아요"}] if page == 1 else []
+        return json.dumps({"data": {"contents": contents, "totalPage": 1}})
+
+
+@pytest.fixture
+def saved(monkeypatch, tmp_path):
+    saves = []
+    monkeypatch.setattr(multi_tab, "get_scheduler", lambda: NoWaitScheduler())
+    monkeypatch.setattr(multi_tab, "ReviewWatermark", lambda: ReviewWatermark(str(tmp_path / "index.db")))
+    monkeypatch.setattr(multi_tab, "get_product_info_js",
+                        lambda driver: {"product_code": int(driver.product_code())})
+    monkeypatch.setattr(multi_tab, "save_reviews_to_local",
+                        lambda reviews, product_code, job_id: saves.append((product_code, len(reviews))))
+    monkeypatch.setattr(multi_tab, "insert_product_info_to_db", lambda product: None)
+    return saves
+
+
+def test_slow_review_fetch_does_not_block_other_tabs(saved):
+    # 1번 상품의 리뷰 fetch는 오래 걸리고 나머지는 바로 끝남
+    driver = FakeTabDriver({"1": 50, "2": 1, "3": 1})
+    crawler = multi_tab.MultiTabCrawler(driver, tabs=2)
+    urls = [f"https://fixture.local/vp/products/{code}" for code in ("1", "2", "3")]
+
+    stats = crawler.crawl(urls, "job", poll_interval=0)
+
+    assert stats["completed"] == 3
+    assert [code for code, _ in saved] == ["2", "3", "1"]
+    assert all(count == 1 for _, count in saved)
+
+def test_save_false_collects_without_saving(saved, monkeypatch):
+    monkeypatch.setattr(multi_tab, "insert_product_info_to_db", lambda product: pytest.fail("DB에 저장함"))
+    driver = FakeTabDriver({"1": 1, "2": 1})
+    crawler = multi_tab.MultiTabCrawler(driver, tabs=2, save=False)
+    urls = [f"https://fixture.local/vp/products/{code}" for code in ("1", "2")]
+
+    stats = crawler.crawl(urls, "job", poll_interval=0)
+
+    assert stats["completed"] == 2
+    assert saved == []
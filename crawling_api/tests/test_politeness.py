@@ -0,0 +1,90 @@
+import pytest
+
+from crawling import politeness
+from crawling.politeness import PolitenessScheduler
+
+
+class FakeClock:
+    """time.time/time.sleep 대체 (sleep하면 시각만 앞으로 이동)"""
+
+    def __init__(self, now: float = 100.0):
+        self.now = now
+        self.sleeps = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(politeness, "time", clock)
+    return clock
+
+def scheduler(**kwargs) -> PolitenessScheduler:
+    return PolitenessScheduler.create(initial_delay=1.0, **kwargs)
+
+
+def test_burst_requests_pass_then_are_spaced_by_delay(clock):
+    s = scheduler(burst=2)
+
+    # burst개는 바로 통과, 이후에는 delay 간격
+    assert [s.wait() for _ in range(5)] == [0.0, 0.0, 1.0, 1.0, 1.0]
+    assert clock.now == 103.0
+
+def test_burst_of_one_spaces_every_request(clock):
+    s = scheduler(burst=1)
+
+    assert [s.wait() for _ in range(3)] == [0.0, 1.0, 1.0]
+
+def test_idle_time_refills_burst(clock):
+    s = scheduler(burst=3)
+    for _ in range(5):
+        s.wait()
+
+    # 충분히 쉬고 나면 다시 burst개를 바로 보낼 수 있음 (쉬는 동안 쌓이는 양은 burst로 제한)
+    clock.now += 60
+    assert [s.wait() for _ in range(4)] == [0.0, 0.0, 0.0, 1.0]
+
+def test_requests_from_several_workers_share_one_rate(clock):
+    # 같은 스케줄러를 쓰는 워커들의 요청은 합쳐서 1/delay 속도
+    s = scheduler(burst=1)
+    slots = []
+    for _ in range(4):
+        s.wait()
+        slots.append(clock.now)
+
+    assert slots == [100.0, 101.0, 102.0, 103.0]
+
+
+def test_report_failure_backs_off_exponentially_up_to_max(clock):
+    s = scheduler(max_delay=5.0)
+
+    s.report(False)
+    assert s.delay.value == 2.0
+    s.report(False)
+    assert s.delay.value == 4.0
+    s.report(False)
+    assert s.delay.value == 5.0
+
+def test_backoff_widens_the_next_slots(clock):
+    s = scheduler(burst=1)
+    s.wait()
+    s.report(False)
+
+    # 이미 잡힌 다음 슬롯(1초 뒤) 이후부터는 늘어난 간격(2초) 적용
+    assert [s.wait() for _ in range(3)] == [1.0, 2.0, 2.0]
+
+def test_report_success_recovers_down_to_min_delay(clock):
+    s = scheduler(min_delay=0.5)
+    s.report(False)
+
+    s.report(True)
+    assert s.delay.value == pytest.approx(1.8)
+    for _ in range(20):
+        s.report(True)
+    assert s.delay.value == 0.5
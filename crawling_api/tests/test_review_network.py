@@ -0,0 +1,176 @@
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+review_network = pytest.importorskip("crawling.review_network")
+job = pytest.importorskip("crawling.optimized_crawling_job")
+
+from crawling.review_network import (
+    REVIEW_API_PATTERN, REVIEW_FRAGMENT_PATH, parse_review_payload, with_page_param, with_query_params
+)
+from crawling.review_requirement import ReviewBudget, ReviewCollector
+
+
+REVIEW_URL = "https://www.coupang.com/next-api/review?productId=1&page=1&size=5&sortBy=ORDER_SCORE_ASC"
+
+
+def review_item(content: str, rating: int = 5, reviewAt="2025-06-19"):
+    return {"rating": rating, "reviewAt": reviewAt, "content": content}
+
+def review_payload(contents: list, total_page: int = None, wrapper: str = "rData") -> dict:
+    return {wrapper: {"paging": {"contents": contents, "totalPage": total_page}}}
+
+
+def test_parse_review_payload_nested_paging():
+    reviews, total_page = parse_review_payload(review_payload([review_item("좋아요")], 7), "1")
+
+    assert total_page == 7
+    assert reviews == [{"product_code": "1", "review_rating": "5", "review_date": "2025.06.19",
+                        "review_content": "좋아요"}]
+
+def test_parse_review_payload_data_contents_and_epoch_dates():
+    # createdAt(epoch ms)은 KST 날짜로 변환, 평점이 없으면 None
+    payload = {"data": {"contents": [{"createdAt": 1750345200000, "content": "보통"}], "totalPage": 1}}
+    reviews, total_page = parse_review_payload(payload, "1")
+
+    assert total_page == 1
+    assert reviews == [{"product_code": "1", "review_rating": None, "review_date": "2025.06.20",
+                        "review_content": "보통"}]
+
+def test_parse_review_payload_empty_and_unknown_shapes():
+    assert parse_review_payload(review_payload([], 3), "1") == ([], 3)
+    assert parse_review_payload({"message": "blocked"}, "1") == (None, None)
+    assert parse_review_payload(["not", "a", "dict"], "1") == (None, None)
+
+def test_with_query_params_replaces_and_keeps_other_params():
+    url = with_query_params(REVIEW_URL, sortBy="DATE_DESC", page=3)
+    query = parse_qs(urlparse(url).query, keep_blank_values=True)
+
+    assert query == {"productId": ["1"], "page": ["3"], "size": ["5"], "sortBy": ["DATE_DESC"]}
+    assert url.startswith("https://www.coupang.com/next-api/review?")
+
+def test_with_page_param_adds_missing_page_and_keeps_blank_values():
+    query = parse_qs(urlparse(with_page_param("https://x.test/next-api/review?q=", 2)).query,
+                     keep_blank_values=True)
+    assert query == {"q": [""], "page": ["2"]}
+
+def test_review_api_pattern_only_matches_json_endpoint():
+    assert REVIEW_API_PATTERN.search(REVIEW_URL)
+    # HTML 조각 경로는 http_fast_path에서 처리하므로 JSON 캡처 대상이 아님
+    assert not REVIEW_API_PATTERN.search("https://www.coupang.com" + REVIEW_FRAGMENT_PATH + "?productId=1")
+
+
+class NoWaitScheduler:
+    def wait(self):
+        return 0.0
+
+    def report(self, ok):
+        pass
+
+
+class FakeCapture:
+    """CDP 캡처 대신 페이지 번호별 응답을 돌려줌 (None이면 응답을 받지 못한 경우)"""
+
+    def __init__(self, pages: dict, first_payload="page1"):
+        self.pages = pages
+        self.pending = [pages.get(1) if first_payload == "page1" else first_payload]
+        self.last_url = REVIEW_URL
+        self.requested = []
+
+    def respond(self, url: str) -> None:
+        query = parse_qs(urlparse(url).query)
+        self.requested.append((int(query["page"][0]), query.get("sortBy", [None])[0]))
+        self.pending.append(self.pages.get(int(query["page"][0])))
+
+    def next_payload(self, timeout):
+        return self.pending.pop(0) if self.pending else None
+
+
+class FakeDriver:
+    def __init__(self, capture: FakeCapture):
+        self.capture = capture
+
+    def execute_script(self, script, *args):
+        if script.startswith("fetch("):
+            self.capture.respond(args[0])
+
+
+@pytest.fixture
+def dom_fallback(monkeypatch):
+    calls = []
+
+    def fake_dom(driver, product_code, collector):
+        calls.append(product_code)
+        collector.reviews.append({"review_content": "DOM"})
+        return collector.reviews
+
+    monkeypatch.setattr(job, "get_scheduler", lambda: NoWaitScheduler())
+    monkeypatch.setattr(job, "get_product_review_optimized", fake_dom)
+    return calls
+
+def crawl(capture: FakeCapture, max_pages: int = 10, collector: ReviewCollector = None) -> list:
+    return job.get_product_review_cdp(FakeDriver(capture), "1", capture, max_pages=max_pages, timeout=0,
+                                      collector=collector)
+
+def full_page(page: int, total_page: int = 10) -> dict:
+    return review_payload([review_item(f"리뷰 {page}-{i}") for i in range(5)], total_page)
+
+
+def test_cdp_paging_stops_on_empty_page(dom_fallback):
+    capture = FakeCapture({1: full_page(1), 2: full_page(2), 3: review_payload([], 10)})
+
+    reviews = crawl(capture)
+
+    assert [page for page, _ in capture.requested] == [2, 3]
+    assert len(reviews) == 10
+    assert dom_fallback == []
+
+def test_cdp_paging_stops_at_max_pages(dom_fallback):
+    capture = FakeCapture({page: full_page(page) for page in range(1, 11)})
+
+    reviews = crawl(capture, max_pages=3)
+
+    assert [page for page, _ in capture.requested] == [2, 3]
+    assert len(reviews) == 15
+
+def test_cdp_paging_stops_at_total_page(dom_fallback):
+    capture = FakeCapture({page: full_page(page, total_page=2) for page in range(1, 4)})
+
+    reviews = crawl(capture)
+
+    assert [page for page, _ in capture.requested] == [2]
+    assert len(reviews) == 10
+
+def test_cdp_missing_payload_falls_back_to_dom(dom_fallback):
+    reviews = crawl(FakeCapture({}, first_payload=None))
+
+    assert dom_fallback == ["1"]
+    assert reviews == [{"review_content": "DOM"}]
+
+def test_cdp_malformed_payload_falls_back_to_dom(dom_fallback):
+    reviews = crawl(FakeCapture({}, first_payload={"message": "blocked"}))
+
+    assert dom_fallback == ["1"]
+    assert reviews == [{"review_content": "DOM"}]
+
+def test_cdp_newest_first_rerequests_first_page_sorted_by_date(dom_fallback):
+    capture = FakeCapture({1: full_page(1), 2: full_page(2)})
+    collector = ReviewCollector(budget=ReviewBudget(newest_n=3))
+
+    reviews = crawl(capture, collector=collector)
+
+    # 최신순 첫 페이지에서 최신 3개를 채우면 중단
+    assert capture.requested == [(1, "DATE_DESC")]
+    assert [r["review_content"] for r in reviews] == ["리뷰 1-0", "리뷰 1-1", "리뷰 1-2"]
+    assert dom_fallback == []
+
+def test_cdp_missing_newest_first_response_falls_back_to_dom(dom_fallback):
+    capture = FakeCapture({1: full_page(1)})
+    capture.pages = {}
+    collector = ReviewCollector(watermark=("2025.01.01", "hash"))
+
+    reviews = crawl(capture, collector=collector)
+
+    assert capture.requested == [(1, "DATE_DESC")]
+    assert dom_fallback == ["1"]
+    assert reviews == [{"review_content": "DOM"}]
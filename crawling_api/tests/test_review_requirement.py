@@ -0,0 +1,74 @@
+from crawling.review_requirement import ReviewBudget, ReviewCollector
+from crawling.review_watermark import review_hash
+
+
+def review(content, date="2025.06.19"):
+    return {"product_code": "1", "review_rating": "5", "review_date": date, "review_content": content}
+
+def contents(reviews):
+    return [r["review_content"] for r in reviews]
+
+
+def test_budget_from_dict():
+    assert ReviewBudget.from_dict(None) is None
+    assert ReviewBudget.from_dict({}) is None
+
+    budget = ReviewBudget.from_dict({"newest_n": 30, "exclude_prefixes": ["쿠팡체험단"], "min_length": 10})
+    assert (budget.newest_n, budget.exclude_prefixes, budget.min_length) == (30, ("쿠팡체험단",), 10)
+
+def test_budget_min_length_and_excluded_prefixes():
+    budget = ReviewBudget(exclude_prefixes=["쿠팡체험단", "[광고]"], min_length=5)
+
+    assert budget.accepts(review("배송이 빨라요"))
+    assert not budget.accepts(review("좋아요"))
+    assert not budget.accepts(review("쿠팡체험단 이벤트로 받은 제품입니다"))
+    assert not budget.accepts(review("[광고] 아주 좋은 제품입니다"))
+    assert not budget.accepts(review(None))
+
+
+def test_collector_without_conditions_keeps_every_page():
+    collector = ReviewCollector()
+
+    assert not collector.needs_newest_first
+    assert collector.add_page([review("a"), review("b")]) is False
+    assert collector.add_page([review("c")]) is False
+    assert contents(collector.reviews) == ["a", "b", "c"]
+
+def test_newest_n_stops_once_filled():
+    collector = ReviewCollector(budget=ReviewBudget(newest_n=3))
+
+    assert collector.needs_newest_first
+    assert collector.add_page([review("1번 리뷰"), review("2번 리뷰")]) is False
+    # 남은 자리만큼만 추가하고 중단 신호
+    assert collector.add_page([review("3번 리뷰"), review("4번 리뷰")]) is True
+    assert contents(collector.reviews) == ["1번 리뷰", "2번 리뷰", "3번 리뷰"]
+
+def test_newest_n_counts_only_accepted_reviews():
+    collector = ReviewCollector(budget=ReviewBudget(newest_n=2, exclude_prefixes=["쿠팡체험단"], min_length=4))
+
+    assert collector.add_page([review("쿠팡체험단 리뷰입니다"), review("짧음"), review("괜찮은 제품")]) is False
+    assert collector.add_page([review("또 살게요 좋아요"), review("세 번째 리뷰")]) is True
+    assert contents(collector.reviews) == ["괜찮은 제품", "또 살게요 좋아요"]
+
+def test_watermark_reached_stops_before_newest_n_is_filled():
+    last = review("지난번 최신 리뷰", "2025.06.18")
+    collector = ReviewCollector(("2025.06.18", review_hash(last)), ReviewBudget(newest_n=10))
+
+    assert collector.add_page([review("새 리뷰"), last, review("예전 리뷰", "2025.06.17")]) is True
+    assert contents(collector.reviews) == ["새 리뷰"]
+
+def test_watermark_only_early_stop():
+    collector = ReviewCollector(("2025.06.18", "hash"))
+
+    assert collector.needs_newest_first
+    assert collector.add_page([review("새 리뷰")]) is False
+    assert collector.add_page([review("예전 리뷰", "2025.06.01")]) is True
+    assert contents(collector.reviews) == ["새 리뷰"]
+
+def test_disable_ordering_keeps_filters_but_drops_early_stop():
+    collector = ReviewCollector(("2025.06.18", "hash"), ReviewBudget(newest_n=1, min_length=4))
+    collector.disable_ordering()
+
+    assert not collector.needs_newest_first
+    assert collector.add_page([review("예전 리뷰입니다", "2025.06.01"), review("짧음"), review("새 리뷰입니다")]) is False
+    assert contents(collector.reviews) == ["예전 리뷰입니다", "새 리뷰입니다"]
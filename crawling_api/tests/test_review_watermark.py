@@ -0,0 +1,87 @@
+import pytest
+
+from crawling.review_watermark import ReviewWatermark, filter_new_reviews, review_hash
+
+
+def review(date, content):
+    return {"product_code": "1", "review_rating": "5", "review_date": date, "review_content": content}
+
+
+@pytest.fixture
+def watermark(tmp_path):
+    return ReviewWatermark(str(tmp_path / "crawl_index.db"))
+
+
+def test_no_watermark_keeps_every_review():
+    reviews = [review("2025.06.19", "a"), review("2025.06.18", "b")]
+    assert filter_new_reviews(reviews, None) == (reviews, False)
+
+def test_stops_at_older_date():
+    reviews = [review("2025.06.19", "새 리뷰"), review("2025.06.17", "예전 리뷰")]
+    wm = ("2025.06.18", review_hash(review("2025.06.18", "x")))
+
+    assert filter_new_reviews(reviews, wm) == ([reviews[0]], True)
+
+def test_same_date_ties_are_kept_until_the_watermark_review():
+    # 워터마크와 같은 날짜라도 워터마크 리뷰 자체가 나오기 전까지는 새 리뷰
+    last = review("2025.06.18", "지난번 최신 리뷰")
+    reviews = [review("2025.06.18", "같은 날 새 리뷰"), last, review("2025.06.18", "같은 날 예전 리뷰")]
+
+    new_reviews, reached = filter_new_reviews(reviews, ("2025.06.18", review_hash(last)))
+
+    assert reached
+    assert new_reviews == [reviews[0]]
+
+def test_same_date_without_watermark_review_does_not_stop():
+    reviews = [review("2025.06.18", "a"), review("2025.06.18", "b")]
+    assert filter_new_reviews(reviews, ("2025.06.18", "다른 리뷰 해시")) == (reviews, False)
+
+def test_null_dates_are_kept_and_do_not_stop():
+    reviews = [review(None, "날짜 없음"), review("2025.06.19", "새 리뷰"), review("2025.06.01", "예전")]
+
+    new_reviews, reached = filter_new_reviews(reviews, ("2025.06.18", "hash"))
+
+    assert reached
+    assert new_reviews == reviews[:2]
+
+
+def test_update_stores_first_newest_review(watermark):
+    reviews = [review("2025.06.19", "가장 최신"), review("2025.06.19", "같은 날 이전"), review("2025.06.10", "예전")]
+    watermark.update("1", reviews)
+
+    assert watermark.get("1") == ("2025.06.19", review_hash(reviews[0]))
+
+def test_update_ignores_null_dates_and_empty_batches(watermark):
+    watermark.update("1", [review(None, "날짜 없음")])
+    watermark.update("1", [])
+    assert watermark.get("1") is None
+
+def test_update_never_moves_backwards(watermark):
+    watermark.update("1", [review("2025.06.19", "최신")])
+    watermark.update("1", [review("2025.06.01", "늦게 저장된 예전 배치")])
+
+    assert watermark.get("1") == ("2025.06.19", review_hash(review("2025.06.19", "최신")))
+
+
+def test_watermark_does_not_advance_when_save_fails(monkeypatch, tmp_path):
+    pytest.importorskip("pyarrow")
+    from crawling import data_access
+
+    # 기본 인덱스 경로(상대 경로)가 임시 디렉터리에 생기도록 실행 위치 변경, 기록기 큐 없이 직접 저장
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(data_access, "send_reviews", lambda product_code, reviews: False)
+
+    def failing_write(*args, **kwargs):
+        raise OSError("disk full")
+    write_table = data_access.pq.write_table
+    monkeypatch.setattr(data_access.pq, "write_table", failing_write)
+
+    reviews = [review("2025.06.19", "새 리뷰")]
+    with pytest.raises(OSError):
+        data_access.save_reviews_to_local(reviews, "1", "job_1")
+    assert ReviewWatermark().get("1") is None
+
+    # 저장에 성공하면 그때 워터마크 갱신
+    monkeypatch.setattr(data_access.pq, "write_table", write_table)
+    data_access.save_reviews_to_local(reviews, "1", "job_1")
+    assert ReviewWatermark().get("1") == ("2025.06.19", review_hash(reviews[0]))
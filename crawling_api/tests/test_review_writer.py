@@ -0,0 +1,87 @@
+import os
+import queue
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("pyarrow")
+review_writer = pytest.importorskip("crawling.review_writer")
+
+from crawling.review_writer import JobReviewWriter, ReviewWriterError, STOP
+
+
+REVIEWS = [{"review_rating": "5", "review_date": "2025.06.19", "review_content": "좋아요"}]
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_dir(monkeypatch, tmp_path):
+    # 신선도 인덱스/워터마크 DB가 작업 디렉터리에 생성되므로 임시 디렉터리에서 실행
+    monkeypatch.chdir(tmp_path)
+
+
+def wait_until(condition, timeout: float = 5.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_idle_writer_rolls_file_by_age(tmp_path):
+    review_queue = queue.Queue()
+    writer = JobReviewWriter("job_idle", review_queue, flush_interval=0.05, max_file_seconds=0.2,
+                             base_dir=str(tmp_path / "review_data"))
+    thread = threading.Thread(target=writer.run, daemon=True)
+    thread.start()
+
+    review_queue.put(("123", REVIEWS))
+    # 이후 리뷰가 더 들어오지 않아도 max_file_seconds가 지나면 파일이 닫혀야 함
+    # 파일이 닫히면서 확정된 상품이 manifest 항목에 기록됨
+    assert wait_until(lambda: writer.files and writer.files[0]["products"])
+    entry = writer.files[0]
+    assert not writer.open_files
+    assert entry["rows"] == 1 and entry["products"] == ["123"]
+    assert os.path.exists(os.path.join(writer.dir_name, entry["path"]))
+
+    review_queue.put(STOP)
+    thread.join(5)
+    assert not thread.is_alive()
+
+
+def test_send_reviews_times_out_when_queue_is_not_drained(monkeypatch):
+    monkeypatch.setattr(review_writer, "REVIEW_PUT_TIMEOUT", 0.05)
+    full_queue = queue.Queue(maxsize=1)
+    full_queue.put(("1", REVIEWS))
+    review_writer.init_review_sink(full_queue)
+    try:
+        with pytest.raises(ReviewWriterError):
+            review_writer.send_reviews("2", REVIEWS)
+    finally:
+        review_writer.init_review_sink(None)
+
+def test_send_reviews_without_writer_returns_false():
+    assert review_writer.send_reviews("1", REVIEWS) is False
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_job_review_writer_propagates_writer_failure(monkeypatch, tmp_path):
+    def broken_run(self):
+        raise OSError("disk full")
+    monkeypatch.setattr(JobReviewWriter, "run", broken_run)
+    monkeypatch.setattr(review_writer, "REVIEW_PUT_TIMEOUT", 0.1)
+
+    with pytest.raises(ReviewWriterError):
+        with review_writer.job_review_writer("job_broken", use_process=False, base_dir=str(tmp_path / "rd")):
+            # 기록기가 죽은 뒤 큐가 가득 차면 생산자도 무한 대기하지 않고 실패
+            with pytest.raises(ReviewWriterError):
+                for i in range(review_writer.REVIEW_QUEUE_SIZE + 1):
+                    review_writer.send_reviews(str(i), REVIEWS)
+
+
+def test_flush_without_pending_products_does_not_touch_index(monkeypatch, tmp_path):
+    monkeypatch.setattr(review_writer, "record_collected", lambda *args: pytest.fail("빈 버킷에서 인덱스 기록"))
+    writer = JobReviewWriter("job_empty", queue.Queue(), hash_buckets=4, base_dir=str(tmp_path / "review_data"))
+    writer.flush_all()
+    assert writer.files == []
@@ -1,3 +1,4 @@
+import os
 import sys
 import re
 import time
@@ -5,7 +6,7 @@ import json
 import random
 import argparse
 from concurrent.futures import ProcessPoolExecutor, as_completed
-from multiprocessing import cpu_count, freeze_support
+from multiprocessing import cpu_count, freeze_support, Manager
 
 import undetected_chromedriver as uc
 import selenium
@@ -16,6 +17,12 @@ from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 from selenium.common.exceptions import TimeoutException
 from fake_useragent import UserAgent
 
+# crawling 패키지(from crawling...)를 import 할 수 있도록 crawling_api 경로 추가 (crawling_api 안의 모듈과 같은 경로 사용)
+CRAWLING_API_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "crawling_api")
+if CRAWLING_API_DIR not in sys.path:
+    sys.path.insert(0, CRAWLING_API_DIR)
+from crawling.politeness import PolitenessScheduler, init_scheduler, get_scheduler
+
 # ---------------------------------------------------------
 # Helper Functions
 # ---------------------------------------------------------
@@ -128,15 +135,25 @@ def crawl_single_product(url, proxy_ip=None, proxy_port=None):
     try:
         driver = setup_driver(proxy_ip, proxy_port)
         driver.set_page_load_timeout(30)
+        scheduler = get_scheduler()
+
+        # 홈페이지로 세션 쿠키 확보 (고정 10초 대기 대신 로드 완료까지만 대기)
+        scheduler.wait()
         driver.get('https://www.coupang.com/')
-        time.sleep(10)
+        WebDriverWait(driver, 20).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+
+        scheduler.wait()
         driver.get(url)
 
         wait = WebDriverWait(driver, 20)
 
         try:
             wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "h1.product-title")))
+            scheduler.report(True)
         except TimeoutException:
+            scheduler.report(False)
             raise Exception("Coupang blocked or page load timeout")
 
         # 데이터 수집
@@ -214,20 +231,24 @@ def run_parallel(urls, workers=None, proxy_ip=None, proxy_port=None):
     results = []
     start = time.time()
 
-    with ProcessPoolExecutor(max_workers=workers) as pool:
-        future_map = {
-            pool.submit(crawl_single_product, u, proxy_ip, proxy_port): u for u in urls
-        }
-
-        for idx, future in enumerate(as_completed(future_map)):
-            url = future_map[future]
-            try:
-                r = future.result()
-                results.append(r)
-                icon = "✅" if r["status"] == "success" else "❌"
-                print(f"[{idx+1}/{len(urls)}] {icon} {url[-30:]} ...")
-            except Exception as e:
-                print(f"[{idx+1}] 💥 System Error: {e}")
+    # 모든 워커가 공유하는 coupang.com 요청 간격 스케줄러
+    with Manager() as manager:
+        scheduler = PolitenessScheduler.create(manager)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_scheduler, initargs=(scheduler,)) as pool:
+            future_map = {
+                pool.submit(crawl_single_product, u, proxy_ip, proxy_port): u for u in urls
+            }
+
+            for idx, future in enumerate(as_completed(future_map)):
+                url = future_map[future]
+                try:
+                    r = future.result()
+                    results.append(r)
+                    icon = "✅" if r["status"] == "success" else "❌"
+                    print(f"[{idx+1}/{len(urls)}] {icon} {url[-30:]} ...")
+                except Exception as e:
+                    print(f"[{idx+1}] 💥 System Error: {e}")
 
     elapsed = time.time() - start
 
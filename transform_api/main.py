@@ -1,5 +1,6 @@
 from contextlib import asynccontextmanager
 from transform_api.transform.transform_pipeline import transform_run, add_path
+from transform_api.transform.spark_worker import SparkWorker
 from transform_api.model.transform_model import JobRequest, JobResponse
 #from spark_job.data_transform import 
 from fastapi import FastAPI, HTTPException
@@ -24,10 +25,15 @@ async def lifespan(app:FastAPI):
     #print(f"초기 is_running.value: {app.state.is_running.value}")
 
     add_path()
+
+    # JVM/GCS 커넥터 초기화 비용을 작업마다 내지 않도록 SparkSession을 유지하는 워커를 미리 실행
+    app.state.spark_worker = SparkWorker(app.state.manager, app.state.is_running).start()
     
     yield # yield 이전 코드는 fastapi시작할 때 실행됨 / 이후 코드는 종료될 때 실행
     
-    print("애플리케이션 종료: Manager 종료")
+    print("애플리케이션 종료: Spark 워커 및 Manager 종료")
+    if hasattr(app.state, 'spark_worker'):
+        app.state.spark_worker.stop()
     if hasattr(app.state, 'manager'):
         app.state.manager.shutdown()
 
@@ -50,14 +56,45 @@ def start_crawling(req: JobRequest):
         
         is_running.value = True
         print(f"[INFO] {gcs_dir} 데이터 처리 작업을 실행합니다.")
-        p = Process(target=transform_run, args=(gcs_dir, is_running))
-        p.start()
 
-        return {"status": "started", "message": f"'{gcs_dir}'에 대한 데이터 처리 작업을 시작했습니다."}
+        # 상주 Spark 워커에 작업 제출 (워커가 죽었으면 재시작, 재시작 횟수를 넘었으면 기존처럼 작업마다 프로세스 실행)
+        spark_worker = app.state.spark_worker
+        if spark_worker.ensure_alive():
+            job_id = spark_worker.submit(gcs_dir)
+        else:
+            job_id = None
+            p = Process(target=transform_run, args=(gcs_dir, is_running))
+            p.start()
+
+        return {"status": "started", "job_id": job_id,
+                "message": f"'{gcs_dir}'에 대한 데이터 처리 작업을 시작했습니다."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/health")
+def get_health():
+    """상주 Spark 워커 상태 (재시작 횟수를 넘으면 unhealthy, 503)"""
+    health = app.state.spark_worker.health()
+    if health["status"] != "ok":
+        raise HTTPException(status_code=503, detail=health)
+    return health
+
+
+@app.get("/jobs")
+def get_job_metrics():
+    """작업별 대기 시간, time-to-first-row, 전체 소요 시간 조회"""
+    return app.state.spark_worker.job_metrics()
+
+
+@app.get("/jobs/{job_id}")
+def get_job_metric(job_id: str):
+    metrics = app.state.spark_worker.job_metrics(job_id)
+    if not metrics:
+        raise HTTPException(status_code=404, detail=f"{job_id} 작업이 없습니다.")
+    return metrics
+
+
 if __name__ == "__main__":
     freeze_support()  # Windows 필수
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# transform 패키지(from transform...)와 저장소 루트(from transform_api...) 모두 import 가능하도록 경로 추가
+TRANSFORM_API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (TRANSFORM_API_DIR, os.path.dirname(TRANSFORM_API_DIR)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
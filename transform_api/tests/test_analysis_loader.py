@@ -0,0 +1,130 @@
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+pytest.importorskip("pyarrow")
+
+from transform import data_access
+from transform.data_access import AnalysisResultLoader
+
+
+def add_result(loader, product_id):
+    loader.add(product_id, 0.5, 0.25, 0.25, ["좋아요"], ["보통"], ["별로"])
+
+
+def test_add_flushes_when_flush_every_rows_buffered(monkeypatch):
+    loader = AnalysisResultLoader(flush_every=3)
+    flushed = []
+
+    def fake_flush():
+        flushed.append([row[0] for row in loader.rows])
+        loader.rows = []
+        return len(flushed[-1])
+
+    monkeypatch.setattr(loader, "flush", fake_flush)
+
+    add_result(loader, 1)
+    add_result(loader, 2)
+    assert flushed == []
+
+    add_result(loader, 3)
+    assert flushed == [[1, 2, 3]]
+
+    add_result(loader, 4)
+    assert flushed == [[1, 2, 3]]
+    assert [row[0] for row in loader.rows] == [4]
+
+
+def test_add_without_flush_every_only_buffers(monkeypatch):
+    loader = AnalysisResultLoader()
+    monkeypatch.setattr(loader, "flush", lambda: pytest.fail("flush_every 없이 중간 저장됨"))
+
+    for product_id in range(100):
+        add_result(loader, product_id)
+    assert len(loader.rows) == 100
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, *args):
+        if self.conn.fail:
+            raise psycopg2.OperationalError("server closed the connection")
+
+    def copy_expert(self, sql, buf):
+        self.conn.copied.append(buf.getvalue().count("\n"))
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.fail = False
+        self.copied = []
+        self.rollbacks = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = 1
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    opened = []
+
+    def fake_connect(**kwargs):
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    monkeypatch.setattr(data_access.psycopg2, "connect", fake_connect)
+    return opened
+
+
+def test_flushes_reuse_one_connection_until_close(connections):
+    loader = AnalysisResultLoader(flush_every=2)
+    for product_id in range(5):
+        add_result(loader, product_id)
+
+    loader.close()
+
+    assert len(connections) == 1
+    assert connections[0].copied == [2, 2, 1]
+    assert connections[0].closed
+
+
+def test_failed_final_flush_raises_and_closes_connection(connections):
+    with pytest.raises(psycopg2.OperationalError):
+        with AnalysisResultLoader() as loader:
+            add_result(loader, 1)
+            loader._connection().fail = True
+
+    assert connections[0].rollbacks == 1
+    assert connections[0].closed
+    assert [row[0] for row in loader.rows] == [1]
+
+
+def test_failed_intermediate_flush_keeps_rows_for_retry(connections):
+    loader = AnalysisResultLoader(flush_every=1)
+    loader._connection().fail = True
+    add_result(loader, 1)
+    assert [row[0] for row in loader.rows] == [1]
+
+    connections[0].fail = False
+    add_result(loader, 2)
+    loader.close()
+
+    assert connections[0].copied == [2]
+    assert loader.rows == []
@@ -0,0 +1,116 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from transform import analyze_client
+from transform.analyze_client import analyze_products
+
+
+URL = "http://analyze.local/analyze"
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    # 재시도 대기 시간 제거 (full jitter의 무작위 값을 0으로)
+    monkeypatch.setattr(analyze_client.random, "uniform", lambda a, b: 0)
+
+
+class FakeAnalyzeServer:
+    """상품별 지연/장애를 지정할 수 있는 /analyze 응답기 (동시 처리 중인 요청 수 기록)"""
+
+    def __init__(self, latency: float = 0.02, latencies: dict = None, failures: dict = None):
+        self.latency = latency
+        self.latencies = latencies or {}
+        # product_code -> 앞에서부터 차례로 낼 장애 ("503" 또는 "timeout")
+        self.failures = {code: list(errors) for code, errors in (failures or {}).items()}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.attempts = {}
+        self.timeouts = []
+        self.finished_at = {}
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        code = payload["product_code"]
+        self.attempts[code] = self.attempts.get(code, 0) + 1
+        self.timeouts.append(request.extensions["timeout"])
+
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latencies.get(code, self.latency))
+            errors = self.failures.get(code)
+            if errors:
+                error = errors.pop(0)
+                if error == "timeout":
+                    raise httpx.ReadTimeout("analyze timed out", request=request)
+                return httpx.Response(int(error), json={"error": "overloaded"})
+            self.finished_at[code] = time.perf_counter()
+            return httpx.Response(200, json=[{"summary": r, "sentiment": "긍정"} for r in payload["reviews"]])
+        finally:
+            self.in_flight -= 1
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handler)
+
+
+def run(products: dict, server: FakeAnalyzeServer, **kwargs):
+    received = []
+
+    def on_result(product_code, result):
+        received.append((product_code, result, time.perf_counter()))
+
+    stats = asyncio.run(analyze_products(products, on_result, url=URL, transport=server.transport(), **kwargs))
+    return stats, received
+
+
+def test_peak_in_flight_requests_equal_concurrency():
+    server = FakeAnalyzeServer()
+    products = {code: [f"리뷰 {code}"] for code in range(12)}
+
+    stats, received = run(products, server, concurrency=3)
+
+    assert stats == {"success": 12, "failed": 0}
+    assert server.peak_in_flight == 3
+    assert sorted(code for code, _, _ in received) == list(range(12))
+
+def test_retries_5xx_and_timeouts():
+    server = FakeAnalyzeServer(failures={1: ["503", "502"], 2: ["timeout"], 3: ["503"] * 10})
+    products = {code: ["리뷰"] for code in (1, 2, 3, 4)}
+
+    stats, received = run(products, server, concurrency=2)
+
+    assert stats == {"success": 3, "failed": 1}
+    assert server.attempts == {1: 3, 2: 2, 3: analyze_client.ANALYZE_MAX_RETRIES + 1, 4: 1}
+    assert sorted(code for code, _, _ in received) == [1, 2, 4]
+
+def test_client_error_is_not_retried():
+    server = FakeAnalyzeServer(failures={1: ["400"]})
+
+    stats, received = run({1: ["리뷰"]}, server, concurrency=1)
+
+    assert stats == {"success": 0, "failed": 1}
+    assert server.attempts == {1: 1}
+
+def test_each_request_uses_the_configured_timeout():
+    server = FakeAnalyzeServer()
+
+    run({code: ["리뷰"] for code in range(3)}, server, concurrency=2, timeout=7.5)
+
+    assert server.timeouts == [{"connect": 7.5, "read": 7.5, "write": 7.5, "pool": 7.5}] * 3
+
+def test_results_reach_on_result_as_they_arrive():
+    # 0번 상품만 오래 걸림 → 나머지 결과는 0번 응답을 기다리지 않고 먼저 처리
+    server = FakeAnalyzeServer(latency=0.01, latencies={0: 0.3})
+    products = {code: [f"리뷰 {code}"] for code in range(4)}
+
+    stats, received = run(products, server, concurrency=4)
+
+    assert stats["success"] == 4
+    assert [code for code, _, _ in received][-1] == 0
+    assert all(at < server.finished_at[0] for code, _, at in received if code != 0)
+    assert received[0][1] == [{"summary": f"리뷰 {received[0][0]}", "sentiment": "긍정"}]
@@ -0,0 +1,61 @@
+import datetime
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+transform_job = pytest.importorskip("transform.transform_job")
+
+D = datetime.date
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=["product_code", "review_writer", "review_date", "review_content"])
+
+
+def test_keeps_latest_review_per_writer():
+    pdf = frame([
+        (1, "w1", D(2025, 6, 1), "예전 리뷰"),
+        (1, "w1", D(2025, 6, 10), "최근 리뷰"),
+        (1, "w2", D(2025, 6, 5), "다른 작성자"),
+    ])
+    result = transform_job.dedup_top_n(pdf, top_n=10)
+    assert result["review_content"].tolist() == ["최근 리뷰", "다른 작성자"]
+
+def test_same_date_ties_break_by_content():
+    pdf = frame([
+        (1, "w1", D(2025, 6, 10), "b"),
+        (1, "w1", D(2025, 6, 10), "a"),
+        (1, "w2", D(2025, 6, 10), "d"),
+        (1, "w3", D(2025, 6, 10), "c"),
+    ])
+    result = transform_job.dedup_top_n(pdf, top_n=2)
+    # 작성자별로 같은 날짜면 본문 오름차순 첫 리뷰, 상품 top N도 같은 기준
+    assert result["review_content"].tolist() == ["a", "c"]
+
+def test_duplicate_rows_are_returned_once():
+    row = (1, "w1", D(2025, 6, 10), "같은 리뷰")
+    pdf = frame([row, row, row, (1, "w2", D(2025, 6, 9), "다른 리뷰")])
+    result = transform_job.dedup_top_n(pdf, top_n=10)
+    assert result["review_content"].tolist() == ["같은 리뷰", "다른 리뷰"]
+
+def test_null_dates_sort_last_and_top_n_limits_rows():
+    pdf = frame([
+        (1, "w1", None, "날짜 없음"),
+        (1, "w2", D(2025, 6, 1), "오래된 리뷰"),
+        (1, "w3", D(2025, 6, 10), "최신 리뷰"),
+    ])
+    assert transform_job.dedup_top_n(pdf, top_n=3)["review_content"].tolist() == ["최신 리뷰", "오래된 리뷰", "날짜 없음"]
+    assert transform_job.dedup_top_n(pdf, top_n=1)["review_content"].tolist() == ["최신 리뷰"]
+
+def test_null_content_sorts_last_within_same_date():
+    # Spark Window(asc_nulls_last) / DuckDB(ASC NULLS LAST)와 같은 순서
+    pdf = frame([
+        (1, "w1", D(2025, 6, 10), None),
+        (1, "w1", D(2025, 6, 10), "b"),
+        (1, "w2", D(2025, 6, 10), None),
+        (1, "w3", D(2025, 6, 10), "a"),
+    ])
+    result = transform_job.dedup_top_n(pdf, top_n=10)
+    assert result["review_writer"].tolist() == ["w3", "w1", "w2"]
+    assert result["review_content"].tolist()[:2] == ["a", "b"]
+    assert result["review_content"].isna().tolist() == [False, False, True]
@@ -0,0 +1,77 @@
+import datetime
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+duckdb_engine = pytest.importorskip("transform.duckdb_engine")
+
+if not duckdb_engine.DUCKDB_AVAILABLE:
+    pytest.skip("duckdb가 설치되어 있지 않음", allow_module_level=True)
+
+TOP_N = 2
+SCHEMA = pa.schema([
+    ("product_code", pa.int64()),
+    ("review_rating", pa.int8()),
+    ("review_writer", pa.string()),
+    ("review_date", pa.date32()),
+    ("review_content", pa.string()),
+])
+D = datetime.date
+
+# (상품, 평점, 작성자, 날짜, 본문) - 같은 날짜 동점, 같은 작성자 중복, 체험단 리뷰, 날짜 없음 포함
+ROWS = [
+    (1, 5, "w1", D(2025, 6, 10), "b 좋아요!!"),
+    (1, 4, "w1", D(2025, 6, 10), "a 배송 빨라요 ㅋㅋㅋ"),
+    (1, 3, "w1", D(2025, 6, 1), "old"),
+    (1, 5, "w2", D(2025, 6, 12), "쿠팡체험단 이벤트로 제공받은 후기"),
+    (1, 2, "w2", D(2025, 6, 5), "x"),
+    (1, 1, "w3", None, "날짜 없음"),
+    (1, 4, "w4", D(2025, 6, 10), "c 그저 그래요"),
+    (2, 5, "w1", D(2025, 6, 1), "p2 만족"),
+    (2, 5, "w1", D(2025, 5, 1), "p2 예전 리뷰"),
+]
+
+
+@pytest.fixture
+def review_parquet(tmp_path):
+    table = pa.Table.from_pylist([dict(zip(SCHEMA.names, row)) for row in ROWS], schema=SCHEMA)
+    pq.write_table(table, tmp_path / "part-0.parquet")
+    return str(tmp_path)
+
+
+def test_duckdb_dedup_and_top_n(review_parquet):
+    table = pq.read_table(review_parquet)
+    df = duckdb_engine.trans_data_duckdb(table, top_n=TOP_N)
+
+    picked = sorted(zip(df["product_code"].tolist(), df["review_content"].tolist()))
+    assert picked == [(1, "a 배송 빨라요 ㅋㅋㅋ"), (1, "c 그저 그래요"), (2, "p2 만족")]
+    assert df.loc[df["review_content"] == "a 배송 빨라요 ㅋㅋㅋ", "cleaned_review"].item() == "a배송빨라요"
+
+
+@pytest.fixture(scope="module")
+def spark():
+    pytest.importorskip("pyspark")
+    transform_job = pytest.importorskip("transform.transform_job")
+    try:
+        session = transform_job.SparkSession.builder.master("local[1]").appName("Engine Parity Test") \
+            .config("spark.sql.shuffle.partitions", "2").getOrCreate()
+    except Exception as e:
+        pytest.skip(f"SparkSession을 만들 수 없음: {e}")
+    yield session
+    session.stop()
+
+
+@pytest.mark.parametrize("dedup_mode", ["fused", "window"])
+def test_spark_and_duckdb_produce_same_rows(spark, review_parquet, dedup_mode):
+    from transform.transform_job import trans_data
+    from transform.parity import normalize_for_compare
+
+    spark_df = trans_data(spark.read.parquet(review_parquet), dedup_mode=dedup_mode, top_n=TOP_N).toPandas()
+    duckdb_df = duckdb_engine.trans_data_duckdb(pq.read_table(review_parquet), top_n=TOP_N)
+
+    columns = sorted(spark_df.columns)
+    assert columns == sorted(duckdb_df.columns)
+    pd.testing.assert_frame_equal(normalize_for_compare(spark_df, columns),
+                                  normalize_for_compare(duckdb_df, columns), check_dtype=False)
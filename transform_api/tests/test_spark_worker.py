@@ -0,0 +1,83 @@
+import queue
+from types import SimpleNamespace
+
+import pytest
+
+spark_worker = pytest.importorskip("transform_api.transform.spark_worker")
+
+from transform_api.transform.spark_worker import SparkWorker, spark_worker_loop
+
+
+class FakeManager:
+    def dict(self):
+        return {}
+
+
+class DeadProcess:
+    exitcode = 1
+
+    def is_alive(self):
+        return False
+
+
+def queued_jobs(*job_ids) -> queue.Queue:
+    jobs = queue.Queue()
+    for job_id in job_ids:
+        jobs.put((job_id, f"gs://bucket/{job_id}", 0.0))
+    return jobs
+
+
+def test_session_startup_failure_fails_pending_jobs(monkeypatch):
+    def broken_session():
+        raise RuntimeError("JVM 시작 실패")
+
+    monkeypatch.setattr(spark_worker, "create_spark_session", broken_session)
+    jobs, metrics = queued_jobs("job_1", "job_2"), {}
+    is_running = SimpleNamespace(value=True)
+
+    spark_worker_loop(jobs, metrics, is_running)
+
+    assert is_running.value is False
+    assert {job_id: job["status"] for job_id, job in metrics.items()} == {"job_1": "failed", "job_2": "failed"}
+    assert "JVM 시작 실패" in metrics["job_1"]["error"]
+    assert jobs.empty()
+
+def test_warm_up_failure_is_handled_like_startup_failure(monkeypatch):
+    class BrokenSession:
+        def range(self, n):
+            raise RuntimeError("executor 없음")
+
+    monkeypatch.setattr(spark_worker, "create_spark_session", BrokenSession)
+    metrics, is_running = {}, SimpleNamespace(value=True)
+
+    spark_worker_loop(queued_jobs("job_1"), metrics, is_running)
+
+    assert is_running.value is False
+    assert metrics["job_1"]["status"] == "failed"
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    worker = SparkWorker(FakeManager(), SimpleNamespace(value=False), max_restarts=1)
+    worker.jobs = queue.Queue()
+    worker.process = DeadProcess()
+    starts = []
+    monkeypatch.setattr(worker, "start", lambda: starts.append(1) or worker)
+    worker.starts = starts
+    return worker
+
+def test_dead_worker_is_restarted_and_stale_jobs_fail(worker):
+    job_id = worker.submit("gs://bucket/a")
+
+    assert worker.ensure_alive() is True
+    assert worker.starts == [1]
+    assert worker.job_metrics(job_id)["status"] == "failed"
+    # 재시작한 워커도 죽어 있는 상태 (가짜 start) → 재시작 횟수를 다 썼으므로 unhealthy
+    assert worker.health()["status"] == "unhealthy"
+
+def test_worker_reports_unhealthy_after_max_restarts(worker):
+    worker.restarts = worker.max_restarts
+
+    assert worker.ensure_alive() is False
+    assert worker.starts == []
+    assert worker.health() == {"status": "unhealthy", "alive": False, "restarts": 1, "max_restarts": 1}
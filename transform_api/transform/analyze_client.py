@@ -0,0 +1,100 @@
+import os
+import time
+import random
+import asyncio
+import httpx
+
+# 분석 서버 요청 설정 (환경 변수로 조정 가능, 로컬 테스트 시 ANALYZE_URL을 스텁 서버로 지정)
+ANALYZE_URL = os.environ.get("ANALYZE_URL", "http://10.128.0.180:3245/analyze")
+ANALYZE_CONCURRENCY = int(os.environ.get("ANALYZE_CONCURRENCY", 4))
+ANALYZE_TIMEOUT = float(os.environ.get("ANALYZE_TIMEOUT", 120))
+ANALYZE_MAX_RETRIES = int(os.environ.get("ANALYZE_MAX_RETRIES", 3))
+ANALYZE_BACKOFF = float(os.environ.get("ANALYZE_BACKOFF", 1.0))
+
+# 다시 요청할 만한 응답 코드 (서버 과부하/일시 장애)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class AnalyzeError(Exception):
+    """재시도 후에도 분석 결과를 받지 못한 경우"""
+
+
+async def analyze_product(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, product_code, reviews: list,
+                          url: str = ANALYZE_URL, max_retries: int = ANALYZE_MAX_RETRIES,
+                          backoff: float = ANALYZE_BACKOFF):
+    """
+    상품 하나의 리뷰 분석 요청 (동시 요청 수는 semaphore로 제한)
+    - 연결 오류/시간 초과/일시 장애 응답은 지수 백오프 + 지터로 재시도
+    - 반환: 분석 결과 JSON
+    """
+    payload = {"product_code": product_code, "reviews": reviews}
+    for attempt in range(max_retries + 1):
+        async with semaphore:
+            try:
+                response = await client.post(url, json=payload)
+                if response.status_code not in RETRY_STATUS:
+                    response.raise_for_status()
+                    return response.json()
+                error = f"HTTP {response.status_code}"
+            except (httpx.TransportError, httpx.TimeoutException) as e:
+                error = repr(e)
+
+        if attempt < max_retries:
+            # 여러 요청이 동시에 다시 몰리지 않도록 대기 시간을 무작위로 분산 (full jitter)
+            delay = random.uniform(0, backoff * 2 ** attempt)
+            print(f"[INFO] {product_code} 분석 요청 재시도 {attempt + 1}/{max_retries} ({error}, {delay:.1f}초 후)")
+            await asyncio.sleep(delay)
+
+    raise AnalyzeError(f"{product_code} 분석 요청 실패: {error}")
+
+async def analyze_products(products: dict, on_result, url: str = ANALYZE_URL,
+                           concurrency: int = ANALYZE_CONCURRENCY, timeout: float = ANALYZE_TIMEOUT,
+                           transport: httpx.AsyncBaseTransport = None) -> dict:
+    """
+    여러 상품을 커넥션 풀 하나로 동시에 분석 요청하고, 결과가 도착하는 순서대로 on_result(product_code, result) 호출
+    - on_result는 별도 스레드에서 한 번에 하나씩 실행
+    - products: {product_code: 리뷰 리스트}
+    - concurrency: 분석 서버가 동시에 처리할 수 있는 요청 수에 맞춤
+    - transport: 테스트에서 httpx.MockTransport 등으로 교체
+    """
+    stats = {"success": 0, "failed": 0}
+    start = time.time()
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(timeout), transport=transport) as client:
+        async def run(product_code, reviews):
+            try:
+                return product_code, await analyze_product(client, semaphore, product_code, reviews, url), None
+            except Exception as e:
+                return product_code, None, e
+
+        tasks = [asyncio.create_task(run(code, reviews)) for code, reviews in products.items()]
+        for task in asyncio.as_completed(tasks):
+            product_code, result, error = await task
+            if error is not None:
+                stats["failed"] += 1
+                print(f"[ERROR] 분석 요청 실패: {error}")
+                continue
+            print(f'[INFO] {product_code} 데이터 분석 결과를 받았습니다.')
+            try:
+                # on_result의 DB 저장(psycopg2)은 블로킹이므로 스레드에서 실행해 진행 중인 요청을 막지 않음
+                await asyncio.to_thread(on_result, product_code, result)
+                stats["success"] += 1
+            except Exception as e:
+                stats["failed"] += 1
+                print(f"[ERROR] {product_code} 분석 결과 처리 실패: {e}")
+
+    print(f"[INFO] 분석 요청 완료 - 성공: {stats['success']}, 실패: {stats['failed']}, "
+          f"소요시간: {time.time() - start:.1f}초")
+    return stats
+
+
+if __name__ == "__main__":
+    # 스텁 서버(transform.analyze_stub)로 동시 요청/재시도 동작 확인
+    # 사용 예: python -m transform.analyze_client [상품 수] [상품당 리뷰 수]
+    import sys
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    per_product = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    sample = {code: [f"리뷰 {code}-{i}" for i in range(per_product)] for code in range(count)}
+    asyncio.run(analyze_products(sample, lambda product_code, result: None))
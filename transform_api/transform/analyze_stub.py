@@ -0,0 +1,44 @@
+import os
+import random
+import asyncio
+import argparse
+import uvicorn
+from fastapi import FastAPI, Response
+
+# 로컬 테스트용 /analyze 스텁 서버 (분석 서버 대신 지연 시간만 흉내 냄)
+# 사용 예: python -m transform.analyze_stub --port 3245 --latency 2.0 --error-rate 0.1
+#         ANALYZE_URL=http://127.0.0.1:3245/analyze 로 변환 작업 실행
+STUB_LATENCY = float(os.environ.get("ANALYZE_STUB_LATENCY", 1.0))
+STUB_ERROR_RATE = float(os.environ.get("ANALYZE_STUB_ERROR_RATE", 0.0))
+SENTIMENTS = ["긍정", "중립", "부정"]
+
+app = FastAPI()
+app.state.latency = STUB_LATENCY
+app.state.error_rate = STUB_ERROR_RATE
+
+
+@app.post("/analyze")
+async def analyze(payload: dict, response: Response):
+    # 분석 시간 흉내 (±20% 변동)
+    await asyncio.sleep(app.state.latency * random.uniform(0.8, 1.2))
+    # 재시도 동작 확인용 일시 장애
+    if random.random() < app.state.error_rate:
+        response.status_code = 503
+        return {"error": "stub overloaded"}
+    return [
+        {"summary": (review or "")[:30], "sentiment": random.choice(SENTIMENTS)}
+        for review in payload.get("reviews", [])
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3245)
+    parser.add_argument("--latency", type=float, default=STUB_LATENCY)
+    parser.add_argument("--error-rate", type=float, default=STUB_ERROR_RATE)
+    args = parser.parse_args()
+
+    app.state.latency = args.latency
+    app.state.error_rate = args.error_rate
+    uvicorn.run(app, host=args.host, port=args.port)
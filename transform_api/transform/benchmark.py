@@ -0,0 +1,120 @@
+import sys
+import time
+import random
+import tempfile
+import requests
+from pyspark.sql import SparkSession
+from pyspark.sql.functions import col, udf, sum as spark_sum, hash as spark_hash, expr
+from pyspark.sql.types import StringType
+from transform.normalize import clean_text, clean_text_column, clean_text_pandas_udf
+from transform.transform_job import trans_data
+
+SAMPLE_TEXTS = [
+    "배송이 빨라요!! 최고입니다 ㅋㅋㅋㅋ",
+    "가격 대비 괜찮아요~ 재구매 의사 있음 :)",
+    "흡입력 good, 소음은 조금 있음 ㅎㅎ",
+    "쿠팡체험단 이벤트로 제공받아 작성한 후기입니다.",
+    "   생각보다   작아요... 그래도 만족  ",
+    "Battery lasts 2 hours — 충전 3시간",
+    None,
+]
+
+
+def create_benchmark_session() -> SparkSession:
+    return SparkSession.builder \
+        .appName("Normalize Benchmark") \
+        .master("local[*]") \
+        .config("spark.sql.execution.arrow.pyspark.enabled", "true") \
+        .getOrCreate()
+
+def make_reviews(spark: SparkSession, rows: int):
+    random.seed(0)
+    data = [(random.choice(SAMPLE_TEXTS),) for _ in range(min(rows, 100000))]
+    base = spark.createDataFrame(data, "review_content string")
+    # 큰 데이터는 기본 샘플을 반복해서 생성
+    repeat = max(1, rows // len(data))
+    return base.crossJoin(spark.range(repeat).withColumnRenamed("id", "copy")).drop("copy").cache()
+
+# 전체 행을 계산하도록 결과 해시 합계를 구함 (출력 비교에도 사용)
+def run(df, column) -> tuple:
+    start = time.perf_counter()
+    checksum = df.select(spark_sum(spark_hash(column)).alias("h")).collect()[0]["h"]
+    return time.perf_counter() - start, checksum
+
+def benchmark_normalize(sizes=(100_000, 1_000_000, 10_000_000)) -> None:
+    """텍스트 정규화: Python UDF vs Spark regexp_replace vs pandas_udf (결과 일치 여부 포함)"""
+    spark = create_benchmark_session()
+    clean_text_udf = udf(clean_text, StringType())
+    try:
+        for size in sizes:
+            df = make_reviews(spark, size)
+            rows = df.count()
+            results = {
+                "udf": run(df, clean_text_udf(col("review_content"))),
+                "native": run(df, clean_text_column(col("review_content"))),
+                "pandas_udf": run(df, clean_text_pandas_udf(col("review_content"))),
+            }
+            same = len({checksum for _, checksum in results.values()}) == 1
+            print(f"[INFO] {rows}행 - " + ", ".join(f"{name}: {sec:.2f}초" for name, (sec, _) in results.items())
+                  + f", 결과 일치: {same}")
+            df.unpersist()
+    finally:
+        spark.stop()
+
+
+# Spark UI REST API로 job group에 속한 stage들의 셔플 바이트와 실행 시간 합계 조회
+def stage_metrics(spark: SparkSession, job_group: str) -> dict:
+    base = f"{spark.sparkContext.uiWebUrl}/api/v1/applications/{spark.sparkContext.applicationId}"
+    jobs = [job for job in requests.get(f"{base}/jobs", timeout=10).json() if job.get("jobGroup") == job_group]
+    stage_ids = {stage_id for job in jobs for stage_id in job["stageIds"]}
+    stages = [stage for stage in requests.get(f"{base}/stages", timeout=10).json()
+              if stage["stageId"] in stage_ids and stage["status"] == "COMPLETE"]
+    return {
+        "stages": len(stages),
+        "shuffle_write_mb": sum(stage["shuffleWriteBytes"] for stage in stages) / 1024 / 1024,
+        "executor_run_sec": sum(stage["executorRunTime"] for stage in stages) / 1000,
+    }
+
+def make_review_parquet(spark: SparkSession, rows: int, products: int, path: str) -> None:
+    """상품/작성자/날짜/본문을 가진 합성 리뷰 parquet 생성 (체험단 리뷰와 중복 작성자 포함)"""
+    spark.range(rows).select(
+        (col("id") % products).alias("product_code"),
+        expr("cast(id % 5 as string)").alias("review_rating"),
+        expr("concat('writer_', cast(id % 997 as string))").alias("review_writer"),
+        expr("date_sub(date'2025-06-19', cast(id % 365 as int))").alias("review_date"),
+        expr("case when id % 10 = 0 then concat('쿠팡체험단 후기 ', id) else concat('리뷰 내용 ', id) end")
+            .alias("review_content"),
+    ).write.mode("overwrite").parquet(path)
+
+def benchmark_dedup_top_n(sizes=(1_000_000, 10_000_000), products: int = 1000) -> None:
+    """중복 제거 + 상품별 top N: Window 2회 vs 상품별 단일 셔플(applyInPandas)"""
+    spark = create_benchmark_session()
+    try:
+        for size in sizes:
+            path = tempfile.mkdtemp(prefix="review_bench_")
+            make_review_parquet(spark, size, products, path)
+            df = spark.read.parquet(path)
+
+            plan = trans_data(df)._jdf.queryExecution().executedPlan().toString()
+            print(f"[INFO] 제외 필터 parquet push down 여부: {'StringStartsWith' in plan}")
+
+            for mode in ("window", "fused"):
+                group = f"dedup_{mode}_{size}"
+                spark.sparkContext.setJobGroup(group, group)
+                start = time.perf_counter()
+                trans_data(df, dedup_mode=mode).write.format("noop").mode("overwrite").save()
+                elapsed = time.perf_counter() - start
+                metrics = stage_metrics(spark, group)
+                print(f"[INFO] {size}행 {mode}: {elapsed:.2f}초, stage {metrics['stages']}개, "
+                      f"셔플 {metrics['shuffle_write_mb']:.1f}MB, executor 실행 {metrics['executor_run_sec']:.1f}초")
+    finally:
+        spark.stop()
+
+
+if __name__ == "__main__":
+    # 사용 예: python -m transform.benchmark [행 수 ...]
+    #         python -m transform.benchmark dedup [행 수 ...]
+    if sys.argv[1:2] == ["dedup"]:
+        benchmark_dedup_top_n(tuple(map(int, sys.argv[2:])) or (1_000_000, 10_000_000))
+    else:
+        benchmark_normalize(tuple(map(int, sys.argv[1:])) or (100_000, 1_000_000, 10_000_000))
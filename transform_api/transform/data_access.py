@@ -1,5 +1,42 @@
 import psycopg2
 import json
+import pyarrow.dataset as ds
+from pyarrow import fs
+import csv
+import io
+import time
+
+# 분석 결과 DB 접속 정보
+DB_CONFIG = {
+    "host": "127.0.0.1",
+    "dbname": "postgres",
+    "user": "postgres",
+    "password": "todn12",
+    "port": 2345
+}
+
+ANALYSIS_COLUMNS = (
+    "product_id",
+    "positive_ratio",
+    "neutral_ratio",
+    "negative_ratio",
+    "sentiment_positive",
+    "sentiment_neutral",
+    "sentiment_negative"
+)
+
+GCS_BUCKET = 'kosa-semi-datalake'
+
+# 작업 디렉터리의 parquet 파일 목록과 전체 크기 (엔진 선택용)
+def list_gcs_parquet(dir):
+    gcs = fs.GcsFileSystem()
+    infos = gcs.get_file_info(fs.FileSelector(f"{GCS_BUCKET}/{dir}"))
+    files = [info for info in infos if info.path.endswith(".parquet")]
+    return [info.path for info in files], sum(info.size for info in files)
+
+# Spark 없이 Arrow 테이블로 읽기 (단일 노드 엔진용)
+def load_arrow_from_gcs(paths):
+    return ds.dataset(paths, filesystem=fs.GcsFileSystem(), format="parquet").to_table()
 
 def load_data_from_gcs(spark, dir):
     # GCS 경로 지정
@@ -67,3 +104,100 @@ def save_analysis_to_postgresql(
             conn.close()
 
 
+
+
+
+class AnalysisResultLoader:
+    """
+    작업 하나의 분석 결과를 모아 한 트랜잭션으로 저장
+    - 임시 staging 테이블에 COPY로 적재한 뒤 analysis_result에 upsert (같은 product_id는 갱신)
+    - 작업당 커넥션 하나만 사용 (첫 저장 때 열어 재사용하고 close()에서 닫음)
+    - flush_every를 지정하면 그만큼 쌓일 때마다 중간 저장 (결과가 도착하는 대로 반영)
+    - 저장에 실패한 행은 버리지 않고 남겨 다음 저장 때 다시 시도, 마지막 저장(close)까지 실패하면 예외 발생
+    """
+
+    def __init__(self, db_config: dict = None, flush_every: int = None):
+        self.db_config = db_config or DB_CONFIG
+        self.flush_every = flush_every
+        self.rows = []
+        self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _connection(self):
+        if self.conn is None or self.conn.closed:
+            self.conn = psycopg2.connect(**self.db_config)
+        return self.conn
+
+    def close(self) -> None:
+        """남은 결과를 저장하고 커넥션 종료 (저장 실패 시 예외를 그대로 전달)"""
+        try:
+            self.flush()
+        finally:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+    def add(self, product_id: int, positive_ratio: float, neutral_ratio: float, negative_ratio: float,
+            sentiment_positive: list, sentiment_neutral: list, sentiment_negative: list) -> None:
+        self.rows.append((
+            product_id,
+            positive_ratio,
+            neutral_ratio,
+            negative_ratio,
+            json.dumps(sentiment_positive, ensure_ascii=False),
+            json.dumps(sentiment_neutral, ensure_ascii=False),
+            json.dumps(sentiment_negative, ensure_ascii=False)
+        ))
+        if self.flush_every and len(self.rows) >= self.flush_every:
+            try:
+                self.flush()
+            except psycopg2.Error:
+                # 중간 저장 실패는 행을 남겨 두고 다음 저장(마지막 close 포함)에서 다시 시도
+                pass
+
+    def flush(self) -> int:
+        if not self.rows:
+            return 0
+
+        # 같은 상품이 여러 번 들어오면 마지막 결과만 사용
+        rows = list({row[0]: row for row in self.rows}.values())
+        buf = io.StringIO()
+        csv.writer(buf).writerows(rows)
+        buf.seek(0)
+
+        columns = ", ".join(ANALYSIS_COLUMNS)
+        updates = ", ".join(f"{c} = s.{c}" for c in ANALYSIS_COLUMNS[1:])
+        start = time.time()
+        conn = self._connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    CREATE TEMP TABLE analysis_result_staging
+                    (LIKE analysis_result INCLUDING DEFAULTS) ON COMMIT DROP
+                """)
+                cursor.copy_expert(f"COPY analysis_result_staging ({columns}) FROM STDIN WITH (FORMAT csv)", buf)
+                # product_id 고유 제약이 없어도 동작하도록 UPDATE 후 없는 상품만 INSERT
+                cursor.execute(f"""
+                    UPDATE analysis_result a SET {updates}
+                    FROM analysis_result_staging s
+                    WHERE a.product_id = s.product_id
+                """)
+                cursor.execute(f"""
+                    INSERT INTO analysis_result ({columns})
+                    SELECT {columns} FROM analysis_result_staging s
+                    WHERE NOT EXISTS (SELECT 1 FROM analysis_result a WHERE a.product_id = s.product_id)
+                """)
+            conn.commit()
+            print(f"[INFO] 분석 결과 {len(rows)}개 저장 완료했습니다. ({time.time() - start:.2f}초)")
+            self.rows = []
+            return len(rows)
+        except Exception as e:
+            if not conn.closed:
+                conn.rollback()
+            print(f"[ERROR] PostgreSQL 일괄 저장 실패: {e}")
+            raise
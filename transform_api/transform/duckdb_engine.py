@@ -0,0 +1,56 @@
+import os
+import pandas as pd
+import pyarrow as pa
+from transform.text_rules import clean_text_series
+
+# DuckDB가 설치된 경우에만 단일 노드 엔진 사용
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
+# 입력 크기가 이 값 이하면 Spark 대신 DuckDB로 처리 (환경 변수로 조정 가능)
+SINGLE_NODE_MAX_BYTES = int(os.environ.get("SINGLE_NODE_MAX_BYTES", 256 * 1024 * 1024))
+
+# trans_data와 같은 변환 단계 (제외 필터 → 작성자별 중복 제거 → 상품별 최신 N개)
+# - 같은 날짜의 리뷰는 review_content 순으로 골라 두 엔진의 결과가 같도록 함
+TRANSFORM_SQL = """
+WITH filtered AS (
+    SELECT * FROM reviews
+    WHERE NOT starts_with(review_content, $exclude_prefix)
+),
+deduped AS (
+    SELECT * FROM filtered
+    QUALIFY row_number() OVER (
+        PARTITION BY product_code, review_writer
+        ORDER BY review_date DESC NULLS LAST, review_content ASC NULLS LAST
+    ) = 1
+)
+SELECT * FROM deduped
+QUALIFY row_number() OVER (
+    PARTITION BY product_code
+    ORDER BY review_date DESC NULLS LAST, review_content ASC NULLS LAST
+) <= $top_n
+"""
+
+
+def choose_engine(total_bytes: int) -> str:
+    """입력 크기로 변환 엔진 선택: duckdb / spark"""
+    if DUCKDB_AVAILABLE and total_bytes <= SINGLE_NODE_MAX_BYTES:
+        return "duckdb"
+    return "spark"
+
+def trans_data_duckdb(reviews: pa.Table, top_n: int = 10, exclude_prefix: str = "쿠팡체험단") -> pd.DataFrame:
+    """Arrow 테이블을 DuckDB로 변환 (trans_data와 같은 결과의 pandas DataFrame 반환)"""
+    conn = duckdb.connect()
+    try:
+        conn.register("reviews", reviews)
+        df = conn.execute(TRANSFORM_SQL, {"exclude_prefix": exclude_prefix, "top_n": top_n}).df()
+    finally:
+        conn.close()
+    print('[INFO] 상품 별 중복 리뷰 제거 및 최신 날짜 기준 리뷰 추출을 완료했습니다. (DuckDB)')
+
+    df["cleaned_review"] = clean_text_series(df["review_content"])
+    print('[INFO] 텍스트를 전처리 했습니다..')
+    return df
@@ -0,0 +1,24 @@
+import pandas as pd
+from pyspark.sql import Column
+from pyspark.sql.functions import coalesce, lit, regexp_replace, pandas_udf
+from pyspark.sql.types import StringType
+from transform.text_rules import NORMALIZE_RULES, clean_text, clean_text_series
+
+
+# Spark 네이티브 구현 (JVM에서 처리, Python 워커로 직렬화하지 않음)
+def clean_text_column(column: Column) -> Column:
+    column = coalesce(column, lit(""))
+    for pattern, repl in NORMALIZE_RULES:
+        column = regexp_replace(column, pattern, repl)
+    return column
+
+# Arrow 기반 pandas_udf 구현 (네이티브로 표현할 수 없는 규칙이 추가될 때 사용)
+@pandas_udf(StringType())
+def clean_text_pandas_udf(texts: pd.Series) -> pd.Series:
+    return clean_text_series(texts)
+
+def normalize_column(column: Column, mode: str = "native") -> Column:
+    """mode: native (regexp_replace) / pandas (pandas_udf)"""
+    if mode == "pandas":
+        return clean_text_pandas_udf(column)
+    return clean_text_column(column)
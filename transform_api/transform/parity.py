@@ -0,0 +1,36 @@
+import sys
+import pandas as pd
+import pyarrow.dataset as ds
+from pyspark.sql import SparkSession
+from transform.transform_job import trans_data
+from transform.duckdb_engine import trans_data_duckdb
+
+SORT_COLUMNS = ["product_code", "review_date", "review_content"]
+
+
+# 엔진별 타입/행 순서 차이를 없앤 비교용 DataFrame
+def normalize_for_compare(df: pd.DataFrame, columns: list) -> pd.DataFrame:
+    df = df[columns].copy()
+    df["review_date"] = pd.to_datetime(df["review_date"])
+    df["product_code"] = df["product_code"].astype("int64")
+    return df.sort_values(SORT_COLUMNS).reset_index(drop=True)
+
+def check_engine_parity(spark: SparkSession, path: str) -> None:
+    """같은 parquet 입력에 대해 Spark(trans_data)와 DuckDB 엔진 결과가 같은지 확인 (다르면 AssertionError)"""
+    spark_df = trans_data(spark.read.parquet(path)).toPandas()
+    duckdb_df = trans_data_duckdb(ds.dataset(path, format="parquet").to_table())
+
+    columns = sorted(spark_df.columns)
+    assert columns == sorted(duckdb_df.columns), f"컬럼 불일치: {columns} / {sorted(duckdb_df.columns)}"
+    pd.testing.assert_frame_equal(normalize_for_compare(spark_df, columns),
+                                  normalize_for_compare(duckdb_df, columns), check_dtype=False)
+    print(f"[INFO] 엔진 결과 일치: {len(spark_df)}행")
+
+
+if __name__ == "__main__":
+    # 사용 예: python -m transform.parity review_data/2025-06-19/job_20250619_155501/
+    spark = SparkSession.builder.appName("Engine Parity").master("local[*]").getOrCreate()
+    try:
+        check_engine_parity(spark, sys.argv[1])
+    finally:
+        spark.stop()
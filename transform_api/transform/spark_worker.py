@@ -0,0 +1,151 @@
+import os
+import time
+import queue
+import traceback
+from datetime import datetime
+from multiprocessing import Process, Queue
+from transform_api.transform.transform_job import create_spark_session
+from transform_api.transform.transform_pipeline import run_transform
+
+# 작업 종료 신호
+STOP = None
+# 워커 프로세스가 죽었을 때 다시 시작하는 최대 횟수 (넘으면 unhealthy로 보고 작업마다 프로세스 실행)
+SPARK_WORKER_MAX_RESTARTS = int(os.environ.get("SPARK_WORKER_MAX_RESTARTS", 3))
+
+
+def generate_job_id():
+    return "transform_" + datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+
+def _record(metrics, job_id: str, **values) -> None:
+    # Manager dict의 값은 통째로 다시 넣어야 갱신됨
+    job = dict(metrics.get(job_id, {}))
+    job.update(values)
+    metrics[job_id] = job
+
+def fail_pending_jobs(jobs: Queue, metrics, error: str) -> int:
+    """큐에 남은 작업을 모두 꺼내 실패로 기록하고 실패 처리한 작업 수 반환"""
+    failed = 0
+    while True:
+        try:
+            item = jobs.get(timeout=0.1)
+        except queue.Empty:
+            return failed
+        if item is STOP:
+            continue
+        job_id = item[0]
+        _record(metrics, job_id, status="failed", error=error)
+        failed += 1
+
+def spark_worker_loop(jobs: Queue, metrics, is_running) -> None:
+    """
+    SparkSession을 한 번만 만들고 작업 큐의 변환 작업을 순서대로 실행
+    - 작업마다 job group을 지정하고 끝나면 캐시를 비움
+    - 제출부터 첫 행을 읽을 때까지 걸린 시간(time-to-first-row)을 작업별로 기록
+    """
+    print('[INFO] Spark app을 생성합니다. (워커 시작 시 한 번)')
+    try:
+        spark = create_spark_session()
+        # JVM/executor를 미리 띄워 첫 작업이 기다리지 않도록 함
+        spark.range(1).count()
+    except Exception as e:
+        # 세션을 만들지 못하면 대기 중인 작업을 실패 처리하고 종료 (부모가 재시작 또는 unhealthy로 보고)
+        traceback.print_exc()
+        failed = fail_pending_jobs(jobs, metrics, f"Spark 워커 시작 실패: {e}")
+        is_running.value = False
+        print(f'[ERROR] Spark 워커 시작 실패 - 대기 중인 작업 {failed}개 실패 처리')
+        return
+    print('[INFO] Spark 워커 준비 완료')
+
+    while True:
+        item = jobs.get()
+        if item is STOP:
+            break
+        job_id, gcs_dir, submitted_at = item
+        start = time.time()
+        _record(metrics, job_id, status="running", queued_sec=round(start - submitted_at, 3))
+
+        def on_first_row() -> None:
+            _record(metrics, job_id, time_to_first_row_sec=round(time.time() - submitted_at, 3))
+
+        spark.sparkContext.setJobGroup(job_id, f"transform {gcs_dir}")
+        try:
+            run_transform(spark, gcs_dir, on_first_row)
+            _record(metrics, job_id, status="done", total_sec=round(time.time() - submitted_at, 3))
+        except Exception as e:
+            traceback.print_exc()
+            _record(metrics, job_id, status="failed", error=str(e))
+        finally:
+            # 다음 작업에 캐시/임시 뷰가 남지 않도록 정리
+            spark.catalog.clearCache()
+            for table in spark.catalog.listTables():
+                if table.isTemporary:
+                    spark.catalog.dropTempView(table.name)
+            if jobs.empty():
+                is_running.value = False
+
+    spark.stop()
+
+
+class SparkWorker:
+    """앱과 함께 시작해 SparkSession을 유지하는 전용 변환 프로세스"""
+
+    def __init__(self, manager, is_running, max_restarts: int = SPARK_WORKER_MAX_RESTARTS):
+        self.jobs = Queue()
+        self.metrics = manager.dict()
+        self.is_running = is_running
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self.process = None
+
+    def start(self) -> "SparkWorker":
+        self.process = Process(target=spark_worker_loop, args=(self.jobs, self.metrics, self.is_running),
+                               daemon=True)
+        self.process.start()
+        return self
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    @property
+    def healthy(self) -> bool:
+        return self.is_alive() or self.restarts < self.max_restarts
+
+    def ensure_alive(self) -> bool:
+        """
+        워커가 죽었으면 남은 작업을 실패 처리하고 다시 시작
+        - 반환: 작업을 제출할 수 있으면 True (재시작 횟수를 넘었으면 False → unhealthy)
+        """
+        if self.is_alive():
+            return True
+        if self.process is None:
+            return False
+        failed = fail_pending_jobs(self.jobs, self.metrics, f"Spark 워커 종료 (exit code {self.process.exitcode})")
+        if failed:
+            print(f'[ERROR] Spark 워커가 종료되어 대기 중인 작업 {failed}개를 실패 처리했습니다.')
+        if self.restarts >= self.max_restarts:
+            print(f'[ERROR] Spark 워커 재시작 횟수 초과 ({self.max_restarts}회) - unhealthy')
+            return False
+        self.restarts += 1
+        print(f'[INFO] Spark 워커를 다시 시작합니다. ({self.restarts}/{self.max_restarts})')
+        self.start()
+        return True
+
+    def health(self) -> dict:
+        return {"status": "ok" if self.healthy else "unhealthy", "alive": self.is_alive(),
+                "restarts": self.restarts, "max_restarts": self.max_restarts}
+
+    def submit(self, gcs_dir: str) -> str:
+        job_id = generate_job_id()
+        _record(self.metrics, job_id, dir=gcs_dir, status="queued")
+        self.jobs.put((job_id, gcs_dir, time.time()))
+        return job_id
+
+    def job_metrics(self, job_id: str = None) -> dict:
+        if job_id is not None:
+            return dict(self.metrics.get(job_id, {}))
+        return {key: dict(value) for key, value in self.metrics.items()}
+
+    def stop(self, timeout: float = 30) -> None:
+        if self.is_alive():
+            self.jobs.put(STOP)
+            self.process.join(timeout)
@@ -0,0 +1,29 @@
+import re
+import pandas as pd
+
+# 리뷰 텍스트 정규화 규칙 (순서대로 적용)
+# - Python re와 Java 정규식에서 같은 의미로 해석되는 패턴만 사용
+# - Spark 없이 동작하는 DuckDB 엔진도 쓰므로 이 모듈은 pyspark를 import 하지 않음
+NORMALIZE_RULES = [
+    (r'[^A-Za-z0-9가-힣]', ''),    # 특수문자 제거
+    (r'(ㅋ|ㅎ){2,}', ''),           # ㅋㅋㅋ, ㅎㅎㅎ 제거
+    (r'\s+', ' '),                 # 다중 공백 제거
+]
+
+_COMPILED_RULES = [(re.compile(pattern), repl) for pattern, repl in NORMALIZE_RULES]
+
+
+# 기준 구현 (한 줄씩 처리)
+def clean_text(text):
+    if text is None:
+        return ""
+    for pattern, repl in _COMPILED_RULES:
+        text = pattern.sub(repl, text)
+    return text
+
+# pandas 구현 (Series 단위로 처리)
+def clean_text_series(texts: pd.Series) -> pd.Series:
+    texts = texts.fillna("").astype(str)
+    for pattern, repl in NORMALIZE_RULES:
+        texts = texts.str.replace(pattern, repl, regex=True)
+    return texts
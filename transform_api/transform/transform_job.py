@@ -2,16 +2,21 @@ from pyspark.sql import SparkSession
 from pyspark.sql.functions import col, row_number, udf
 from pyspark.sql.window import Window
 from pyspark.sql.types import StringType
-from transform.data_access import save_analysis_to_postgresql
-import requests
-import re
+from transform.data_access import save_analysis_to_postgresql, AnalysisResultLoader
+from transform.analyze_client import analyze_products
+from transform.normalize import clean_text, normalize_column
+import asyncio
 import os
 import pandas as pd
 
 os.environ["PYSPARK_PYTHON"] = "C:/Users/KOSA/env_spark/Scripts/python.exe"
 
+# 분석 결과를 이 개수만큼 받을 때마다 DB에 저장
+ANALYZE_FLUSH_EVERY = int(os.environ.get("ANALYZE_FLUSH_EVERY", 50))
 
-def after_processing( df: pd.DataFrame, product_code: int):
+
+# loader가 있으면 작업 단위 일괄 저장에 추가, 없으면 바로 저장
+def after_processing( df: pd.DataFrame, product_code: int, loader: AnalysisResultLoader = None):
 
     total = len(df)
     positive_ratio = float(round((df['sentiment'] == '긍정').sum() / total, 3))
@@ -26,8 +31,9 @@ def after_processing( df: pd.DataFrame, product_code: int):
 
     print('[INFO] 분석 결과 데이터 결과 집계를 완료했습니다.')
 
-    save_analysis_to_postgresql(
-        product_code,
+    save = loader.add if loader is not None else save_analysis_to_postgresql
+    save(
+        int(product_code),
         positive_ratio,
         neutral_ratio,
         negative_ratio,
@@ -36,14 +42,6 @@ def after_processing( df: pd.DataFrame, product_code: int):
         sentiment_negative
     )
 
-def clean_text(text):
-    if text is None:
-        return ""
-    text = re.sub('[^A-Za-z0-9가-힣]', '', text)  # 특수문자 제거
-    text = re.sub(r"(ㅋ|ㅎ){2,}", "", text)                   # ㅋㅋㅋ, ㅎㅎㅎ 제거
-    text = re.sub(r"\s+", " ", text)                         # 다중 공백 제거
-    return text
-
 def create_spark_session():
     spark = SparkSession.builder \
         .appName("Review Preprocessing") \
@@ -56,59 +54,77 @@ def create_spark_session():
     
     return spark
 
-def trans_data(df):
-    # 쿠팡체험단 리뷰 제거
+# 상품 하나의 리뷰에서 작성자별 최신 리뷰만 남기고 최신 top_n개 선택 (applyInPandas 그룹 함수)
+# - 정렬 기준은 Window 방식과 같음: review_date 내림차순(null은 마지막), 같은 날짜는 review_content 오름차순
+def dedup_top_n(pdf: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
+    # Window 경로(desc_nulls_last, asc_nulls_last)와 같은 순서: 날짜/본문 모두 null이 마지막
+    pdf = pdf.sort_values(['review_date', 'review_content'], ascending=[False, True], na_position='last')
+    return pdf.drop_duplicates(subset=['review_writer'], keep='first').head(top_n)
+
+# normalize_mode: native (Spark regexp_replace) / pandas (pandas_udf) / udf (기존 Python UDF)
+# dedup_mode: window (네이티브 Window 2회, 기본) / fused (상품별 한 번의 셔플 + applyInPandas)
+# - fused는 그룹마다 Arrow 직렬화 + Python 처리가 들어가므로 `python -m transform.benchmark dedup`으로
+#   실제 데이터에서 더 빠른 것을 확인한 경우에만 사용
+def trans_data(df, normalize_mode: str = "native", dedup_mode: str = "window", top_n: int = 10):
+    # 쿠팡체험단 리뷰 제거 (스캔 바로 위에 두어 parquet 스캔 필터로 push down 되도록 함)
     df = df.filter(~col("review_content").startswith("쿠팡체험단"))
 
-
-    # product_code별 중복 리뷰 제거
-    w_dup = Window.partitionBy('product_code', 'review_writer').orderBy(col('review_date').desc())
-    df = df.withColumn('row_num', row_number().over(w_dup)) \
-                .filter('row_num == 1') \
-                .drop('row_num')
-    print('[INFO] 상품 별 중복 리뷰를 제거했습니다.' )
-
-    # 상품 별 리뷰 10개만 가져오기 
-    w_top10 = Window.partitionBy('product_code').orderBy(col('review_date').desc())
-    df = df.withColumn('row_num', row_number().over(w_top10)) \
-                        .filter(col('row_num') <= 10) \
-                        .drop('row_num')
-    print('[INFO] 상품 별 최신 날짜 기준 리뷰 10개를 추출했습니다.' )
-
-    # 텍스트 전처리
-    clean_text_udf = udf(clean_text, StringType())
-    df = df.withColumn("cleaned_review", clean_text_udf(col("review_content")))
+    if dedup_mode == "fused":
+        # product_code로 한 번만 셔플하고 그룹마다 중복 제거 + top N을 함께 처리
+        df = df.groupBy('product_code').applyInPandas(lambda pdf: dedup_top_n(pdf, top_n), schema=df.schema)
+        print(f'[INFO] 상품 별 중복 리뷰 제거 및 최신 날짜 기준 리뷰 {top_n}개를 추출했습니다.' )
+    else:
+        # product_code별 중복 리뷰 제거
+        # 같은 날짜는 review_content 순으로 골라 결과가 실행마다(엔진마다) 같도록 함
+        # - Spark 오름차순 기본값은 null이 먼저이므로 pandas/DuckDB와 같게 null을 마지막으로 지정
+        w_dup = Window.partitionBy('product_code', 'review_writer') \
+                    .orderBy(col('review_date').desc_nulls_last(), col('review_content').asc_nulls_last())
+        df = df.withColumn('row_num', row_number().over(w_dup)) \
+                    .filter('row_num == 1') \
+                    .drop('row_num')
+        print('[INFO] 상품 별 중복 리뷰를 제거했습니다.' )
+
+        # 상품 별 리뷰 10개만 가져오기 
+        w_top10 = Window.partitionBy('product_code') \
+                    .orderBy(col('review_date').desc_nulls_last(), col('review_content').asc_nulls_last())
+        df = df.withColumn('row_num', row_number().over(w_top10)) \
+                            .filter(col('row_num') <= top_n) \
+                            .drop('row_num')
+        print(f'[INFO] 상품 별 최신 날짜 기준 리뷰 {top_n}개를 추출했습니다.' )
+
+    # 텍스트 전처리 (기본은 JVM 안에서 처리하는 네이티브 정규식)
+    if normalize_mode == "udf":
+        clean_text_udf = udf(clean_text, StringType())
+        df = df.withColumn("cleaned_review", clean_text_udf(col("review_content")))
+    else:
+        df = df.withColumn("cleaned_review", normalize_column(col("review_content"), normalize_mode))
     print('[INFO] 텍스트를 전처리 했습니다..' )
 
     return df
 
 def request_analyze(df):
-    # Pandas로 변환 후 분석 요청
-    pandas_df = df.select("product_code", "cleaned_review").toPandas()
-    product_codes = pandas_df['product_code'].unique()
-
-    results = []
-    for i,product_code in enumerate(product_codes):
-        # text = row["cleaned_review"]
-        # product_code = row["product_code"]
-        prod_df = pandas_df.loc[pandas_df['product_code']== product_code]
-        reviews = prod_df["cleaned_review"].tolist()
-        payload = {
-            "product_code": product_code,
-            "reviews": reviews
-        }
-
-        try:
-            response = requests.post('http://10.128.0.180:3245/analyze', json=payload)
-            print(f'[INFO] {product_code} 데이터 분석 결과를 받았습니다.')
-            analyze_df = pd.DataFrame(response.json())
-            after_processing(analyze_df, product_code)
-            print(f'[INFO] {product_code} 데이터 분석 결과를 저장했습니다.')
-        except Exception as e:
-            print(f"[ERROR] 분석 요청 실패: {e}")
-            results.append({
-                "product_code": product_code,
-                "summary": "",
-                "sentiment": "error"
-            })
-            
\ No newline at end of file
+    # Pandas로 변환 후 분석 요청 (DuckDB 엔진 결과는 이미 pandas)
+    if isinstance(df, pd.DataFrame):
+        pandas_df = df[["product_code", "cleaned_review"]]
+    else:
+        pandas_df = df.select("product_code", "cleaned_review").toPandas()
+
+    # 상품별 리뷰 묶음 (product_code는 JSON으로 보낼 수 있도록 파이썬 기본 타입으로 변환)
+    products = {
+        getattr(product_code, "item", lambda: product_code)(): reviews.tolist()
+        for product_code, reviews in pandas_df.groupby("product_code", sort=False)["cleaned_review"]
+    }
+
+    # 분석 결과는 도착하는 대로 집계해 ANALYZE_FLUSH_EVERY개마다 저장
+    loader = AnalysisResultLoader(flush_every=ANALYZE_FLUSH_EVERY)
+
+    def on_result(product_code, result) -> None:
+        after_processing(pd.DataFrame(result), product_code, loader)
+        print(f'[INFO] {product_code} 데이터 분석 결과를 집계했습니다.')
+
+    # 분석 서버에 커넥션 풀 하나로 ANALYZE_CONCURRENCY개씩 동시 요청
+    try:
+        asyncio.run(analyze_products(products, on_result))
+    finally:
+        # 남은 분석 결과 저장 후 커넥션 종료 (저장 실패 시 예외가 전달되어 작업이 실패로 기록됨)
+        loader.close()
@@ -1,6 +1,7 @@
 
 from transform_api.transform.transform_job import create_spark_session, trans_data, request_analyze, after_processing
-from transform.data_access import load_data_from_gcs
+from transform.data_access import load_data_from_gcs, list_gcs_parquet, load_arrow_from_gcs
+from transform.duckdb_engine import choose_engine, trans_data_duckdb
 import sys
 import os
 
@@ -11,21 +12,40 @@ def add_path():
         sys.path.append(project_root)
     os.environ["PYTHONPATH"] = project_root
 
-def transform_run(gcs_dir, is_running):
+# 변환 작업 실행 (상주 Spark 워커와 단일 프로세스 실행에서 공통 사용)
+# - engine: auto (입력 크기로 선택) / duckdb / spark
+# - spark가 None이면 Spark 엔진이 선택될 때만 SparkSession 생성
+def run_transform(spark, gcs_dir, on_first_row=None, engine="auto"):
+    paths, total_bytes = list_gcs_parquet(gcs_dir)
+    if engine == "auto":
+        engine = choose_engine(total_bytes)
+    print(f'[INFO] 입력 {len(paths)}개 파일, {total_bytes / 1024 / 1024:.1f}MB - {engine} 엔진으로 처리합니다.')
 
+    if engine == "duckdb":
+        # Cloud Storage에서 Arrow로 바로 읽어 단일 노드에서 변환
+        print('[INFO] Cloud Storage에서 데이터 불러옵니다.')
+        table = load_arrow_from_gcs(paths)
+        if on_first_row is not None:
+            on_first_row()
 
-    # Spark app 생성
-    print('[INFO] Spark app을 생성합니다.' )
-    spark = create_spark_session()
-    
-    # Cloud Storage에서 데이터 불러옴
-    print('[INFO] Cloud Storage에서 데이터 불러옵니다.')
-    df = load_data_from_gcs(spark, gcs_dir)
+        print('[INFO] 데이터 변환 작업을 진행합니다.')
+        trans_df = trans_data_duckdb(table)
+    else:
+        if spark is None:
+            print('[INFO] Spark app을 생성합니다.' )
+            spark = create_spark_session()
+
+        # Cloud Storage에서 데이터 불러옴
+        print('[INFO] Cloud Storage에서 데이터 불러옵니다.')
+        df = load_data_from_gcs(spark, gcs_dir)
+        if on_first_row is not None:
+            df.head(1)
+            on_first_row()
 
 
-    # 데이터 변환 작업 진행
-    print('[INFO] 데이터 변환 작업을 진행합니다.')
-    trans_df = trans_data(df)
+        # 데이터 변환 작업 진행
+        print('[INFO] 데이터 변환 작업을 진행합니다.')
+        trans_df = trans_data(df)
 
     
     # 분석 요청 및 저장
@@ -37,6 +57,13 @@ def transform_run(gcs_dir, is_running):
     # print('[INFO] 분석 요청을 진행합니다.')
     # after_processing(analyze_df, int(product_code))
 
+def transform_run(gcs_dir, is_running):
+
 
-    is_running.value = False
+    # Spark app은 Spark 엔진이 선택될 때만 생성 (작은 작업은 JVM 없이 DuckDB로 처리)
+    # 분석 결과 저장에 실패해도 다음 작업을 받을 수 있도록 실행 상태는 항상 해제
+    try:
+        run_transform(None, gcs_dir)
+    finally:
+        is_running.value = False
     print('[INFO] 데이터 처리 작업 완료')
\ No newline at end of file